@@ -0,0 +1 @@
+"""페이지 성능 측정 도구 (오프라인, 헤드리스)."""
@@ -0,0 +1,143 @@
+"""상호작용 한 번의 서버 시간과 websocket 전송량: 전체 재실행 vs fragment 재실행.
+
+`bench.pages` 의 시나리오로 위젯을 하나씩 바꾸고, 같은 상태를 두 가지로
+다시 실행해서 비교합니다.
+
+    full      페이지 전체 재실행 (fragment 를 쓰기 전 모든 상호작용의 동작)
+    fragment  바뀐 위젯이 든 fragment 만 재실행 (브라우저가 보내는 것과 같은
+              fragment_id 로 요청). fragment 밖 위젯이면 전체 재실행과 같음
+
+전송량은 그 실행에서 브라우저로 보내는 ForwardMsg 의 직렬화 크기 합입니다
+(websocket 프레임 헤더 제외). 새 값의 첫 계산(cold)이 어느 한쪽에만 잡히지
+않도록, 위젯을 바꾼 뒤 한 번 전체 실행해 공용 캐시를 채우고 나서 잽니다.
+
+    python -m bench.interactions
+    python -m bench.interactions --page 00 --out bench/interactions.json
+"""
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+import streamlit.testing.v1.app_test as app_test
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData, ScriptRequests
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from .pages import ROOT, SCENARIOS, TIMEOUT
+
+
+# ─────────────────────────────────────────────────────────────────
+# AppTest 실행기: fragment 지정 재실행 + 보낸 메시지 크기 누적
+# ─────────────────────────────────────────────────────────────────
+class _Runner(LocalScriptRunner):
+    fragment_id = None
+    sent = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 생성자가 넣어 둔 빈 전체 재실행 요청이 fragment 요청을 삼키지 않도록 비움
+        self._requests = ScriptRequests()
+        enqueue = self.forward_msg_queue.enqueue
+
+        def counted(msg):
+            _Runner.sent.append(msg)
+            enqueue(msg)
+        self.forward_msg_queue.enqueue = counted
+
+    def request_rerun(self, rerun_data):
+        if _Runner.fragment_id:
+            rerun_data = RerunData(
+                query_string=rerun_data.query_string,
+                widget_states=rerun_data.widget_states,
+                page_script_hash=rerun_data.page_script_hash,
+                fragment_id_queue=[_Runner.fragment_id],
+            )
+        return super().request_rerun(rerun_data)
+
+
+def _fragment_of(at) -> dict:
+    """위젯 id → 그 위젯이 든 fragment id (fragment 밖이면 없음)"""
+    out = {}
+    for msg in _Runner.sent:
+        if not msg.HasField("delta") or not msg.delta.fragment_id:
+            continue
+        element = msg.delta.new_element
+        kind = element.WhichOneof("type")
+        widget_id = getattr(getattr(element, kind), "id", None) if kind else None
+        if widget_id:
+            out[widget_id] = msg.delta.fragment_id
+    return out
+
+
+def _states(at) -> dict:
+    return {w.id: w.SerializeToString() for w in at._tree.get_widget_states().widgets}
+
+
+def _run(at, fragment_id=None) -> dict:
+    _Runner.fragment_id, _Runner.sent = fragment_id, []
+    t0 = time.perf_counter()
+    try:
+        at.run(timeout=TIMEOUT)
+    finally:
+        _Runner.fragment_id = None
+    if at.exception:
+        raise RuntimeError(f"페이지 실행 중 예외: {at.exception[0].message}")
+    return {"ms": (time.perf_counter() - t0) * 1000, "bytes": sum(m.ByteSize() for m in _Runner.sent)}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 페이지별 측정
+# ─────────────────────────────────────────────────────────────────
+def bench_page(script: str) -> dict:
+    at = app_test.AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT)
+    _run(at)
+    fragments = _fragment_of(at)
+    full, scoped = [], []
+    for action in SCENARIOS[script](at):
+        before = _states(at)
+        action(at)
+        changed = [w for w, s in _states(at).items() if before.get(w) != s]
+        target = next((fragments[w] for w in changed if w in fragments), None)
+        _run(at)
+        fragments.update(_fragment_of(at))
+        scoped.append(_run(at, target) if target else None)
+        full.append(_run(at))
+        if scoped[-1] is None:
+            scoped[-1] = full[-1]
+    return {"full": _summary(full), "fragment": _summary(scoped),
+            "in_fragment": sum(a is not b for a, b in zip(scoped, full))}
+
+
+def _summary(runs) -> dict:
+    return {
+        "runs": len(runs),
+        "p50_ms": statistics.median(r["ms"] for r in runs),
+        "mean_bytes": statistics.fmean(r["bytes"] for r in runs),
+        "max_bytes": max(r["bytes"] for r in runs),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상호작용당 서버 시간·전송량 (전체 vs fragment 재실행)")
+    parser.add_argument("--page", action="append", help="파일 이름 일부 (예: 02). 여러 번 지정 가능")
+    parser.add_argument("--out", default="bench/interactions.json", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    app_test.LocalScriptRunner = _Runner
+    results = {}
+    for script in SCENARIOS:
+        if args.page and not any(p in script for p in args.page):
+            continue
+        results[script] = res = bench_page(script)
+        full, frag = res["full"], res["fragment"]
+        print(
+            f"{script:<36} 전체 p50 {full['p50_ms']:7.1f}ms {full['mean_bytes'] / 1024:7.1f}KB"
+            f"  →  fragment p50 {frag['p50_ms']:7.1f}ms {frag['mean_bytes'] / 1024:7.1f}KB"
+            f"  ({res['in_fragment']}/{full['runs']}회 fragment 안)"
+        )
+    Path(args.out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""동시 세션 부하 테스트 (프로세스 풀).
+
+세션 하나 = 프로세스 하나가 AppTest 로 페이지를 열고 `bench.pages` 의
+상호작용 시나리오(01: 나라 바꾸기, 03: 그룹 전환, 04: 테스트 제출 …)를
+`--rounds` 번 반복합니다. 동시성 N 마다 N개 세션을 한꺼번에 돌려서
+페이지별 처리량, 재실행 지연 p50/p95/p99, 세션 프로세스 최대 RSS 를 냅니다.
+
+    python -m bench.load --concurrency 1 4 16 --rounds 3
+    python -m bench.load --page 01 --page 04 --out bench/load.json
+"""
+import argparse
+import json
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from streamlit.testing.v1 import AppTest
+
+from .pages import ROOT, SCENARIOS, TIMEOUT
+
+
+def run_session(script: str, rounds: int) -> dict:
+    """한 세션: 페이지를 열고 시나리오를 rounds 번 재생 → 재실행 지연(ms) 목록"""
+    at = AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT)
+    latencies = []
+    errors = 0
+    t0 = time.perf_counter()
+    at.run(timeout=TIMEOUT)
+    latencies.append((time.perf_counter() - t0) * 1000)
+    for _ in range(rounds):
+        for action in SCENARIOS[script](at):
+            action(at)
+            t0 = time.perf_counter()
+            at.run(timeout=TIMEOUT)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            errors += bool(at.exception)
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def load_test(script: str, concurrency: int, rounds: int) -> dict:
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=concurrency) as pool:
+        sessions = list(pool.map(run_session, [script] * concurrency, [rounds] * concurrency))
+    wall = time.perf_counter() - t0
+
+    lat = np.concatenate([s["latencies"] for s in sessions])
+    p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+    return {
+        "concurrency": concurrency,
+        "reruns": int(len(lat)),
+        "errors": sum(s["errors"] for s in sessions),
+        "wall_s": wall,
+        "throughput_rps": len(lat) / wall,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "peak_rss_mb": max(s["max_rss_kb"] for s in sessions) / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="동시 세션 부하 테스트")
+    parser.add_argument("--page", action="append", help="파일 이름 일부 (예: 01). 여러 번 지정 가능")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--rounds", type=int, default=2, help="세션마다 시나리오 반복 횟수")
+    parser.add_argument("--out", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    scripts = [s for s in SCENARIOS if not args.page or any(p in s for p in args.page)]
+    report = {}
+    print(f"{'페이지':<36}{'동시':>5}{'재실행/초':>11}{'p50':>9}{'p95':>9}{'p99':>9}{'RSS(MB)':>9}{'오류':>5}")
+    for script in scripts:
+        report[script] = []
+        for n in args.concurrency:
+            r = load_test(script, n, args.rounds)
+            report[script].append(r)
+            print(
+                f"{script:<36}{n:>5}{r['throughput_rps']:>11.1f}{r['p50_ms']:>9.1f}"
+                f"{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}{r['peak_rss_mb']:>9.1f}{r['errors']:>5}"
+            )
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""페이지별 헤드리스 벤치마크 (streamlit.testing.v1.AppTest).
+
+`main.py` 와 `pages/*.py` 를 실제 위젯으로 조작하면서 첫 실행(cold)과
+다시 실행(warm) 시간을 잽니다. 시간은 세 단계로 나눕니다.
+
+    load     데이터·인덱스 로드 (mbti.*.load_* 함수)
+    compute  랭킹·그래프 스펙·카드 HTML 계산 (top_frame, cached_figure 등)
+    render   나머지 전부 (스크립트 실행과 Streamlit 요소 생성)
+
+결과는 JSON으로 저장하고, `bench/budgets.json` 의 예산을 넘는 페이지가
+있으면 종료 코드 1로 끝납니다. 네트워크 없이 동작합니다.
+
+    python -m bench.pages                      # 전체 페이지
+    python -m bench.pages --page 03 --out bench/baseline.json
+"""
+import argparse
+import functools
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+import mbti.cards
+import mbti.clusters
+import mbti.data
+import mbti.figures
+import mbti.groups
+import mbti.query
+import mbti.ranking
+import mbti.similarity
+from mbti.quiz import QUESTIONS
+
+ROOT = Path(__file__).resolve().parent.parent
+BUDGETS_PATH = Path(__file__).resolve().parent / "budgets.json"
+TIMEOUT = 60
+
+# ─────────────────────────────────────────────────────────────────
+# 단계별 타이머: 페이지가 부르는 공용 함수를 감싸서 시간 누적
+# ─────────────────────────────────────────────────────────────────
+PHASES = {"load": 0.0, "compute": 0.0}
+_depth = 0
+# 감싸기 전 원래 함수 (두 번 불러도 한 번만 감싸도록)
+_originals = {}
+
+LOAD_HOOKS = [
+    (mbti.data, "load_data"),
+    (mbti.data, "load_store"),
+    (mbti.data, "data_version"),
+    (mbti.ranking, "load_rank_index"),
+    (mbti.groups, "load_group_table"),
+    (mbti.similarity, "load_similarity"),
+]
+COMPUTE_HOOKS = [
+    (mbti.ranking.RankIndex, "top_frame"),
+    (mbti.groups.GroupTable, "top_frame"),
+    (mbti.similarity.SimilarityEngine, "neighbors"),
+    (mbti.query, "rank_countries"),
+    (mbti.figures, "cached_figure"),
+    (mbti.cards, "group_cards"),
+]
+
+
+def _timed(phase, fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        global _depth
+        if _depth:
+            return fn(*args, **kwargs)
+        _depth += 1
+        t0 = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            PHASES[phase] += time.perf_counter() - t0
+            _depth -= 1
+    return wrapper
+
+
+def install_hooks():
+    for phase, hooks in (("load", LOAD_HOOKS), ("compute", COMPUTE_HOOKS)):
+        for owner, name in hooks:
+            if (owner, name) in _originals:
+                continue
+            _originals[owner, name] = fn = getattr(owner, name)
+            setattr(owner, name, _timed(phase, fn))
+
+
+def reset_caches():
+    """cold 측정용: 프로세스 안의 모든 공용 캐시 비우기"""
+    mbti.data.clear_cache()
+    mbti.cards.clear_cache()
+    mbti.figures.figure_cache.clear()
+
+
+def timed_run(at: AppTest) -> dict:
+    PHASES["load"] = PHASES["compute"] = 0.0
+    t0 = time.perf_counter()
+    at.run(timeout=TIMEOUT)
+    total = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(f"페이지 실행 중 예외: {at.exception[0].message}")
+    return {
+        "total_ms": total * 1000,
+        "load_ms": PHASES["load"] * 1000,
+        "compute_ms": PHASES["compute"] * 1000,
+        "render_ms": max(total - PHASES["load"] - PHASES["compute"], 0.0) * 1000,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────
+# 페이지별 시나리오: 첫 실행 후 위젯을 바꿔가며 (위젯 설정 함수) 를 차례로 돌려줌
+# ─────────────────────────────────────────────────────────────────
+def _every_option(index):
+    def scenario(at):
+        for opt in list(at.selectbox[index].options):
+            yield lambda at, opt=opt: at.selectbox[index].set_value(opt)
+    return scenario
+
+
+def _rerun(at):
+    yield lambda at: None
+
+
+def _page02(at):
+    yield from _every_option(0)(at)
+    yield from _every_option(-1)(at)
+    for metric in mbti.similarity.METRICS:
+        yield lambda at, m=metric: at.radio[0].set_value(m)
+
+
+def _page03(at):
+    # 여러 라운드를 돌 때: 앞 라운드가 켜 둔 탭 보기를 꺼야 그룹 선택이 보임
+    if at.toggle[0].value:
+        yield lambda at: at.toggle[0].set_value(False)
+    for group in ["NF", "NT", "SJ", "SP", "ST", "custom"]:
+        yield lambda at, g=group: at.radio[0].set_value(g)
+    yield lambda at: at.toggle[0].set_value(True)
+
+
+def _page05(at):
+    for method in mbti.clusters.METHODS:
+        yield lambda at, m=method: at.radio[0].set_value(m)
+    for k in list(at.select_slider[0].options):
+        yield lambda at, k=k: at.select_slider[0].set_value(int(k))
+
+
+def _page04(at):
+    # 16유형이 한 번씩 나오도록 각 축 두 문항을 같은 쪽으로 답함
+    for t in mbti.data.MBTI_TYPES:
+        def answer(at, t=t):
+            for i, item in enumerate(QUESTIONS):
+                letter = t["EISNTFJP".index(item["opts"][0][1]) // 2]
+                opt = item["opts"][0] if letter == item["opts"][0][1] else item["opts"][1]
+                at.radio(key=f"q{i}").set_value(opt)
+            at.button[0].click()
+        yield answer
+
+
+SCENARIOS = {
+    "main.py": _rerun,
+    "pages/00_상위10개유형.py": _every_option(0),
+    "pages/01_국가별MBTI유형.py": _every_option(0),
+    "pages/02_나와비슷한나라는?.py": _page02,
+    "pages/03_MBTI카드뉴스.py": _page03,
+    "pages/04_MBTI테스트추천나라.py": _page04,
+    "pages/05_MBTI국가클러스터.py": _page05,
+}
+
+
+def _summary(runs) -> dict:
+    totals = sorted(r["total_ms"] for r in runs)
+    p95 = totals[min(len(totals) - 1, int(round(0.95 * (len(totals) - 1))))]
+    out = {"runs": len(runs), "p50_ms": statistics.median(totals), "p95_ms": p95, "max_ms": totals[-1]}
+    for phase in ("load_ms", "compute_ms", "render_ms"):
+        out[f"mean_{phase}"] = statistics.fmean(r[phase] for r in runs)
+    return out
+
+
+def bench_page(script: str) -> dict:
+    reset_caches()
+    at = AppTest.from_file(str(ROOT / script), default_timeout=TIMEOUT)
+    cold = timed_run(at)
+    warm = []
+    for action in SCENARIOS[script](at):
+        action(at)
+        warm.append(timed_run(at))
+    return {"cold": cold, "warm": _summary(warm) if warm else None}
+
+
+def check_budgets(results: dict, budgets: dict) -> list:
+    failures = []
+    for script, res in results.items():
+        budget = budgets.get(script, {})
+        if "cold_ms" in budget and res["cold"]["total_ms"] > budget["cold_ms"]:
+            failures.append(f"{script}: cold {res['cold']['total_ms']:.0f}ms > {budget['cold_ms']}ms")
+        if res["warm"] and "warm_p95_ms" in budget and res["warm"]["p95_ms"] > budget["warm_p95_ms"]:
+            failures.append(f"{script}: warm p95 {res['warm']['p95_ms']:.0f}ms > {budget['warm_p95_ms']}ms")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지별 헤드리스 벤치마크")
+    parser.add_argument("--page", action="append", help="파일 이름 일부 (예: 03). 여러 번 지정 가능")
+    parser.add_argument("--out", default="bench/results.json", help="결과 JSON 경로")
+    parser.add_argument("--budgets", default=str(BUDGETS_PATH))
+    args = parser.parse_args(argv)
+
+    scripts = [s for s in SCENARIOS if not args.page or any(p in s for p in args.page)]
+    install_hooks()
+    results = {}
+    for script in scripts:
+        results[script] = res = bench_page(script)
+        warm = res["warm"] or {}
+        print(
+            f"{script:<36} cold {res['cold']['total_ms']:8.1f}ms"
+            f"  warm p50 {warm.get('p50_ms', 0):7.1f}ms  p95 {warm.get('p95_ms', 0):7.1f}ms"
+            f"  ({warm.get('runs', 0)}회)"
+        )
+
+    Path(args.out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    failures = check_budgets(results, json.loads(Path(args.budgets).read_text(encoding="utf-8")))
+    for f in failures:
+        print(f"예산 초과 — {f}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
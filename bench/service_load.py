@@ -0,0 +1,140 @@
+"""JSON 질의 서비스(`mbti.service`) 부하 테스트 클라이언트 (asyncio).
+
+연결 N개를 keep-alive 로 열어 두고 `--seconds` 동안 유형 TOP-k · 나라 분포 ·
+그룹 · 테스트 질의를 섞어서 보냅니다. 초당 처리량, 지연 p50/p95/p99,
+상태 코드별 개수를 냅니다. `--batch B` 면 질의 B개를 /v1/batch 한 번으로,
+`--etag` 면 If-None-Match 로 304 경로를 잽니다.
+
+    python -m mbti.service &                       # 서버 (다른 터미널)
+    python -m bench.service_load --connections 64 --seconds 10
+    python -m bench.service_load --batch 32 --out bench/service.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+
+from mbti.data import MBTI_TYPES, load_store
+from mbti.groups import GROUPS
+from mbti.quiz import OPTION_LETTERS
+
+
+def targets(seed=0, n=2000) -> list:
+    """질의 섞음 (유형 40%, 나라 30%, 테스트 20%, 그룹 10%)"""
+    rng = random.Random(seed)
+    countries = list(load_store().countries)
+    out = []
+    for _ in range(n):
+        r = rng.random()
+        if r < 0.4:
+            out.append(f"/v1/top?type={rng.choice(MBTI_TYPES)}&k={rng.choice((5, 7, 10))}")
+        elif r < 0.7:
+            out.append(f"/v1/countries/{quote(rng.choice(countries))}")
+        elif r < 0.9:
+            answers = "".join(rng.choice(pair) for pair in OPTION_LETTERS)
+            out.append(f"/v1/quiz?answers={answers}")
+        else:
+            out.append(f"/v1/groups/{rng.choice(list(GROUPS))}?k=10")
+    return out
+
+
+def _request(host, target, etag=None, body=None) -> bytes:
+    method = "POST" if body is not None else "GET"
+    head = [f"{method} {target} HTTP/1.1", f"Host: {host}"]
+    if etag:
+        head.append(f"If-None-Match: {etag}")
+    if body is not None:
+        head += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + (body or b"")
+
+
+async def _read_response(reader):
+    raw = await reader.readuntil(b"\r\n\r\n")
+    lines = raw.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return status, headers, body
+
+
+async def _worker(host, port, pool, deadline, batch, use_etag, latencies, statuses):
+    reader, writer = await asyncio.open_connection(host, port)
+    etag = None
+    i = random.randrange(len(pool))
+    try:
+        while time.perf_counter() < deadline:
+            if batch > 1:
+                items = [pool[(i + j) % len(pool)] for j in range(batch)]
+                msg = _request(host, "/v1/batch", body=json.dumps({"requests": items}).encode())
+            else:
+                msg = _request(host, pool[i % len(pool)], etag if use_etag else None)
+            i += batch
+            t0 = time.perf_counter()
+            writer.write(msg)
+            status, headers, _ = await _read_response(reader)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            statuses[status] += 1
+            etag = headers.get("etag", etag)
+    finally:
+        writer.close()
+
+
+async def run(url, connections, seconds, batch=1, use_etag=False) -> dict:
+    parts = urlsplit(url)
+    pool = targets()
+    latencies, statuses = [], Counter()
+    deadline = time.perf_counter() + seconds
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(parts.hostname, parts.port or 80, pool, deadline, batch, use_etag, latencies, statuses)
+        for _ in range(connections)
+    ))
+    wall = time.perf_counter() - t0
+    lat = np.asarray(latencies)
+    p50, p95, p99 = np.percentile(lat, [50, 95, 99]) if len(lat) else (0.0, 0.0, 0.0)
+    return {
+        "connections": connections,
+        "batch": batch,
+        "etag": use_etag,
+        "requests": int(len(lat)),
+        "queries": int(len(lat)) * batch,
+        "requests_per_s": len(lat) / wall,
+        "queries_per_s": len(lat) * batch / wall,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "statuses": dict(statuses),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSON 질의 서비스 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--batch", type=int, default=1, help="한 요청에 묶을 질의 수 (/v1/batch)")
+    parser.add_argument("--etag", action="store_true", help="If-None-Match 로 304 경로 측정")
+    parser.add_argument("--out", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = []
+    for c in args.connections:
+        res = asyncio.run(run(args.url, c, args.seconds, args.batch, args.etag))
+        results.append(res)
+        print(
+            f"연결 {c:>4}  {res['queries_per_s']:>10.0f} 질의/s  ({res['requests_per_s']:.0f} 요청/s)"
+            f"  p50 {res['p50_ms']:6.2f}ms  p95 {res['p95_ms']:6.2f}ms  p99 {res['p99_ms']:6.2f}ms  {res['statuses']}"
+        )
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
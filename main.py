@@ -1,12 +1,16 @@
 import streamlit as st
-import pandas as pd
+
+from mbti.data import load_data
+from mbti.page import setup
+
+# 공통 준비 (캐시 워밍업, 연도 선택 없음)
+setup(year_select=False)
 
 # 제목
 st.title("🌍 MBTI 유형별 국가 데이터 미리보기")
 
-# 파일 읽기
-file_path = "countriesMBTI_16types.csv"  # 같은 폴더에 있다고 가정
-df = pd.read_csv(file_path)
+# 파일 읽기 (프로세스당 한 번만 읽어서 모든 페이지가 공유)
+df, mbti_cols = load_data()
 
 # 데이터 미리보기
 st.subheader("📋 데이터 상위 5줄 미리보기")
@@ -0,0 +1,5 @@
+"""MBTI 국가 데이터 앱의 공용 로직 (데이터 로드·랭킹·집계 등).
+
+페이지 스크립트(`main.py`, `pages/*.py`)는 이 패키지의 함수만 불러 쓰고,
+무거운 계산은 프로세스당 한 번만 수행합니다.
+"""
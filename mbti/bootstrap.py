@@ -0,0 +1,236 @@
+"""부트스트랩으로 본 순위의 불확실성 (순위 구간 · TOP-k 확률).
+
+나라마다 비율 차이가 0.01%p 수준인 경우가 많아서, TOP-k 목록의 순서를
+그대로 믿으면 데이터가 조금만 바뀌어도 순위가 요동치는 것처럼 보입니다.
+여기서는 나라별 16유형 분포를 응답자 `N_EFF` 명 규모의 표본으로 보고
+다시 뽑기(디리클레 또는 다항)를 `N_REPLICATES` 번 해서,
+16유형 + 기질 그룹 각각에 대해
+
+- 순위 구간: 다시 뽑은 순위의 `LEVEL` (기본 95%) 구간
+- TOP-k 확률: 다시 뽑았을 때 상위 k 안에 드는 비율 (`TOP_KS`)
+
+을 구합니다. 복제본은 `(블록, 나라, 16)` 배열로 한 번에 뽑고 블록마다
+순위를 매겨 (열, 나라, 순위 칸) int32 히스토그램에 더하기만 하므로 메모리는
+복제 수와 무관합니다. 나라 수에는 비례하므로, 히스토그램이 `HIST_BYTES`
+안에 들도록 나라가 많으면 여러 순위를 한 칸에 묶습니다(158개 나라는 순위
+하나당 한 칸, 약 2MB). 계산 중 메모리는 HIST_BYTES 에 블록 임시 배열
+(`BLOCK_ELEMS` 원소짜리 몇 개, 약 150MB)을 더한 정도이고, 끝나면
+히스토그램은 버리고 열 × 나라 크기의 구간 양끝과 TOP-k 횟수만 남깁니다.
+계산은 데이터 버전마다 백그라운드에서 한 번 돌고, 페이지는 준비됐을 때만
+꺼내 씁니다(`load_rank_intervals(timeout=0)`).
+
+    python -m mbti.bootstrap --replicates 10000
+"""
+import argparse
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from . import metrics
+from .data import FILE_PATH, load_store, on_reload
+from .groups import GROUPS, membership_matrix
+from .ranking import load_rank_index
+
+METHODS = ("dirichlet", "multinomial")
+N_REPLICATES = 10000
+# 나라별 응답자 수를 모르므로 표본 크기를 가정 (환경변수로 조정)
+N_EFF = int(os.environ.get("MBTI_BOOTSTRAP_N", "1000"))
+# 디리클레 사전값 (비율 0인 유형도 가끔은 뽑히도록)
+PRIOR = 0.5
+LEVEL = 0.95
+TOP_KS = (5, 7, 10)
+SEED = 0
+# 블록 하나에 담을 원소 수 (복제 × 나라 × 열)
+BLOCK_ELEMS = 1 << 22
+# 순위 히스토그램 칸 수 상한 (나라가 더 많으면 여러 순위를 한 칸에)
+MAX_RANK_BINS = 1000
+# 순위 히스토그램(열 × 나라 × 칸, int32) 크기 상한 — 넘으면 칸 수를 줄임
+HIST_BYTES = 64 << 20
+
+log = logging.getLogger(__name__)
+
+
+# ─────────────────────────────────────────────────────────────────
+# 다시 뽑기
+# ─────────────────────────────────────────────────────────────────
+def resample(P, size, rng, method="dirichlet", n_eff=N_EFF) -> np.ndarray:
+    """나라 × 16 비율 P 에서 복제 size 개 → (size, 나라, 16) float32 비율"""
+    if method == "dirichlet":
+        alpha = (n_eff * P + PRIOR).astype(np.float32)
+        G = rng.standard_gamma(alpha, size=(size,) + alpha.shape, dtype=np.float32)
+        return G / G.sum(axis=2, keepdims=True)
+    if method == "multinomial":
+        counts = rng.multinomial(n_eff, P, size=(size, len(P)))
+        return counts.astype(np.float32) / np.float32(n_eff)
+    raise ValueError(f"알 수 없는 방법입니다: {method!r} (가능: {', '.join(METHODS)})")
+
+
+def rank_block(V) -> np.ndarray:
+    """(복제, 열, 나라) 값 → 같은 모양의 0부터 시작하는 내림차순 순위"""
+    order = np.argsort(-V, axis=2, kind="stable")
+    ranks = np.empty(V.shape, dtype=np.int32)
+    np.put_along_axis(ranks, order, np.arange(V.shape[2], dtype=np.int32)[None, None, :], axis=2)
+    return ranks
+
+
+# ─────────────────────────────────────────────────────────────────
+# 결과 (데이터 버전당 하나)
+# ─────────────────────────────────────────────────────────────────
+class RankIntervals:
+    """16유형 + 기질 그룹별 국가 순위 분포 요약"""
+
+    def __init__(self, store, groups=GROUPS, n_replicates=N_REPLICATES, method="dirichlet",
+                 n_eff=N_EFF, top_ks=TOP_KS, seed=SEED):
+        self.keys = tuple(store.types) + tuple(groups)
+        self.col_of = {key: j for j, key in enumerate(self.keys)}
+        self.countries = np.asarray(store.countries, dtype=object)
+        self.n_replicates = n_replicates
+        self.method = method
+        self.n_eff = n_eff
+
+        P = np.asarray(store.matrix, dtype=np.float64)
+        P = np.clip(P, 0, None)
+        P /= P.sum(axis=1, keepdims=True)
+        n, n_keys = len(P), len(self.keys)
+        # 16유형은 그대로, 그룹은 소속 행렬 곱으로 (열 = 유형 + 그룹)
+        M = np.hstack([np.eye(len(store.types)), membership_matrix(store.types, groups)]).astype(np.float32)
+
+        # 칸 수: 순위 하나당 한 칸이 기본, 히스토그램이 HIST_BYTES 를 넘으면 여러 순위를 한 칸에
+        bins = max(1, min(n, MAX_RANK_BINS, HIST_BYTES // (4 * n_keys * n)))
+        width = self._width = -(-n // bins)
+        bins = -(-n // width)
+        hist = np.zeros((n_keys, n * bins), dtype=np.int32)
+        self._top = {k: np.zeros((n_keys, n), dtype=np.int32) for k in top_ks if k <= n}
+        cell = np.arange(n, dtype=np.int32)[None, :] * bins
+
+        rng = np.random.default_rng(seed)
+        block = max(1, BLOCK_ELEMS // (n * max(n_keys, P.shape[1])))
+        with metrics.timer("bootstrap_resample"):
+            for start in range(0, n_replicates, block):
+                size = min(block, n_replicates - start)
+                S = resample(P, size, rng, method, n_eff)
+                V = np.ascontiguousarray((S @ M).transpose(0, 2, 1))
+                ranks = rank_block(V)
+                binned = cell + ranks // width
+                # 열마다 따로 세어서 임시 배열을 나라 × 칸 하나 크기로 유지
+                for j in range(n_keys):
+                    np.add(hist[j], np.bincount(binned[:, j].ravel(), minlength=n * bins),
+                           out=hist[j], casting="unsafe")
+                for k, counts in self._top.items():
+                    counts += (ranks < k).sum(axis=0, dtype=np.int32)
+
+        # LEVEL 구간 양끝만 남기고 히스토그램은 버림 (누적분포도 열 하나씩만 만듦)
+        tail = (1 - LEVEL) / 2 * n_replicates
+        self._lo = np.empty((n_keys, n), dtype=np.int32)
+        self._hi = np.empty((n_keys, n), dtype=np.int32)
+        for j in range(n_keys):
+            cdf = np.cumsum(hist[j].reshape(n, bins), axis=1)
+            self._lo[j] = (cdf <= tail).sum(axis=1) * width + 1
+            self._hi[j] = np.minimum(((cdf < n_replicates - tail).sum(axis=1) + 1) * width, n)
+
+    def _rows(self, rows):
+        return slice(None) if rows is None else np.asarray(rows, dtype=np.intp)
+
+    def interval(self, key, rows=None):
+        """rows 나라들의 LEVEL 순위 구간 (1부터 시작하는 (낮은 쪽, 높은 쪽) 배열)"""
+        j, rows = self.col_of[key], self._rows(rows)
+        return self._lo[j, rows], self._hi[j, rows]
+
+    def p_top(self, key, k, rows=None) -> np.ndarray:
+        """rows 나라들이 다시 뽑았을 때 상위 k 안에 드는 확률"""
+        j, rows = self.col_of[key], self._rows(rows)
+        if k in self._top:
+            return self._top[k][j, rows] / self.n_replicates
+        if k >= len(self.countries):
+            return np.ones(len(self.countries))[rows]
+        raise ValueError(f"TOP{k} 확률은 계산해 두지 않았습니다. (가능: {sorted(self._top)})")
+
+    def columns(self, key, rows, k) -> dict:
+        """표에 붙일 컬럼 {"순위 범위": …, "TOP{k} 확률(%)": …} (rows 순서대로)"""
+        lo, hi = self.interval(key, rows)
+        spans = [f"{a}위" if a == b else f"{a}–{b}위" for a, b in zip(lo, hi)]
+        return {"순위 범위": spans, f"TOP{k} 확률(%)": np.round(self.p_top(key, k, rows) * 100, 1)}
+
+    def describe(self) -> str:
+        label = "디리클레" if self.method == "dirichlet" else "다항"
+        return (f"나라마다 응답자 {self.n_eff:,}명 규모로 보고 {label} 분포로 {self.n_replicates:,}번 "
+                f"다시 뽑았을 때, 순위 범위는 {LEVEL:.0%} 구간이고 TOP-k 확률은 상위 k 안에 든 비율이에요.")
+
+
+# ─────────────────────────────────────────────────────────────────
+# 백그라운드 계산 + 버전별 캐시
+# ─────────────────────────────────────────────────────────────────
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mbti-bootstrap")
+
+
+def _build(store) -> RankIntervals:
+    with metrics.timer("bootstrap_build"):
+        return RankIntervals(store)
+
+
+def _log_failure(future):
+    error = future.exception()
+    if error is not None:
+        log.error("부트스트랩 순위 구간 계산 실패", exc_info=error)
+
+
+def _submit(store):
+    future = _executor.submit(_build, store)
+    future.add_done_callback(_log_failure)
+    return future
+
+
+def _schedule(store):
+    """이 버전의 부트스트랩 예약 (Future 는 store 에 보관되어 한 번만 예약됨)"""
+    return store.derived("bootstrap", lambda: _submit(store))
+
+
+def load_rank_intervals(path=FILE_PATH, year=None, timeout=None):
+    """준비된 RankIntervals (timeout 초 안에 끝나지 않았거나 계산이 실패했으면 None)
+
+    순위 구간은 곁들이는 정보라서, 계산이 실패해도 페이지는 그대로 그려지게
+    예외를 삼킵니다(실패는 한 번만 로그에 남음).
+    """
+    future = _schedule(load_store(path, year))
+    try:
+        return future.result(timeout=timeout)
+    except Exception:  # 시간 초과(TimeoutError) 포함
+        return None
+
+
+@on_reload
+def _reschedule(old, new, rows):
+    # 한 나라의 값만 바뀌어도 다른 나라들의 순위 분포가 같이 바뀌므로 전체를 다시 계산
+    if any(key == "bootstrap" for key, _ in old.derived_items()):
+        _schedule(new)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="부트스트랩 순위 구간 · TOP-k 확률")
+    parser.add_argument("key", nargs="?", default="INFJ", help="유형 또는 그룹 (NF/NT/SJ/SP/ST)")
+    parser.add_argument("--data", default=str(FILE_PATH))
+    parser.add_argument("--replicates", type=int, default=N_REPLICATES)
+    parser.add_argument("--method", choices=METHODS, default="dirichlet")
+    parser.add_argument("--n-eff", type=int, default=N_EFF, help="나라별 가정 응답자 수")
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    store = load_store(args.data)
+    t0 = time.perf_counter()
+    result = RankIntervals(store, n_replicates=args.replicates, method=args.method, n_eff=args.n_eff)
+    print(f"{args.replicates:,}회 × {len(store)}개 나라 × {len(result.keys)}개 열: "
+          f"{time.perf_counter() - t0:.2f}초")
+
+    key = args.key.upper()
+    rows = load_rank_index(args.data).top(key, args.k)
+    cols = result.columns(key, rows, args.k)
+    for i, row in enumerate(rows):
+        print(f"{i + 1:>3}. {result.countries[row]:<28} {cols['순위 범위'][i]:>9}  "
+              f"TOP{args.k} {cols[f'TOP{args.k} 확률(%)'][i]:5.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""카드 뉴스(페이지 03)의 카드 HTML 조각 캐시.
+
+나라별 이모지, 순위 메달·배경색, 카드 HTML 문자열은 데이터 버전마다
+한 번만 만들어 두고 모든 세션이 재사용합니다. 페이지는 보고 있는
+그룹의 카드 조각만 꺼내 `st.markdown` 으로 뿌립니다.
+
+캐시 키는 저장소 객체가 아니라 데이터 버전 문자열이라, 핫 리로드로
+바뀐 옛 저장소를 캐시가 붙잡아 두지 않습니다.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+
+# ─────────────────────────────────────────────────────────────────
+# 이모지/색상
+# ─────────────────────────────────────────────────────────────────
+EMOJI_POOL = [
+    "🏖️","🏙️","🏔️","🌋","🏜️","⛩️","🏰","🎎","🌉","🕌","🛕","🗼","🗽",
+    "🌊","🌴","☕️","🍜","🍣","🥐","🌮","🍫","🍷","🍺","🍵","🍧","🍱","🥟"
+]
+
+# 라이트한 파스텔 백그라운드들
+CARD_BG_COLORS = [
+    "#FDF2F8", "#ECFEFF", "#F0F9FF", "#F0FDF4", "#FFF7ED",
+    "#F5F5F5", "#FDF4FF", "#FEF2F2", "#FAFAF9", "#EFF6FF"
+]
+
+MEDALS = ["🥇","🥈","🥉","4️⃣","5️⃣","6️⃣","7️⃣","8️⃣","9️⃣","🔟"]
+
+
+def pick_emojis(key: str, k: int = 2):
+    h = int(hashlib.md5(key.encode("utf-8")).hexdigest(), 16)
+    e1 = EMOJI_POOL[h % len(EMOJI_POOL)]
+    e2 = EMOJI_POOL[(h // 7) % len(EMOJI_POOL)]
+    return [e1, e2] if e1 != e2 else [e1, "✨"]
+
+
+# 보관할 (버전, 그룹, k) 카드 묶음 수
+MAX_CARD_SETS = 128
+
+
+def emoji_map(store) -> dict:
+    """나라 → 이모지 두 개 (데이터 버전마다 한 번만 해시 계산, 저장소와 함께 사라짐)"""
+    return store.derived("emoji_map", lambda: {c: "".join(pick_emojis(c)) for c in store.countries})
+
+
+def card_html(rank: int, country: str, emojis: str, group_key: str, percent) -> str:
+    bg = CARD_BG_COLORS[rank % len(CARD_BG_COLORS)]
+    medal = MEDALS[rank] if rank < len(MEDALS) else f"{rank + 1}."
+    return f"""
+        <div style="
+            background:{bg};
+            border-radius:24px;
+            padding:18px 20px;
+            box-shadow: 0 6px 18px rgba(0,0,0,0.05);
+            border:1px solid rgba(0,0,0,0.05);
+        ">
+            <div style="font-size:28px; line-height:1.2; margin-bottom:6px;">
+                {medal} <b>{country}</b> {emojis}
+            </div>
+            <div style="font-size:16px; color:#555; margin-bottom:6px;">
+                {group_key}형 비율
+            </div>
+            <div style="font-size:22px;"><b>{percent}%</b></div>
+        </div>
+        """
+
+
+_lock = threading.Lock()
+_cards = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def group_cards(source, group_key: str, k: int = 10):
+    """source(RankIndex/GroupTable)의 group_key 상위 k개 → (카드 HTML 튜플, 표 DataFrame)
+
+    (데이터 버전, 그룹 이름, 그룹 구성 유형, k) 마다 한 번만 만들고 최근
+    MAX_CARD_SETS 개만 남깁니다. 반환값은 여러 세션이 공유하니 수정하지 마세요.
+    """
+    key = (source.store.version, group_key, tuple(source.groups.get(group_key, ())), k)
+    with _lock:
+        hit = _cards.get(key)
+        if hit is not None:
+            _cards.move_to_end(key)
+            _stats["hits"] += 1
+            return hit
+    out = _build_cards(source, group_key, k)
+    with _lock:
+        _stats["misses"] += 1
+        _cards[key] = out
+        while len(_cards) > MAX_CARD_SETS:
+            _cards.popitem(last=False)
+    return out
+
+
+@metrics.timed("cards_html")
+def _build_cards(source, group_key, k):
+    top = source.top_frame(group_key, k, value_name="ratio")
+    percent = np.round(top["ratio"].to_numpy() * 100, 2)
+    emojis = emoji_map(source.store)
+    cards = tuple(
+        card_html(i, country, emojis[country], group_key, p)
+        for i, (country, p) in enumerate(zip(top["Country"], percent))
+    )
+    table = pd.DataFrame({"국가": top["Country"], "비율(%)": percent})
+    return cards, table
+
+
+def clear_cache():
+    with _lock:
+        _cards.clear()
+
+
+def _cache_stats() -> dict:
+    return {**_stats, "size": len(_cards)}
+
+
+metrics.register_cache("cards.group_cards", _cache_stats)
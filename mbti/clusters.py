@@ -0,0 +1,280 @@
+"""MBTI 분포가 닮은 나라끼리 묶기 (k-means + 계층적 Ward 군집).
+
+국가 × 16유형 행렬 전체에 대해 `K_RANGE` 의 모든 k 로 군집을 한 번에
+계산해 데이터 버전마다 보관합니다. 계산은 백그라운드 워커 스레드에서
+돌고(데이터가 바뀌면 새 버전에 대해 다시 예약), 페이지는 결과가 준비되면
+꺼내 쓰기만 합니다.
+
+- k-means: k-means++ 초기화 + Lloyd 반복, 배정 단계는 행 블록 단위 행렬곱
+- 계층적: Ward 연결 (Lance–Williams 갱신, scipy 형식 연결 행렬)
+  행이 `HIER_MAX_ROWS` 를 넘으면(지역 단위 등) 먼저 k-means 로
+  `HIER_MICRO` 개의 작은 군집을 만들고, 그 중심점들을 크기 가중치로 묶음
+- 실루엣 점수는 최대 `SILHOUETTE_SAMPLE` 행 표본으로 계산
+"""
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .data import FILE_PATH, load_store, on_reload
+
+K_RANGE = tuple(range(2, 11))
+N_INIT = 8
+MAX_ITER = 100
+HIER_MAX_ROWS = 1000
+HIER_MICRO = 256
+SILHOUETTE_SAMPLE = 2000
+# 배정 단계 블록 크기 (행)
+BLOCK_ROWS = 1 << 16
+
+METHODS = ("kmeans", "ward")
+METHOD_LABELS = {"kmeans": "k-means", "ward": "계층적 (Ward)"}
+
+
+# ─────────────────────────────────────────────────────────────────
+# k-means
+# ─────────────────────────────────────────────────────────────────
+def _assign(X, sq, C):
+    """각 행의 가장 가까운 중심 번호와 제곱 거리 (행 블록 단위)"""
+    labels = np.empty(len(X), dtype=np.intp)
+    dist = np.empty(len(X), dtype=np.float64)
+    csq = (C * C).sum(axis=1)
+    for start in range(0, len(X), BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, len(X))
+        d = sq[start:stop, None] - 2.0 * (X[start:stop] @ C.T) + csq[None, :]
+        labels[start:stop] = d.argmin(axis=1)
+        dist[start:stop] = np.maximum(d[np.arange(stop - start), labels[start:stop]], 0.0)
+    return labels, dist
+
+
+def _plus_plus(X, k, rng):
+    """k-means++ 초기 중심"""
+    centers = [X[rng.integers(len(X))]]
+    d2 = ((X - centers[0]) ** 2).sum(axis=1)
+    for _ in range(1, k):
+        total = d2.sum()
+        i = rng.choice(len(X), p=d2 / total) if total > 0 else rng.integers(len(X))
+        centers.append(X[i])
+        d2 = np.minimum(d2, ((X - X[i]) ** 2).sum(axis=1))
+    return np.array(centers)
+
+
+def _centroids(X, labels, k, weights=None):
+    """군집별 (가중) 평균과 크기"""
+    w = np.ones(len(X)) if weights is None else weights
+    sizes = np.bincount(labels, weights=w, minlength=k)
+    sums = np.zeros((k, X.shape[1]))
+    for j in range(X.shape[1]):
+        sums[:, j] = np.bincount(labels, weights=w * X[:, j], minlength=k)
+    return sums / np.where(sizes > 0, sizes, 1.0)[:, None], sizes
+
+
+def kmeans(X, k, n_init=N_INIT, max_iter=MAX_ITER, tol=1e-10, seed=0):
+    """(labels, centroids, inertia) — n_init 번 중 관성(inertia)이 가장 작은 결과"""
+    X = np.asarray(X, dtype=np.float64)
+    k = min(k, len(X))
+    sq = (X * X).sum(axis=1)
+    rng = np.random.default_rng(seed)
+    best = None
+    for _ in range(n_init):
+        C = _plus_plus(X, k, rng)
+        for _ in range(max_iter):
+            labels, dist = _assign(X, sq, C)
+            new, sizes = _centroids(X, labels, k)
+            # 빈 군집은 현재 가장 멀리 떨어진 점으로 다시 시작
+            for j in np.flatnonzero(sizes == 0):
+                far = dist.argmax()
+                new[j], dist[far] = X[far], 0.0
+            shift = ((new - C) ** 2).sum()
+            C = new
+            if shift <= tol:
+                break
+        labels, dist = _assign(X, sq, C)
+        inertia = float(dist.sum())
+        if best is None or inertia < best[2]:
+            best = (labels, C, inertia)
+    return best
+
+
+# ─────────────────────────────────────────────────────────────────
+# 계층적 (Ward)
+# ─────────────────────────────────────────────────────────────────
+def ward_linkage(X, weights=None) -> np.ndarray:
+    """Ward 연결 행렬 (n-1 × 4: 합친 두 군집, 거리, 크기) — scipy.cluster.hierarchy 와 같은 형식"""
+    X = np.asarray(X, dtype=np.float64)
+    n = len(X)
+    size = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64).copy()
+    sq = (X * X).sum(axis=1)
+    D = np.maximum(sq[:, None] + sq[None, :] - 2.0 * (X @ X.T), 0.0)
+    # 두 군집을 합칠 때 늘어나는 제곱합 (Ward 비용)
+    D *= size[:, None] * size[None, :] / (size[:, None] + size[None, :])
+    np.fill_diagonal(D, np.inf)
+    ids = np.arange(n)
+    Z = np.empty((n - 1, 4))
+    for step in range(n - 1):
+        i, j = divmod(int(D.argmin()), n)
+        if i > j:
+            i, j = j, i
+        dij = D[i, j]
+        Z[step] = (ids[i], ids[j], np.sqrt(2.0 * dij), size[i] + size[j])
+        ni, nj = size[i], size[j]
+        # Lance–Williams: 이미 합쳐진(비활성) 열은 inf 그대로 남음
+        row = ((ni + size) * D[i] + (nj + size) * D[j] - size * dij) / (ni + nj + size)
+        row[i] = np.inf
+        D[i], D[:, i] = row, row
+        D[j], D[:, j] = np.inf, np.inf
+        size[i] = ni + nj
+        ids[i] = n + step
+    return Z
+
+
+def cut_tree(Z, n, k) -> np.ndarray:
+    """연결 행렬을 k개 군집으로 자른 잎 번호 → 군집 번호 (0..k-1, 첫 등장 순)"""
+    parent = np.arange(2 * n - 1)
+    for step in range(n - k):
+        a, b = int(Z[step, 0]), int(Z[step, 1])
+        parent[a] = parent[b] = n + step
+    root = parent[:n].copy()
+    while True:
+        up = parent[root]
+        if np.array_equal(up, root):
+            break
+        root = up
+    _, first, labels = np.unique(root, return_index=True, return_inverse=True)
+    # 군집 번호를 첫 잎 등장 순서로 맞춤
+    rank = np.empty(len(first), dtype=np.intp)
+    rank[np.argsort(first)] = np.arange(len(first))
+    return rank[labels]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 평가
+# ─────────────────────────────────────────────────────────────────
+def silhouette(X, labels, k, sample=SILHOUETTE_SAMPLE, seed=0) -> float:
+    """평균 실루엣 점수 (행이 많으면 표본으로)"""
+    X = np.asarray(X, dtype=np.float64)
+    if len(X) > sample:
+        idx = np.random.default_rng(seed).choice(len(X), sample, replace=False)
+        X, labels = X[idx], labels[idx]
+    sq = (X * X).sum(axis=1)
+    D = np.sqrt(np.maximum(sq[:, None] + sq[None, :] - 2.0 * (X @ X.T), 0.0))
+    onehot = np.zeros((len(X), k))
+    onehot[np.arange(len(X)), labels] = 1.0
+    counts = onehot.sum(axis=0)
+    # 각 행에서 군집별 평균 거리 (자기 군집은 자기 자신을 빼고)
+    mean = D @ onehot
+    own = counts[labels] - 1
+    a = mean[np.arange(len(X)), labels] / np.where(own > 0, own, 1)
+    mean = mean / np.where(counts > 0, counts, 1)[None, :]
+    mean[np.arange(len(X)), labels] = np.inf
+    mean[:, counts == 0] = np.inf
+    b = mean.min(axis=1)
+    s = np.where(own > 0, (b - a) / np.maximum(np.maximum(a, b), 1e-12), 0.0)
+    return float(s.mean()) if np.isfinite(b).all() else 0.0
+
+
+# ─────────────────────────────────────────────────────────────────
+# 결과 묶음 (데이터 버전당 하나)
+# ─────────────────────────────────────────────────────────────────
+class ClusterSet:
+    """모든 k 에 대한 k-means·Ward 군집 결과"""
+
+    def __init__(self, store, ks=K_RANGE):
+        self.countries = np.asarray(store.countries, dtype=object)
+        self.types = tuple(store.types)
+        self._X = X = np.asarray(store.matrix, dtype=np.float64)
+        n = len(X)
+        self.ks = tuple(k for k in ks if k < n)
+        self.labels = {}
+        self.centroids = {}
+        self.scores = {}
+
+        with metrics.timer("clusters_kmeans"):
+            for k in self.ks:
+                labels, C, inertia = kmeans(X, k)
+                self._keep("kmeans", k, X, labels, C, inertia)
+
+        with metrics.timer("clusters_ward"):
+            if n > HIER_MAX_ROWS:
+                micro, centers, _ = kmeans(X, HIER_MICRO, n_init=1)
+                _, weights = _centroids(X, micro, len(centers))
+                # 끝까지 빈 작은 군집은 가중치가 0이 되지 않게 (가장 먼저 합쳐짐)
+                Z = ward_linkage(centers, np.maximum(weights, 1e-12))
+                for k in self.ks:
+                    labels = cut_tree(Z, len(centers), k)[micro]
+                    self._keep("ward", k, X, labels)
+            else:
+                Z = ward_linkage(X)
+                for k in self.ks:
+                    self._keep("ward", k, X, cut_tree(Z, n, k))
+        self.linkage = Z
+
+    def _keep(self, method, k, X, labels, C=None, inertia=None):
+        if C is None:
+            C, _ = _centroids(X, labels, k)
+            inertia = float(((X - C[labels]) ** 2).sum())
+        self.labels[method, k] = labels
+        self.centroids[method, k] = C
+        self.scores[method, k] = {"inertia": inertia, "silhouette": silhouette(X, labels, k)}
+
+    def best_k(self, method="kmeans") -> int:
+        """실루엣 점수가 가장 높은 k"""
+        return max(self.ks, key=lambda k: self.scores[method, k]["silhouette"])
+
+    def score_frame(self) -> pd.DataFrame:
+        rows = [{"method": m, "k": k, **s} for (m, k), s in self.scores.items()]
+        return pd.DataFrame(rows)
+
+    def centroid_frame(self, method, k) -> pd.DataFrame:
+        """군집 중심의 16유형 비율 (행: 군집)"""
+        return pd.DataFrame(self.centroids[method, k], columns=list(self.types)).rename_axis("cluster")
+
+    def members(self, method, k) -> list:
+        """군집별 나라 이름 배열"""
+        labels = self.labels[method, k]
+        return [self.countries[labels == c] for c in range(k)]
+
+    def nearest(self, method, k, m=5) -> list:
+        """군집별 중심에 가장 가까운 나라 m개 (이름, 거리)"""
+        labels = self.labels[method, k]
+        C = self.centroids[method, k]
+        out = []
+        for c in range(k):
+            rows = np.flatnonzero(labels == c)
+            d = np.sqrt(((self._X[rows] - C[c]) ** 2).sum(axis=1))
+            top = np.argsort(d, kind="stable")[:m]
+            out.append(pd.DataFrame({"Country": self.countries[rows[top]], "distance": d[top]}))
+        return out
+
+
+# ─────────────────────────────────────────────────────────────────
+# 백그라운드 계산 + 버전별 캐시
+# ─────────────────────────────────────────────────────────────────
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mbti-clusters")
+
+
+def _build(store) -> ClusterSet:
+    with metrics.timer("clusters_build"):
+        return ClusterSet(store)
+
+
+def _schedule(store):
+    """이 버전의 군집 계산 예약 (Future 는 store 에 보관되어 한 번만 예약됨)"""
+    return store.derived("clusters", lambda: _executor.submit(_build, store))
+
+
+def load_clusters(path=FILE_PATH, year=None, timeout=None):
+    """준비된 ClusterSet (timeout 초 안에 끝나지 않으면 None, 계산은 계속 진행)"""
+    future = _schedule(load_store(path, year))
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeout:
+        return None
+
+
+@on_reload
+def _reschedule(old, new, rows):
+    # 군집은 전체 분포에 따라 바뀌므로 점진 갱신 없이 새 버전을 백그라운드로 다시 계산
+    if any(key == "clusters" for key, _ in old.derived_items()):
+        _schedule(new)
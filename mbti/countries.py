@@ -0,0 +1,177 @@
+"""나라·지역 이름 인덱스 (정확 조회 + 별칭 + 접두어·삼중문자 검색).
+
+데이터 버전마다 한 번 만들어 모든 세션이 공유합니다.
+
+- `resolve(name)`: 이름·별칭 → 행 번호, 해시 조회 한 번 (O(1))
+  대소문자·악센트·구두점 차이는 무시 ("south-korea", "Türkiye" 등)
+- `search(query)`: 입력하는 대로 찾기
+  1) 이름·별칭의 단어 시작 접두어 (정렬된 키에서 이분 탐색)
+  2) 모자라면 삼중문자(trigram) 겹침으로 오타·부분 문자열 보완
+
+지역 단위(수만 행) 데이터에서도 페이지는 전체 목록 대신 검색 결과
+몇십 개만 selectbox 로 보여줍니다.
+"""
+import bisect
+import re
+import unicodedata
+
+import numpy as np
+
+from .data import FILE_PATH, load_store, on_reload
+
+# 같은 나라를 가리키는 이름 묶음 (데이터에 있는 이름이 대표 이름이 됨)
+ALIAS_GROUPS = (
+    ("South Korea", "Korea, Republic of", "Republic of Korea", "Korea", "대한민국", "한국"),
+    ("North Korea", "Korea, Democratic People's Republic of", "DPRK", "북한"),
+    ("United States", "United States of America", "USA", "US", "America", "미국"),
+    ("United Kingdom", "UK", "Great Britain", "Britain", "영국"),
+    ("Japan", "일본"),
+    ("China", "People's Republic of China", "중국"),
+    ("Russia", "Russian Federation", "러시아"),
+    ("Czech Republic", "Czechia"),
+    ("Congo (Kinshasa)", "Democratic Republic of the Congo", "Congo, Democratic Republic of the", "DR Congo", "DRC"),
+    ("Congo", "Republic of the Congo", "Congo (Brazzaville)"),
+    ("Macedonia", "North Macedonia"),
+    ("Moldova", "Moldova, Republic of", "Republic of Moldova"),
+    ("Tanzania", "Tanzania, United Republic of", "United Republic of Tanzania"),
+    ("Turkey", "Türkiye"),
+    ("Vietnam", "Viet Nam"),
+    ("Laos", "Lao People's Democratic Republic", "Lao PDR"),
+    ("Syria", "Syrian Arab Republic"),
+    ("Brunei", "Brunei Darussalam"),
+    ("Myanmar", "Burma"),
+    ("United Arab Emirates", "UAE"),
+    ("Iran", "Iran, Islamic Republic of"),
+    ("Bolivia", "Bolivia, Plurinational State of"),
+    ("Venezuela", "Venezuela, Bolivarian Republic of"),
+    ("Taiwan", "Taiwan, Province of China"),
+)
+
+# 페이지 기본 선택 나라 (별칭으로 찾으므로 데이터 표기가 달라도 됨)
+DEFAULT_COUNTRY = "South Korea"
+
+# 검색어 없이 전체 목록을 보여줄 최대 개수 / 검색 결과 개수
+LIST_MAX = 500
+SEARCH_LIMIT = 50
+
+
+def normalize(name: str) -> str:
+    """비교용 키: 소문자, 악센트 제거, 글자·숫자 외에는 공백 하나로"""
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r"[\W_]+", " ", text.casefold()).strip()
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CountryIndex:
+    """나라 이름 목록에 대한 조회·검색 인덱스 (저장소를 붙잡지 않음)"""
+
+    def __init__(self, countries, alias_groups=ALIAS_GROUPS):
+        self.countries = tuple(countries)
+        self.sorted_names = tuple(sorted(self.countries, key=normalize))
+
+        # 정규화 키 → 행 번호 (이름이 먼저, 별칭은 비어 있는 키만 채움)
+        self._row_of_key = {}
+        for row, name in enumerate(self.countries):
+            self._row_of_key.setdefault(normalize(name), row)
+        for group in alias_groups:
+            rows = [self._row_of_key[k] for k in map(normalize, group) if k in self._row_of_key]
+            if rows:
+                for key in map(normalize, group):
+                    self._row_of_key.setdefault(key, rows[0])
+
+        # 접두어 검색: 모든 키의 단어 시작 위치부터 자른 문자열을 정렬
+        entries = sorted(
+            (key[m.start():], row)
+            for key, row in self._row_of_key.items()
+            for m in re.finditer(r"\b\w", key)
+        )
+        self._prefix_keys = [e[0] for e in entries]
+        self._prefix_rows = np.fromiter((e[1] for e in entries), dtype=np.intp, count=len(entries))
+
+        # 삼중문자 → 행 번호 배열 (게시 목록)
+        postings = {}
+        for key, row in self._row_of_key.items():
+            for tri in _trigrams(key):
+                postings.setdefault(tri, set()).add(row)
+        self._postings = {tri: np.fromiter(rows, dtype=np.intp) for tri, rows in postings.items()}
+
+    def __len__(self):
+        return len(self.countries)
+
+    def resolve(self, name: str):
+        """이름·별칭 → 행 번호 (없으면 None)"""
+        return self._row_of_key.get(normalize(name))
+
+    def canonical(self, name: str):
+        """이름·별칭 → 데이터에 있는 대표 이름 (없으면 None)"""
+        row = self.resolve(name)
+        return None if row is None else self.countries[row]
+
+    def prefix(self, query: str, limit: int = 20) -> list:
+        """단어 시작이 query 로 시작하는 나라의 행 번호 (짧은 이름 먼저)"""
+        key = normalize(query)
+        if not key:
+            return []
+        lo = bisect.bisect_left(self._prefix_keys, key)
+        hi = bisect.bisect_left(self._prefix_keys, key + "\uffff", lo)
+        rows = np.unique(self._prefix_rows[lo:hi])
+        order = sorted(rows.tolist(), key=lambda r: (len(self.countries[r]), self.countries[r]))
+        return order[:limit]
+
+    def fuzzy(self, query: str, limit: int = 20, min_score: float = 0.3) -> list:
+        """삼중문자 겹침 비율이 높은 나라의 행 번호"""
+        grams = _trigrams(normalize(query))
+        lists = [self._postings[g] for g in grams if g in self._postings]
+        if not lists:
+            return []
+        hits = np.bincount(np.concatenate(lists), minlength=len(self.countries))
+        score = hits / len(grams)
+        rows = np.flatnonzero(score >= min_score)
+        rows = rows[np.argsort(-score[rows], kind="stable")]
+        return rows[:limit].tolist()
+
+    def search(self, query: str, limit: int = 20) -> list:
+        """입력 중인 query 에 맞는 대표 이름 목록 (정확·별칭 → 접두어 → 삼중문자 순)"""
+        rows = []
+        exact = self.resolve(query)
+        if exact is not None:
+            rows.append(exact)
+        for row in self.prefix(query, limit) + self.fuzzy(query, limit):
+            if len(rows) >= limit:
+                break
+            if row not in rows:
+                rows.append(row)
+        return [self.countries[r] for r in rows[:limit]]
+
+    def default(self, name: str = DEFAULT_COUNTRY) -> str:
+        """기본 선택 나라 (없으면 이름순 첫 나라)"""
+        return self.canonical(name) or self.sorted_names[0]
+
+    def choices(self, query: str = "", limit: int = SEARCH_LIMIT) -> list:
+        """selectbox 선택지: 검색어가 있으면 검색 결과, 없으면 전체(많으면 기본 나라만)"""
+        if query.strip():
+            return self.search(query, limit)
+        if len(self.sorted_names) <= LIST_MAX:
+            return list(self.sorted_names)
+        return [self.default()]
+
+
+def load_country_index(path=FILE_PATH, year=None) -> CountryIndex:
+    """공용 저장소의 나라 인덱스 (데이터 버전마다 한 번만 만듦)"""
+    store = load_store(path, year)
+    return store.derived("country_index", lambda: CountryIndex(store.countries))
+
+
+@on_reload
+def _carry_over(old, new, rows):
+    # 값만 바뀌고 나라 목록이 같으면 인덱스를 그대로 넘겨줌
+    if rows is None:
+        return
+    for key, index in old.derived_items():
+        if key == "country_index":
+            new.set_derived(key, index)
@@ -0,0 +1,252 @@
+"""국가별 MBTI 데이터 공용 저장소.
+
+CSV를 서버 프로세스당 한 번만 읽고(숫자 변환·검증은 `mbti.validate`), 16개 유형 비율을
+읽기 전용 연속 행렬(국가 × 유형)과 국가 인덱스로 보관합니다.
+모든 페이지는 `load_store()` / `load_data()` 로 같은 객체를 공유합니다.
+최신 바이너리 스냅샷(`mbti.snapshot`)이 있으면 CSV 대신 메모리 매핑으로 엽니다.
+
+CSV가 바뀌면(수정 시각·크기 → 내용 해시 순으로 확인) 새 저장소를 만들고
+이전 버전과 행 단위로 비교해서, 등록된 갱신 함수(`on_reload`)가 랭킹·그룹
+합계·유사도 구조를 바뀐 나라만 다시 계산해 새 버전에 넘겨줍니다. 새 버전은
+참조 하나를 바꿔 끼우는 방식으로 원자적으로 반영되므로 실행 중인 세션은
+다음 재실행부터 새 데이터를 봅니다.
+"""
+import hashlib
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+
+ROOT = Path(__file__).resolve().parent.parent
+FILE_PATH = ROOT / "countriesMBTI_16types.csv"
+
+# 16개 MBTI 유형 (검증용 기준 목록)
+MBTI_TYPES = (
+    "ISTJ", "ISFJ", "INFJ", "INTJ",
+    "ISTP", "ISFP", "INFP", "INTP",
+    "ESTP", "ESFP", "ENFP", "ENTP",
+    "ESTJ", "ESFJ", "ENFJ", "ENTJ",
+)
+
+
+# 파일 변경 확인 간격 (초)
+RELOAD_CHECK_SECONDS = 2.0
+
+# 살아있는 저장소 목록 (메모리 지표용)
+_stores = weakref.WeakSet()
+_derived_stats = {"hits": 0, "misses": 0}
+
+
+class MBTIStore:
+    """국가 × 16유형 비율 행렬 + 국가 인덱스 (읽기 전용)"""
+
+    def __init__(self, countries, types, matrix, version=None, report=None):
+        # 스냅샷(float32 memmap)은 그대로 공유하고, 그 외에는 float64 연속 배열로
+        if not (isinstance(matrix, np.ndarray) and matrix.dtype == np.float32):
+            matrix = np.asarray(matrix, dtype=np.float64)
+        matrix = np.ascontiguousarray(matrix)
+        matrix.setflags(write=False)
+
+        # 데이터 버전 (원본 CSV의 sha256) — 캐시 키·ETag 등에 사용
+        self.version = version
+        # 적재 시 검증 보고서 (`mbti.validate.clean_frame`)
+        self.report = report
+        self.countries = tuple(countries)
+        self.types = tuple(types)
+        self.matrix = matrix
+        self.row_of = {c: i for i, c in enumerate(self.countries)}
+        self.col_of = {t: j for j, t in enumerate(self.types)}
+        self._frame = None
+        self._derived = {}
+        # 키별 잠금 (파생 구조를 만들다가 다른 키의 파생 구조를 불러도 막히지 않게)
+        self._derived_lock = threading.Lock()
+        self._key_locks = {}
+        _stores.add(self)
+
+    def __len__(self):
+        return len(self.countries)
+
+    def column(self, mbti: str) -> np.ndarray:
+        """한 유형의 국가별 비율 (행렬의 읽기 전용 뷰)"""
+        return self.matrix[:, self.col_of[mbti]]
+
+    def profile(self, country: str) -> np.ndarray:
+        """한 나라의 16유형 비율 (행렬의 읽기 전용 뷰)"""
+        return self.matrix[self.row_of[country]]
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """`Country` + 16유형 컬럼의 DataFrame (한 번만 만들어 공유, 수정 금지)"""
+        if self._frame is None:
+            df = pd.DataFrame(self.matrix, columns=list(self.types))
+            df.insert(0, "Country", list(self.countries))
+            self._frame = df
+        return self._frame
+
+    def derived(self, key, build):
+        """이 데이터 버전에 딸린 파생 구조(랭킹·그룹 합계 등)를 한 번만 만들어 보관"""
+        value = self._derived.get(key)
+        if value is not None:
+            _derived_stats["hits"] += 1
+            return value
+        with self._derived_lock:
+            lock = self._key_locks.setdefault(key, threading.Lock())
+        with lock:
+            value = self._derived.get(key)
+            if value is None:
+                _derived_stats["misses"] += 1
+                value = self._derived[key] = build()
+        return value
+
+    def derived_items(self):
+        """이미 만들어 둔 (key, 파생 구조) 목록"""
+        return list(self._derived.items())
+
+    def set_derived(self, key, value):
+        with self._derived_lock:
+            self._derived.setdefault(key, value)
+
+
+def content_hash(path) -> str:
+    """파일 내용의 sha256 (데이터 버전)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_csv(path) -> MBTIStore:
+    from .validate import clean_frame, read_csv
+
+    with metrics.timer("csv_parse"):
+        df = read_csv(path)
+    # 숫자 변환·행 합계 검사·중복 제거는 여기서 한 번만
+    with metrics.timer("coerce"):
+        countries, types, matrix, report = clean_frame(df)
+    return MBTIStore(countries, types, matrix, version=content_hash(path), report=report)
+
+
+def _open(path: str) -> MBTIStore:
+    from .snapshot import open_snapshot
+
+    snap = open_snapshot(path)
+    if snap is not None:
+        countries, types, matrix, version, report = snap
+        return MBTIStore(countries, types, matrix, version=version, report=report)
+    return _read_csv(path)
+
+
+def diff_rows(old: MBTIStore, new: MBTIStore):
+    """값이 바뀐 행 번호 배열. 나라 목록·유형·자료형이 달라 행 단위 비교가 안 되면 None"""
+    if (
+        old.countries != new.countries
+        or old.types != new.types
+        or old.matrix.dtype != new.matrix.dtype
+    ):
+        return None
+    return np.flatnonzero((old.matrix != new.matrix).any(axis=1))
+
+
+# 경로 → 현재 저장소, 마지막 확인 정보
+_current = {}
+_checked = {}
+_reload_hooks = []
+_load_lock = threading.Lock()
+
+
+def on_reload(hook):
+    """hook(old, new, rows): 데이터가 바뀔 때 old 의 파생 구조를 new 로 넘겨주는 함수 등록
+
+    rows 는 바뀐 행 번호(행 단위 비교가 안 되면 None → 전체 재계산).
+    """
+    _reload_hooks.append(hook)
+    return hook
+
+
+def _stat(path: str):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _reload(key: str, old: MBTIStore) -> MBTIStore:
+    new = _open(key)
+    if new.version == old.version:
+        return old
+    rows = diff_rows(old, new)
+    for hook in _reload_hooks:
+        try:
+            hook(old, new, rows)
+        except Exception:
+            # 점진 갱신에 실패해도 새 버전은 필요할 때 전체 재계산으로 채워짐
+            pass
+    return new
+
+
+def load_store(path=FILE_PATH, year=None) -> MBTIStore:
+    """프로세스 전체에서 공유하는 저장소 (같은 경로는 한 번만 읽고, 파일이 바뀌면 새 버전)
+
+    year 를 주면 연도별 저장소(`mbti.timeseries`)의 그해 데이터를 돌려줍니다.
+    """
+    if year is not None:
+        from .timeseries import load_year_store
+
+        return load_year_store(year, path)
+    key = str(Path(path).resolve())
+    store = _current.get(key)
+    now = time.monotonic()
+    last = _checked.get(key)
+    if store is not None and now - last[0] < RELOAD_CHECK_SECONDS:
+        return store
+
+    with _load_lock:
+        store = _current.get(key)
+        stat = _stat(key)
+        if store is None:
+            store = _open(key)
+        elif stat != _checked[key][1]:
+            try:
+                store = _reload(key, store)
+            except Exception:
+                # 쓰는 중이거나 깨진 파일이면 이전 버전을 유지 (다음 변경 때 다시 시도)
+                pass
+        _checked[key] = (now, stat)
+        _current[key] = store
+    return store
+
+
+def clear_cache():
+    """모든 저장소 캐시 비우기 (다음 호출 때 새로 읽음)"""
+    with _load_lock:
+        _current.clear()
+        _checked.clear()
+
+
+def _memory_bytes() -> dict:
+    stores = list(_stores)
+    return {
+        "matrix": sum(s.matrix.nbytes for s in stores),
+        "frame": sum(int(s._frame.memory_usage(deep=True).sum()) for s in stores if s._frame is not None),
+    }
+
+
+def data_version(path=FILE_PATH, year=None) -> str:
+    """현재 데이터 버전 (캐시 키용)"""
+    return load_store(path, year).version
+
+
+def load_data(path=FILE_PATH, year=None):
+    """기존 페이지용: (df, mbti_cols) 반환. df는 공유 객체이므로 수정하지 마세요."""
+    store = load_store(path, year)
+    return store.frame, list(store.types)
+
+
+metrics.register_cache("data.derived", lambda: dict(_derived_stats))
+metrics.register_gauge("data_matrix_bytes", lambda: _memory_bytes()["matrix"])
+metrics.register_gauge("data_frame_bytes", lambda: _memory_bytes()["frame"])
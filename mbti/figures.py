@@ -0,0 +1,88 @@
+"""페이지 간 공유하는 그래프 스펙 캐시 (크기 제한 LRU).
+
+(페이지, 그래프 종류, 선택값, 데이터 버전) 키마다 Plotly/Altair 그래프를
+직렬화한 JSON 스펙을 한 번만 만들어 두고, 모든 세션이 같은 스펙을 씁니다.
+캐시가 `max_bytes` 를 넘으면 가장 오래 안 쓴 항목부터 버립니다.
+
+    spec = cached_figure(("01", "bar", country, version), lambda: px.bar(...))
+    st.plotly_chart(spec)          # Plotly: dict 그대로 전달
+    st.vega_lite_chart(spec)       # Altair: Vega-Lite 스펙으로 전달
+"""
+import json
+import threading
+from collections import OrderedDict
+
+from . import metrics
+
+DEFAULT_MAX_BYTES = 32 << 20
+
+
+class FigureCache:
+    """직렬화된 그래프 스펙 LRU (스레드 안전, 바이트 크기 기준 축출)"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            spec = self._items.get(key)
+            if spec is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return spec
+
+    def put(self, key, spec: str):
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = spec
+            self.size += len(spec)
+            while self.size > self.max_bytes and len(self._items) > 1:
+                _, dropped = self._items.popitem(last=False)
+                self.size -= len(dropped)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+# 프로세스 전체에서 하나만 사용
+figure_cache = FigureCache()
+
+
+def cached_figure(key: tuple, build) -> dict:
+    """key 의 그래프 스펙(dict). 없으면 build() 로 만든 Plotly/Altair 객체를 직렬화해 저장
+
+    key 에는 데이터 버전을 꼭 넣으세요. 반환값은 매번 새 dict 라서 수정해도 됩니다.
+    """
+    spec = figure_cache.get(key)
+    if spec is None:
+        with metrics.timer("figure_build"):
+            spec = build().to_json()
+        figure_cache.put(key, spec)
+    return json.loads(spec)
+
+
+metrics.register_cache("figures.spec", figure_cache.stats)
@@ -0,0 +1,171 @@
+"""MBTI 기질 그룹 정의와 그룹 합계 계산.
+
+그룹 집합은 16 × G 소속 행렬(유형이 그룹에 속하면 1)로 표현하고,
+모든 그룹 합계를 `국가 × 16` 행렬과의 행렬곱 한 번으로 구합니다.
+글자 조합으로 그룹을 자동 생성할 수도 있습니다.
+
+    E, I, S, N, …          한 축 그룹 8개
+    ES, EN, NF, SJ, …      두 축 조합 24개
+    EST, ENF, NFP, …       세 축 조합 32개
+
+데이터가 바뀌면 바뀐 나라의 행만 다시 곱합니다(`GroupTable.updated`).
+"""
+import threading
+from collections import OrderedDict
+from itertools import combinations, product
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .data import FILE_PATH, MBTI_TYPES, load_store, on_reload
+
+# ─────────────────────────────────────────────────────────────────
+# 기질 그룹 정의
+# SJ(ISTJ, ISFJ, ESTJ, ESFJ), SP(ISTP, ISFP, ESTP, ESFP),
+# NF(INFJ, INFP, ENFJ, ENFP), NT(INTJ, INTP, ENTJ, ENTP),
+# ST(ISTJ, ESTJ, ISTP, ESTP)  ← SJ와 SP에 걸쳐있는 ST 네 가지 합
+# ─────────────────────────────────────────────────────────────────
+GROUPS = {
+    "NF": ["INFJ", "INFP", "ENFJ", "ENFP"],
+    "NT": ["INTJ", "INTP", "ENTJ", "ENTP"],
+    "SJ": ["ISTJ", "ISFJ", "ESTJ", "ESFJ"],
+    "SP": ["ISTP", "ISFP", "ESTP", "ESFP"],
+    "ST": ["ISTJ", "ESTJ", "ISTP", "ESTP"],
+}
+
+# 네 축 (MBTI 문자열의 자리 순서)
+AXES = ("EI", "SN", "TF", "JP")
+
+
+def derive_groups(sizes=(1, 2, 3)) -> dict:
+    """글자 조합 그룹 자동 생성: {"E": [...], "NF": [...], "INT": [...], ...}
+
+    그룹 이름의 글자는 축 순서(E/I → S/N → T/F → J/P)를 따르므로
+    "NF", "SJ", "ST" 처럼 기존 GROUPS 이름과 같아집니다.
+    """
+    groups = {}
+    for size in sizes:
+        for axes in combinations(range(len(AXES)), size):
+            for letters in product(*(AXES[a] for a in axes)):
+                name = "".join(letters)
+                groups[name] = [
+                    t for t in MBTI_TYPES
+                    if all(t[a] == ch for a, ch in zip(axes, letters))
+                ]
+    return groups
+
+
+def membership_matrix(types, groups) -> np.ndarray:
+    """유형 × 그룹 소속 행렬 (행 순서는 types, 열 순서는 groups)"""
+    col_of = {t: i for i, t in enumerate(types)}
+    M = np.zeros((len(col_of), len(groups)), dtype=np.float64)
+    for j, (g, cols) in enumerate(groups.items()):
+        missing = [c for c in cols if c not in col_of]
+        if missing:
+            raise ValueError(f"{g} 그룹에 필요한 컬럼이 없습니다: {missing}")
+        M[[col_of[c] for c in cols], j] = 1.0
+    return M
+
+
+def group_totals(store, groups=GROUPS) -> np.ndarray:
+    """국가 × 그룹 비율 합계 행렬 (열 순서는 groups 순서, 행렬곱 한 번)"""
+    return store.matrix @ membership_matrix(store.types, groups).astype(store.matrix.dtype)
+
+
+class GroupTable:
+    """여러 그룹의 국가별 합계를 한 번에 계산해 둔 표"""
+
+    def __init__(self, store, groups=GROUPS):
+        self.store = store
+        self.groups = {g: list(cols) for g, cols in groups.items()}
+        self.names = tuple(self.groups)
+        self.col_of = {g: j for j, g in enumerate(self.names)}
+        with metrics.timer("group_sum"):
+            self.values = group_totals(store, self.groups)
+        self.values.setflags(write=False)
+
+    def updated(self, store, rows) -> "GroupTable":
+        """바뀐 rows 의 그룹 합계만 다시 계산한 새 표 (나라 목록이 같은 새 저장소용)"""
+        new = GroupTable.__new__(GroupTable)
+        new.store = store
+        new.groups, new.names, new.col_of = self.groups, self.names, self.col_of
+        values = self.values.copy()
+        M = membership_matrix(store.types, self.groups).astype(store.matrix.dtype)
+        values[rows] = store.matrix[rows] @ M
+        values.setflags(write=False)
+        new.values = values
+        return new
+
+    def column(self, group: str) -> np.ndarray:
+        return self.values[:, self.col_of[group]]
+
+    def top_frame(self, group: str, k: int, value_name=None) -> pd.DataFrame:
+        """group 합계가 높은 상위 k개 국가 (`Country` / group 또는 value_name)"""
+        values = self.column(group)
+        k = min(k, len(values))
+        part = np.argpartition(-values, k - 1)[:k] if k else np.arange(0)
+        rows = part[np.argsort(-values[part], kind="stable")]
+        return pd.DataFrame({
+            "Country": np.asarray(self.store.countries, dtype=object)[rows],
+            value_name or group: values[rows],
+        })
+
+
+def _freeze(groups) -> tuple:
+    return tuple((g, tuple(cols)) for g, cols in groups.items())
+
+
+# 버전마다 보관할 그룹 합계 표 수 (페이지 03 사용자 그룹은 유형 조합마다 표가 생기므로 상한)
+MAX_TABLES = 32
+
+
+class RecentTables:
+    """그룹 집합 → GroupTable, 최근에 쓴 MAX_TABLES 개만 남김 (스레드 안전)"""
+
+    def __init__(self, max_tables=MAX_TABLES):
+        self.max_tables = max_tables
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, build) -> GroupTable:
+        with self._lock:
+            table = self._items.get(key)
+            if table is None:
+                table = build()
+            self._put(key, table)
+            return table
+
+    def put(self, key, table):
+        with self._lock:
+            self._put(key, table)
+
+    def _put(self, key, table):
+        self._items[key] = table
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_tables:
+            self._items.popitem(last=False)
+
+    def items(self):
+        with self._lock:
+            return list(self._items.items())
+
+
+def load_group_table(groups=GROUPS, path=FILE_PATH, year=None) -> GroupTable:
+    """공용 저장소에 대한 그룹 합계 표 (데이터 버전·그룹 집합마다 한 번만 계산, 최근 MAX_TABLES 개)"""
+    store = load_store(path, year)
+    tables = store.derived("group_tables", RecentTables)
+    return tables.get(_freeze(groups), lambda: GroupTable(store, groups))
+
+
+@on_reload
+def _carry_over(old, new, rows):
+    tables = dict(old.derived_items()).get("group_tables")
+    if rows is None or tables is None:
+        return
+    carried = new.derived("group_tables", RecentTables)
+    for key, table in tables.items():
+        carried.put(key, table.updated(new, rows))
@@ -0,0 +1,162 @@
+"""응답자 단위 원자료 → 국가별 16유형 비율 CSV (청크 스트리밍 집계).
+
+원자료는 한 줄이 응답자 한 명인 (국가, 유형) 파일이며 수천만 행일 수
+있어서 통째로 읽지 않습니다. 파일마다 `CHUNK_ROWS` 행씩 읽으면서 국가 ×
+16유형 정수 개수 배열에 더해 가므로, 메모리는 입력 크기와 상관없이
+(청크 하나 + 국가 수 × 16) 로 묶입니다. 여러 파일은 워커 프로세스에
+나눠 세고, 부분 개수를 국가 이름 기준으로 합친 뒤 페이지가 읽는 비율
+CSV(`Country` + 16유형)로 씁니다.
+
+    python -m mbti.ingest raw/2026_*.csv.gz -o countriesMBTI_16types.csv
+    python -m mbti.ingest raw.csv --country-col nation --type-col mbti --workers 8
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data import FILE_PATH, MBTI_TYPES
+
+# 한 번에 읽는 행 수 (두 문자열 열 기준 청크당 대략 수십 MB)
+CHUNK_ROWS = 1_000_000
+
+_TYPE_INDEX = pd.Index(MBTI_TYPES)
+
+
+class Counts:
+    """국가 × 16유형 응답자 수 (국가가 새로 나오면 행을 늘림)"""
+
+    def __init__(self):
+        self.countries = []
+        self.row_of = {}
+        self.counts = np.zeros((64, len(MBTI_TYPES)), dtype=np.int64)
+        self.skipped = 0
+        self.rows_read = 0
+
+    def _rows(self, names) -> np.ndarray:
+        """국가 이름 배열(청크 고유값) → 행 번호 (처음 보는 나라는 추가)"""
+        rows = np.empty(len(names), dtype=np.intp)
+        for i, name in enumerate(names):
+            row = self.row_of.get(name)
+            if row is None:
+                row = self.row_of[name] = len(self.countries)
+                self.countries.append(name)
+            rows[i] = row
+        if len(self.countries) > len(self.counts):
+            grown = np.zeros((2 * len(self.countries), self.counts.shape[1]), dtype=np.int64)
+            grown[: len(self.counts)] = self.counts
+            self.counts = grown
+        return rows
+
+    def add_chunk(self, country: pd.Series, mbti: pd.Series):
+        """청크 하나를 개수에 더함 (빈 국가·알 수 없는 유형은 건너뜀)"""
+        country = country.astype(str).str.strip()
+        # "INFJ-T" 처럼 정체성 접미사가 붙은 값도 앞 네 글자로 셈
+        cols = _TYPE_INDEX.get_indexer(mbti.astype(str).str.strip().str.upper().str[:4])
+        ok = (cols >= 0) & country.ne("").to_numpy()
+        self.rows_read += len(ok)
+        self.skipped += int(len(ok) - ok.sum())
+
+        codes, names = pd.factorize(country[ok])
+        rows = self._rows(names)[codes]
+        n_types = self.counts.shape[1]
+        flat = np.bincount(rows * n_types + cols[ok], minlength=len(self.countries) * n_types)
+        self.counts[: len(self.countries)] += flat.reshape(-1, n_types)
+
+    def merge(self, other: "Counts") -> "Counts":
+        # other.countries 는 중복이 없으므로 행 번호도 겹치지 않음
+        rows = self._rows(other.countries)
+        self.counts[rows] += other.table
+        self.skipped += other.skipped
+        self.rows_read += other.rows_read
+        return self
+
+    @property
+    def table(self) -> np.ndarray:
+        return self.counts[: len(self.countries)]
+
+
+def count_file(path, country_col="Country", type_col="MBTI", chunk_rows=CHUNK_ROWS) -> Counts:
+    """파일 하나를 청크로 읽어 센 개수 (워커 프로세스에서 실행)"""
+    counts = Counts()
+    reader = pd.read_csv(
+        path,
+        usecols=[country_col, type_col],
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunk_rows,
+        encoding="utf-8-sig",
+    )
+    with reader:
+        for chunk in reader:
+            counts.add_chunk(chunk[country_col], chunk[type_col])
+    return counts
+
+
+def _merge(parts) -> Counts:
+    merged = Counts()
+    for part in parts:
+        merged.merge(part)
+    return merged
+
+
+def aggregate(paths, country_col="Country", type_col="MBTI", workers=None, chunk_rows=CHUNK_ROWS) -> Counts:
+    """여러 원자료 파일을 워커 프로세스로 나눠 세고 합친 개수"""
+    paths = [str(p) for p in paths]
+    if not paths:
+        raise ValueError("입력 파일이 없습니다.")
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    args = ([country_col] * len(paths), [type_col] * len(paths), [chunk_rows] * len(paths))
+    if workers == 1:
+        return _merge(map(count_file, paths, *args))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _merge(pool.map(count_file, paths, *args))
+
+
+def ratio_frame(counts: Counts, min_respondents: int = 1) -> pd.DataFrame:
+    """개수 → 페이지가 읽는 비율 표 (`Country` + 16유형, 국가 이름순)"""
+    table = counts.table
+    totals = table.sum(axis=1)
+    keep = totals >= max(min_respondents, 1)
+    ratios = table[keep] / totals[keep, None]
+    df = pd.DataFrame(ratios, columns=list(MBTI_TYPES))
+    df.insert(0, "Country", np.asarray(counts.countries, dtype=object)[keep])
+    return df.sort_values("Country", kind="stable").reset_index(drop=True)
+
+
+def write_ratios(df: pd.DataFrame, out) -> Path:
+    """비율 CSV를 임시 파일에 쓴 뒤 교체 (핫 리로드가 반쯤 쓴 파일을 읽지 않도록)"""
+    out = Path(out)
+    tmp = out.with_name(out.name + ".tmp")
+    df.to_csv(tmp, index=False, encoding="utf-8-sig")
+    os.replace(tmp, out)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="응답자 원자료 → 국가별 MBTI 비율 CSV")
+    parser.add_argument("inputs", nargs="+", help="원자료 CSV (압축 파일 가능)")
+    parser.add_argument("-o", "--out", default=str(FILE_PATH), help="출력 비율 CSV")
+    parser.add_argument("--country-col", default="Country")
+    parser.add_argument("--type-col", default="MBTI")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 수, 파일 수 이하)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("--min-respondents", type=int, default=1, help="이보다 응답자가 적은 나라는 제외")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    counts = aggregate(args.inputs, args.country_col, args.type_col, args.workers, args.chunk_rows)
+    df = ratio_frame(counts, args.min_respondents)
+    out = write_ratios(df, args.out)
+    print(
+        f"{counts.rows_read:,}행 읽음 (건너뜀 {counts.skipped:,}) → {len(df)}개 나라, "
+        f"{time.perf_counter() - t0:.1f}초: {out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""가벼운 성능 계측: 단계별 타이머, 캐시 적중률, 메모리, 파일 내보내기.
+
+    with timer("csv_parse"):
+        ...
+
+    @timed("sort")
+    def build(): ...
+
+환경 변수 `MBTI_METRICS=1` 일 때만 켜집니다. 꺼져 있으면 `timer()` 는
+공용 no-op 객체를 돌려주고 `timed` 함수는 bool 검사 한 번만 하므로
+오버헤드가 거의 없습니다. `MBTI_METRICS_FILE` 을 주면 주기적으로
+Prometheus 텍스트(.prom) 또는 JSONL(.jsonl) 로 내보냅니다.
+"""
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+# 히스토그램 구간 상한 (ms)
+BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float("inf"))
+
+_enabled = os.environ.get("MBTI_METRICS", "") not in ("", "0")
+_lock = threading.Lock()
+_histograms = {}
+_caches = {}
+_gauges = {}
+_exporter = None
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def set_enabled(on: bool):
+    global _enabled
+    _enabled = bool(on)
+
+
+class Histogram:
+    """단계 하나의 소요 시간 분포 (ms)"""
+
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(BUCKETS_MS)
+
+    def observe(self, ms: float):
+        self.count += 1
+        self.total += ms
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    def quantile(self, q: float) -> float:
+        """구간 상한 기준 근사 분위수"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for upper, n in zip(BUCKETS_MS, self.buckets):
+            seen += n
+            if seen >= target:
+                return upper
+        return BUCKETS_MS[-1]
+
+
+def observe(phase: str, ms: float):
+    with _lock:
+        hist = _histograms.get(phase)
+        if hist is None:
+            hist = _histograms[phase] = Histogram()
+        hist.observe(ms)
+
+
+class _Timer:
+    __slots__ = ("phase", "t0")
+
+    def __init__(self, phase):
+        self.phase = phase
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.phase, (time.perf_counter() - self.t0) * 1000)
+        return False
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopTimer()
+
+
+def timer(phase: str):
+    """단계 시간 측정 컨텍스트 매니저 (꺼져 있으면 no-op)"""
+    return _Timer(phase) if _enabled else _NOOP
+
+
+def timed(phase: str):
+    """함수 전체 시간을 phase 로 측정하는 데코레이터"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Timer(phase):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ─────────────────────────────────────────────────────────────────
+# 캐시·메모리: 값은 내보낼 때만 읽음 (평소 오버헤드 없음)
+# ─────────────────────────────────────────────────────────────────
+def register_cache(name: str, info):
+    """info: functools.lru_cache 함수 또는 {"hits", "misses"} dict 를 돌려주는 함수"""
+    _caches[name] = info
+
+
+def register_gauge(name: str, read):
+    """read(): 현재 값(숫자)을 돌려주는 함수 (예: 데이터 메모리 바이트)"""
+    _gauges[name] = read
+
+
+def _cache_stats(info) -> dict:
+    if hasattr(info, "cache_info"):
+        ci = info.cache_info()
+        return {"hits": ci.hits, "misses": ci.misses, "size": ci.currsize}
+    return dict(info())
+
+
+def snapshot() -> dict:
+    """현재 지표 전체 (관리자 페이지·내보내기용)"""
+    with _lock:
+        phases = {
+            name: {
+                "count": h.count,
+                "sum_ms": h.total,
+                "mean_ms": h.total / h.count if h.count else 0.0,
+                "p50_ms": h.quantile(0.5),
+                "p95_ms": h.quantile(0.95),
+                "buckets": dict(zip(map(str, BUCKETS_MS), h.buckets)),
+            }
+            for name, h in _histograms.items()
+        }
+    gauges = {}
+    for name, read in _gauges.items():
+        try:
+            gauges[name] = read()
+        except Exception:
+            gauges[name] = None
+    return {
+        "time": time.time(),
+        "enabled": _enabled,
+        "phases": phases,
+        "caches": {name: _cache_stats(info) for name, info in _caches.items()},
+        "gauges": gauges,
+    }
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+
+
+def to_prometheus(snap=None) -> str:
+    snap = snap or snapshot()
+    lines = ["# TYPE mbti_phase_ms histogram"]
+    for name, p in snap["phases"].items():
+        cumulative = 0
+        for upper, n in p["buckets"].items():
+            cumulative += n
+            le = "+Inf" if upper == "inf" else upper
+            lines.append(f'mbti_phase_ms_bucket{{phase="{name}",le="{le}"}} {cumulative}')
+        lines.append(f'mbti_phase_ms_sum{{phase="{name}"}} {p["sum_ms"]}')
+        lines.append(f'mbti_phase_ms_count{{phase="{name}"}} {p["count"]}')
+    lines.append("# TYPE mbti_cache_total counter")
+    for name, c in snap["caches"].items():
+        lines.append(f'mbti_cache_total{{cache="{name}",result="hit"}} {c["hits"]}')
+        lines.append(f'mbti_cache_total{{cache="{name}",result="miss"}} {c["misses"]}')
+    lines.append("# TYPE mbti_gauge gauge")
+    for name, v in snap["gauges"].items():
+        if v is not None:
+            lines.append(f'mbti_gauge{{name="{name}"}} {v}')
+    return "\n".join(lines) + "\n"
+
+
+def export(path):
+    """path 가 .jsonl 이면 한 줄 추가, 아니면 Prometheus 텍스트로 덮어쓰기"""
+    path = str(path)
+    snap = snapshot()
+    if path.endswith(".jsonl"):
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(snap, ensure_ascii=False) + "\n")
+    else:
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(to_prometheus(snap))
+        os.replace(tmp, path)
+
+
+def start_exporter(path, interval: float = 15.0):
+    """백그라운드 스레드로 interval 초마다 export(path) (프로세스당 한 번)"""
+    global _exporter
+    if _exporter is not None:
+        return _exporter
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            export(path)
+
+    _exporter = threading.Thread(target=loop, name="mbti-metrics-exporter", daemon=True)
+    _exporter.start()
+    return _exporter
+
+
+if _enabled and os.environ.get("MBTI_METRICS_FILE"):
+    start_exporter(os.environ["MBTI_METRICS_FILE"], float(os.environ.get("MBTI_METRICS_INTERVAL", "15")))
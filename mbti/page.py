@@ -0,0 +1,32 @@
+"""모든 페이지가 맨 앞에서 부르는 공통 준비 단계.
+
+페이지마다 같은 코드를 붙여 두면 서로 어긋나기 쉬워서 한곳에 모았습니다.
+
+    from mbti.page import rank_intervals, setup
+    year = setup()                   # 워밍업 + 연도 선택 (연도 저장소가 없으면 None)
+    setup(year_select=False)         # 연도와 상관없는 페이지 (main, 관리자)
+    intervals = rank_intervals(year) # 순위 구간 (없으면 순위 표만)
+"""
+import streamlit as st
+
+from .bootstrap import load_rank_intervals
+from .timeseries import available_years
+from .warmup import start_warmup
+
+
+def setup(year_select: bool = True):
+    """공용 캐시 백그라운드 워밍업 시작 + 연도 선택 → 고른 연도 (또는 None)
+
+    워밍업은 프로세스당 한 번만 돌고 요청을 막지 않습니다. 연도 선택은
+    연도별 저장소가 있을 때만 보이고, 기본은 최신 연도입니다.
+    """
+    start_warmup()
+    if not year_select:
+        return None
+    years = available_years()
+    return st.selectbox("📅 연도", years[::-1]) if years else None
+
+
+def rank_intervals(year=None):
+    """부트스트랩 순위 구간 (백그라운드 계산, 아직이거나 실패했으면 None — 페이지는 기다리지 않음)"""
+    return load_rank_intervals(year=year, timeout=0)
@@ -0,0 +1,176 @@
+"""전체 순위 보기: 서버에서 페이지 단위로 잘라 보내기 + 큰 그래프 대체.
+
+"전체 순위" 모드는 158개 나라(지역 단위면 수천~수만 행)를 한 번에 보내지
+않고, 랭킹 인덱스의 정렬 순서(`RankIndex.order`)에서 보고 있는 페이지의
+행만 잘라 표로 보냅니다(`page_frame`). 한 페이지는 최대 `MAX_PAGE_SIZE` 행.
+
+그래프도 크기에 따라 바꿉니다.
+
+- 페이지 그래프: 막대가 `BAR_MAX` 개 이하면 막대, 넘으면 WebGL 점(Scattergl)
+- 전체 개요: 나라가 `WEBGL_MAX_POINTS` 개 이하면 WebGL 점, 넘으면 순위 구간
+  `AGG_BUCKETS` 개의 평균·최소·최대 띠로 집계 (보내는 점 수가 행 수와 무관)
+
+상호작용마다 브라우저로 가는 표·그래프 크기는 `payload()` 로 재고,
+누적 통계는 지표(`paging.*` 게이지)로 내보냅니다.
+"""
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+from . import metrics
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+PAGE_SIZES = (10, 25, 50, 100)
+MAX_PAGE_SIZE = 100
+BAR_MAX = 50
+WEBGL_MAX_POINTS = 5000
+AGG_BUCKETS = 200
+
+
+# ─────────────────────────────────────────────────────────────────
+# 페이지 자르기
+# ─────────────────────────────────────────────────────────────────
+def n_pages(ranks, size: int) -> int:
+    size = max(1, min(int(size), MAX_PAGE_SIZE))
+    return max(1, -(-len(ranks.countries) // size))
+
+
+def page_of(ranks, key: str, row: int, size: int) -> int:
+    """row 나라가 들어 있는 페이지 번호 (1부터)"""
+    position = int(np.flatnonzero(ranks.order[:, ranks.col_of[key]] == row)[0])
+    return position // max(1, min(int(size), MAX_PAGE_SIZE)) + 1
+
+
+def page_rows(ranks, key: str, page: int, size: int):
+    """key 순위의 page 번째 페이지 → (행 번호 배열, 첫 행의 0부터 시작하는 순위)"""
+    size = max(1, min(int(size), MAX_PAGE_SIZE))
+    page = max(1, min(int(page), n_pages(ranks, size)))
+    start = (page - 1) * size
+    return ranks.order[start:start + size, ranks.col_of[key]], start
+
+
+def page_frame(ranks, key: str, page: int, size: int, value_name=None) -> pd.DataFrame:
+    """key 순위의 page 번째 페이지 (`순위` / `Country` / key 컬럼, 최대 MAX_PAGE_SIZE 행)"""
+    rows, start = page_rows(ranks, key, page, size)
+    j = ranks.col_of[key]
+    return pd.DataFrame({
+        "순위": np.arange(start + 1, start + len(rows) + 1),
+        "Country": ranks.countries[rows],
+        value_name or key: ranks.values[rows, j],
+    })
+
+
+# ─────────────────────────────────────────────────────────────────
+# 그래프 (plotly 는 그릴 때만 불러옴)
+# ─────────────────────────────────────────────────────────────────
+def page_chart(frame: pd.DataFrame, key: str, value_col: str):
+    """페이지 한 장 그래프: BAR_MAX 이하 막대, 넘으면 WebGL 점"""
+    import plotly.graph_objects as go
+
+    percent = (frame[value_col].to_numpy() * 100).round(2)
+    if len(frame) <= BAR_MAX:
+        fig = go.Figure(go.Bar(
+            x=percent[::-1], y=frame["Country"].to_numpy()[::-1], orientation="h",
+            marker_color="#4C9AFF", hovertemplate="%{y}: %{x}%<extra></extra>",
+        ))
+        fig.update_layout(height=max(300, 22 * len(frame) + 80), xaxis_title="비율(%)", yaxis_title="국가")
+    else:
+        fig = go.Figure(go.Scattergl(
+            x=frame["순위"], y=percent, mode="markers", text=frame["Country"],
+            marker=dict(size=7, color="#4C9AFF"), hovertemplate="%{x}위 %{text}: %{y}%<extra></extra>",
+        ))
+        fig.update_layout(height=420, xaxis_title="순위", yaxis_title="비율(%)")
+    fig.update_layout(
+        title=f"{key} 비율 {int(frame['순위'].iloc[0])}–{int(frame['순위'].iloc[-1])}위",
+        margin=dict(l=80, r=30, t=60, b=40),
+    )
+    return fig
+
+
+def overview_chart(ranks, key: str):
+    """전체 순위 개요: WEBGL_MAX_POINTS 이하 WebGL 점, 넘으면 순위 구간별 평균·최소·최대"""
+    import plotly.graph_objects as go
+
+    j = ranks.col_of[key]
+    order = ranks.order[:, j]
+    values = ranks.values[order, j] * 100
+    n = len(values)
+    if n <= WEBGL_MAX_POINTS:
+        fig = go.Figure(go.Scattergl(
+            x=np.arange(1, n + 1), y=values.round(3), mode="markers", text=ranks.countries[order],
+            marker=dict(size=5, color="#7C8DB5"), hovertemplate="%{x}위 %{text}: %{y}%<extra></extra>",
+        ))
+        title = f"{key} 전체 {n}개 나라 순위"
+    else:
+        edges = np.unique(np.linspace(0, n, AGG_BUCKETS + 1).astype(np.intp))[:-1]
+        counts = np.diff(np.append(edges, n))
+        mean = np.add.reduceat(values, edges) / counts
+        # 내림차순이므로 구간의 첫 값이 최대, 마지막 값이 최소
+        hi, lo = values[edges], values[np.append(edges[1:], n) - 1]
+        x = edges + 1
+        fig = go.Figure([
+            go.Scatter(x=x, y=hi, mode="lines", line=dict(width=0), hoverinfo="skip", showlegend=False),
+            go.Scatter(x=x, y=lo, mode="lines", line=dict(width=0), fill="tonexty",
+                       fillcolor="rgba(124,141,181,0.3)", name="최소–최대"),
+            go.Scatter(x=x, y=mean, mode="lines", line=dict(color="#4C5B85"), name="구간 평균"),
+        ])
+        title = f"{key} 전체 {n:,}개 순위 (구간 {len(edges)}개로 집계)"
+    fig.update_layout(title=title, xaxis_title="순위", yaxis_title="비율(%)", height=320,
+                      margin=dict(l=60, r=30, t=60, b=40))
+    return fig
+
+
+def highlight(spec: dict, start: int, stop: int) -> dict:
+    """캐시된 개요 스펙(dict)에 지금 페이지의 순위 범위 음영 추가 (start–stop, 1부터)"""
+    spec.setdefault("layout", {})["shapes"] = [{
+        "type": "rect", "xref": "x", "yref": "paper", "x0": start - 0.5, "x1": stop + 0.5, "y0": 0, "y1": 1,
+        "fillcolor": "rgba(255,170,0,0.2)", "line": {"width": 0},
+    }]
+    return spec
+
+
+# ─────────────────────────────────────────────────────────────────
+# 전송량 측정
+# ─────────────────────────────────────────────────────────────────
+_lock = threading.Lock()
+_stats = {"count": 0, "total": 0, "max": 0}
+
+
+def table_bytes(frame: pd.DataFrame) -> int:
+    """표를 브라우저로 보낼 때의 크기 (Streamlit 처럼 Arrow IPC, 없으면 JSON 근사)"""
+    if pa is None:
+        return len(frame.to_json(orient="split", force_ascii=False).encode("utf-8"))
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def payload(frame=None, *specs) -> dict:
+    """이번 상호작용에서 보내는 표·그래프 크기 (바이트) — 누적 통계에도 더함"""
+    out = {
+        "table": table_bytes(frame) if frame is not None else 0,
+        "chart": sum(len(json.dumps(s, ensure_ascii=False).encode("utf-8")) for s in specs),
+    }
+    out["total"] = out["table"] + out["chart"]
+    with _lock:
+        _stats["count"] += 1
+        _stats["total"] += out["total"]
+        _stats["max"] = max(_stats["max"], out["total"])
+    return out
+
+
+def format_bytes(n: int) -> str:
+    return f"{n / 1024:.1f}KB" if n >= 1024 else f"{n}B"
+
+
+metrics.register_gauge("paging.payload_count", lambda: _stats["count"])
+metrics.register_gauge("paging.payload_mean_bytes", lambda: _stats["total"] / _stats["count"] if _stats["count"] else 0)
+metrics.register_gauge("paging.payload_max_bytes", lambda: _stats["max"])
@@ -0,0 +1,319 @@
+"""모든 페이지 뷰를 정적 HTML 조각 + 그래프 JSON 번들로 미리 만들기.
+
+앱이 보여주는 뷰는 정해져 있습니다 — 유형별 랭킹 16개(페이지 00·02),
+나라별 분포 158개(01), 기질 그룹 카드 5개(03), 테스트 결과 16개(04).
+이 명령은 그 뷰들을 프로세스 풀에서 나눠 렌더링해서, 평범한 정적 파일
+서버로 바로 내보낼 수 있는 번들을 만듭니다.
+
+    <out>/
+        index.html              현재 버전으로 이동
+        CURRENT                 현재 번들 디렉터리 이름
+        <버전 12자리>/
+            manifest.json       뷰 목록 (경로, 입력 해시, 크기)
+            index.html          뷰 목차
+            types/INFJ.html     HTML 조각
+            types/INFJ.json     표 데이터 + 그래프 스펙
+            countries/… groups/… quiz/…
+
+뷰마다 그 뷰가 쓰는 값(예: 유형 TOP10 의 나라·비율)만 해시해 두고, 이전
+번들과 해시가 같으면 다시 렌더링하지 않고 파일을 그대로 가져옵니다.
+
+    python -m mbti.prerender --out dist
+    python -m mbti.prerender --out dist --workers 8 --force
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .cards import MEDALS, group_cards, pick_emojis
+from .countries import normalize
+from .data import FILE_PATH, load_store
+from .groups import GROUPS
+from .ranking import load_rank_index
+
+BUNDLE_FORMAT = 1
+# 남겨 둘 번들 수 (현재 번들 포함, 배포 중인 클라이언트가 옛 버전을 읽을 수 있게)
+KEEP_BUNDLES = 3
+
+# 뷰 종류별 TOP-k (페이지와 같게, 페이지 02의 TOP7 은 유형 뷰 TOP10 의 앞부분)
+TYPE_K = 10
+GROUP_K = 10
+QUIZ_K = 5
+
+
+# ─────────────────────────────────────────────────────────────────
+# 뷰 목록과 입력 해시
+# ─────────────────────────────────────────────────────────────────
+def _digest(names, values) -> str:
+    h = hashlib.sha256()
+    h.update(json.dumps(list(names), ensure_ascii=False).encode("utf-8"))
+    h.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def _slugs(countries) -> dict:
+    """나라 이름 → 파일 이름 (겹치면 번호를 붙임)"""
+    out, used = {}, set()
+    for name in countries:
+        base = normalize(name).replace(" ", "-") or "country"
+        slug, n = base, 2
+        while slug in used:
+            slug, n = f"{base}-{n}", n + 1
+        used.add(slug)
+        out[name] = slug
+    return out
+
+
+def plan(store, ranks) -> dict:
+    """view_id → (종류, 키, 입력 해시)"""
+    views = {}
+    for t in store.types:
+        rows = ranks.top(t, TYPE_K)
+        views[f"types/{t}"] = ("type", t, _digest(ranks.countries[rows], ranks.values[rows, ranks.col_of[t]]))
+        rows = ranks.top(t, QUIZ_K)
+        views[f"quiz/{t}"] = ("quiz", t, _digest(ranks.countries[rows], ranks.values[rows, ranks.col_of[t]]))
+    for name, slug in _slugs(store.countries).items():
+        views[f"countries/{slug}"] = ("country", name, _digest([name], store.profile(name)))
+    for g in GROUPS:
+        rows = ranks.top(g, GROUP_K)
+        views[f"groups/{g}"] = ("group", g, _digest(ranks.countries[rows], ranks.values[rows, ranks.col_of[g]]))
+    return views
+
+
+# ─────────────────────────────────────────────────────────────────
+# 렌더러 (워커 프로세스)
+# ─────────────────────────────────────────────────────────────────
+_worker = {}
+
+
+def _init(path, version):
+    store = load_store(path)
+    if store.version != version:
+        raise RuntimeError("빌드 중에 데이터가 바뀌었습니다. 다시 실행하세요.")
+    _worker["store"] = store
+    _worker["ranks"] = load_rank_index(path)
+
+
+def _ranked_rows(ranks, key, k):
+    top = ranks.top_frame(key, k, value_name="ratio")
+    top["percent"] = (top["ratio"] * 100).round(2)
+    return top
+
+
+def _list_html(title, top, medals=MEDALS) -> str:
+    items = "".join(
+        f"<li>{medals[i] if i < len(medals) else f'{i + 1}.'} <b>{html.escape(c)}</b> — {p}% "
+        f"{''.join(pick_emojis(c))}</li>"
+        for i, (c, p) in enumerate(zip(top["Country"], top["percent"]))
+    )
+    return f"<section><h3>{html.escape(title)}</h3><ol class=\"mbti-rank\">{items}</ol></section>"
+
+
+def _render_type(t):
+    import plotly.express as px
+
+    top = _ranked_rows(_worker["ranks"], t, TYPE_K)
+    fig = px.bar(
+        top.sort_values("percent"), x="percent", y="Country", orientation="h", text="percent",
+        labels={"percent": "비율(%)", "Country": "국가"}, title=f"🌟 {t} 유형 비율이 높은 상위 {TYPE_K}개 국가",
+    )
+    fig.update_traces(texttemplate="%{text}%", textposition="outside", marker_color="#4C9AFF")
+    return _list_html(f"{t} 비율이 높은 나라 TOP {TYPE_K}", top), top, fig
+
+
+def _render_quiz(t):
+    import plotly.express as px
+
+    top = _ranked_rows(_worker["ranks"], t, QUIZ_K)
+    fig = px.bar(
+        top.sort_values("percent"), x="percent", y="Country", orientation="h", text="percent", color="Country",
+        color_discrete_sequence=px.colors.qualitative.Set3 + px.colors.qualitative.Pastel1,
+        labels={"percent": "비율(%)", "Country": "국가"}, title=f"{t} 비율이 높은 나라 TOP {QUIZ_K}",
+    )
+    fig.update_traces(texttemplate="%{text}%", textposition="outside")
+    fig.update_layout(showlegend=False)
+    return _list_html(f"당신({t})과 비슷한 사람들이 많은 나라", top), top, fig
+
+
+def _render_country(name):
+    import pandas as pd
+    import plotly.express as px
+
+    store = _worker["store"]
+    data = pd.DataFrame({"MBTI": list(store.types), "ratio": store.profile(name)})
+    data = data.sort_values("ratio", ascending=False)
+    data["percent"] = (data["ratio"] * 100).round(2)
+    fig = px.bar(
+        data, x="percent", y="MBTI", orientation="h", color="MBTI",
+        color_discrete_sequence=px.colors.qualitative.Set3 + px.colors.qualitative.Pastel1,
+        labels={"percent": "비율(%)", "MBTI": "유형"}, title=f"{name} — MBTI 비율",
+    )
+    fig.update_traces(text=[f"{p}%" for p in data["percent"]], textposition="outside")
+    fig.update_layout(showlegend=False, yaxis=dict(categoryorder="total ascending"))
+    rows = "".join(f"<tr><td>{t}</td><td>{p}%</td></tr>" for t, p in zip(data["MBTI"], data["percent"]))
+    body = (
+        f"<section><h3>{html.escape(name)} — MBTI 비율</h3>"
+        f"<table class=\"mbti-profile\"><tr><th>유형</th><th>비율</th></tr>{rows}</table></section>"
+    )
+    return body, data, fig
+
+
+def _render_group(g):
+    cards, table = group_cards(_worker["ranks"], g, GROUP_K)
+    body = f"<section><h3>🧭 {g}형이 많은 나라 TOP {GROUP_K}</h3><div class=\"mbti-cards\">{''.join(cards)}</div></section>"
+    return body, table, None
+
+
+RENDERERS = {"type": _render_type, "quiz": _render_quiz, "country": _render_country, "group": _render_group}
+
+
+def _render(view_id, kind, key, out_dir):
+    """뷰 하나를 렌더링해 out_dir 에 .html/.json 으로 저장 → (view_id, 파일 크기 합)"""
+    body, table, fig = RENDERERS[kind](key)
+    payload = {
+        "view": view_id,
+        "version": _worker["store"].version,
+        "data": json.loads(table.to_json(orient="records", force_ascii=False)),
+        "chart": json.loads(fig.to_json()) if fig is not None else None,
+    }
+    base = Path(out_dir) / view_id
+    base.parent.mkdir(parents=True, exist_ok=True)
+    fragment = f"{body}\n<div class=\"mbti-chart\" data-spec=\"{base.name}.json\"></div>\n"
+    base.with_suffix(".html").write_text(fragment, encoding="utf-8")
+    base.with_suffix(".json").write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    return view_id, len(fragment.encode("utf-8")) + base.with_suffix(".json").stat().st_size
+
+
+# ─────────────────────────────────────────────────────────────────
+# 번들 빌드
+# ─────────────────────────────────────────────────────────────────
+def _current(out: Path):
+    """(현재 번들 디렉터리, manifest) — 없으면 (None, None)"""
+    try:
+        name = (out / "CURRENT").read_text(encoding="utf-8").strip()
+        manifest = json.loads((out / name / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None, None
+    if manifest.get("format") != BUNDLE_FORMAT:
+        return None, None
+    return out / name, manifest
+
+
+def _link(src: Path, dst: Path):
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _write_atomic(path: Path, text: str):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _prune(out: Path, current: Path, keep=KEEP_BUNDLES):
+    bundles = sorted(
+        (d for d in out.iterdir() if d.is_dir() and (d / "manifest.json").exists()),
+        key=lambda d: d.stat().st_mtime,
+        reverse=True,
+    )
+    for d in bundles[keep:]:
+        if d.resolve() != current.resolve():
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def build(out, path=FILE_PATH, workers=None, force=False) -> dict:
+    """번들 빌드 → {"dir", "rendered", "reused", "seconds"}"""
+    t0 = time.perf_counter()
+    out = Path(out)
+    out.mkdir(parents=True, exist_ok=True)
+    store = load_store(path)
+    views = plan(store, load_rank_index(path))
+    prev_dir, prev = _current(out)
+
+    name = store.version[:12]
+    tmp = out / f".{name}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir()
+
+    # 입력 해시가 같은 뷰는 이전 번들 파일을 그대로 가져옴
+    reused, todo = [], []
+    for view_id, (kind, key, digest) in views.items():
+        old = (prev or {}).get("views", {}).get(view_id)
+        if not force and old and old["digest"] == digest:
+            try:
+                for ext in (".html", ".json"):
+                    _link(prev_dir / f"{view_id}{ext}", tmp / f"{view_id}{ext}")
+                reused.append(view_id)
+                continue
+            except OSError:
+                pass
+        todo.append(view_id)
+
+    sizes = {v: prev["views"][v]["bytes"] for v in reused}
+    if todo:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init, initargs=(str(path), store.version)) as pool:
+            futures = [pool.submit(_render, v, views[v][0], views[v][1], str(tmp)) for v in todo]
+            for f in futures:
+                view_id, size = f.result()
+                sizes[view_id] = size
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": store.version,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "views": {
+            v: {"kind": kind, "key": key, "digest": digest, "html": f"{v}.html", "json": f"{v}.json", "bytes": sizes[v]}
+            for v, (kind, key, digest) in views.items()
+        },
+    }
+    (tmp / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    links = "".join(
+        f"<li><a href=\"{html.escape(v)}.html\">{html.escape(v)}</a></li>" for v in sorted(views)
+    )
+    (tmp / "index.html").write_text(
+        f"<!doctype html><meta charset=\"utf-8\"><title>MBTI 번들 {name}</title><ul>{links}</ul>", encoding="utf-8"
+    )
+
+    # 디렉터리를 통째로 바꾸고 CURRENT 를 마지막에 갱신 (서버는 항상 완성된 번들만 봄)
+    final = out / name
+    if final.exists():
+        if prev_dir is not None and final.resolve() == prev_dir.resolve():
+            # 같은 버전 재빌드: 서비스 중인 디렉터리는 두고 새 이름으로 (옛 것은 _prune 이 정리)
+            final = out / f"{name}-{int(time.time())}"
+        else:
+            shutil.rmtree(final)
+    os.replace(tmp, final)
+    _write_atomic(out / "CURRENT", final.name)
+    _write_atomic(
+        out / "index.html",
+        f"<!doctype html><meta charset=\"utf-8\"><meta http-equiv=\"refresh\" content=\"0; url={final.name}/\">",
+    )
+    _prune(out, final)
+    return {"dir": final, "rendered": len(todo), "reused": len(reused), "seconds": time.perf_counter() - t0}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지 뷰 정적 번들 빌드")
+    parser.add_argument("--data", default=str(FILE_PATH))
+    parser.add_argument("--out", default="dist", help="번들 출력 디렉터리")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="바뀌지 않은 뷰도 다시 렌더링")
+    args = parser.parse_args(argv)
+
+    res = build(args.out, args.data, args.workers, args.force)
+    print(f"{res['dir']}: 렌더링 {res['rendered']}개, 재사용 {res['reused']}개 ({res['seconds']:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""가중치 프로필 질의: 16유형 가중치 벡터로 나라 순위 매기기.
+
+"ENFP 70% + INFP 30%" 같은 혼합이나 테스트 응답 강도에서 나온 부드러운
+결과를 16유형 가중치 벡터로 만들고, `국가 × 16` 행렬과의 곱 한 번으로
+점수를 낸 뒤 `argpartition` 으로 상위 k개만 고릅니다.
+가중치를 여러 개(B × 16 행렬) 넘기면 행렬곱 한 번으로 모두 계산합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from .data import FILE_PATH, load_store
+from .groups import AXES
+
+
+def weight_vector(blend, types) -> np.ndarray:
+    """{"ENFP": 0.7, "INFP": 0.3} → types 순서의 16유형 가중치 벡터"""
+    col_of = {t: j for j, t in enumerate(types)}
+    unknown = [t for t in blend if t not in col_of]
+    if unknown:
+        raise ValueError(f"알 수 없는 MBTI 유형입니다: {unknown}")
+    w = np.zeros(len(col_of), dtype=np.float64)
+    for t, weight in blend.items():
+        w[col_of[t]] += weight
+    return w
+
+
+def quiz_weights(scores, types) -> np.ndarray:
+    """테스트 점수({"E": 2, "I": 0, …})를 축별 응답 비율의 곱으로 바꾼 가중치 벡터
+
+    두 문항 모두 E면 E 쪽 1.0, 한 문항씩 갈리면 0.5/0.5 로 나눠 가집니다.
+    한 축에 답이 없으면 그 축은 반반으로 둡니다.
+    """
+    share = {}
+    for first, second in AXES:
+        total = scores.get(first, 0) + scores.get(second, 0)
+        p = scores.get(first, 0) / total if total else 0.5
+        share[first], share[second] = p, 1.0 - p
+    return np.array([np.prod([share[ch] for ch in t]) for t in types])
+
+
+def top_rows(matrix: np.ndarray, weights: np.ndarray, k: int):
+    """가중치(16,) 또는 (B, 16)로 상위 k개 행 → (행 번호, 점수)
+
+    결과 모양은 가중치가 벡터면 (k,), 행렬이면 (B, k) 입니다.
+    """
+    weights = np.asarray(weights, dtype=matrix.dtype)
+    single = weights.ndim == 1
+    W = np.atleast_2d(weights)
+    scores = W @ matrix.T  # (B, n), 행렬곱 한 번
+    k = max(1, min(k, scores.shape[1]))
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind="stable")
+    rows = np.take_along_axis(part, order, axis=1)
+    top = np.take_along_axis(part_scores, order, axis=1)
+    return (rows[0], top[0]) if single else (rows, top)
+
+
+def rank_countries(weights, k: int = 5, path=FILE_PATH, value_name="score", year=None) -> pd.DataFrame:
+    """가중치 벡터(또는 {"유형": 비중} dict)로 상위 k개 나라 (`Country`, value_name)"""
+    store = load_store(path, year)
+    if isinstance(weights, dict):
+        weights = weight_vector(weights, store.types)
+    rows, scores = top_rows(store.matrix, weights, k)
+    return pd.DataFrame({
+        "Country": np.asarray(store.countries, dtype=object)[rows],
+        value_name: scores,
+    })
+
+
+def rank_countries_batch(weights: np.ndarray, k: int = 5, path=FILE_PATH, year=None):
+    """가중치 행렬(B × 16, store.types 순서) → 질의별 상위 k개 나라 이름·점수 (B × k)"""
+    store = load_store(path, year)
+    rows, scores = top_rows(store.matrix, np.atleast_2d(weights), k)
+    return np.asarray(store.countries, dtype=object)[rows], scores
@@ -0,0 +1,225 @@
+"""초간단 8문항 MBTI 테스트: 문항 정의, 채점, 대량(batch) 채점·추천.
+
+페이지 04는 한 명씩 `to_mbti()` 로 채점하고, 설문 내보내기 파일처럼
+응답이 수천~수백만 건이면 `score_batch()` / CLI 로 한꺼번에 처리합니다.
+
+대량 채점은 응답자마다 8개 답을 비트로 묶어(답 비트 + 응답 여부 비트)
+65536칸 조견표에서 16유형 번호를 한 번에 찾고, 유형별 TOP-k 국가 표를
+한 번의 gather 로 붙입니다. 결과는 청크 단위로 흘려 씁니다.
+
+    python -m mbti.quiz score answers.csv -o recommend.csv --top 5
+    python -m mbti.quiz bench --n 1000000
+
+입력 CSV는 q1 … q8 컬럼을 가지며, 값은 0/1(첫째/둘째 선택지) 또는
+선택지 글자(E/I, S/N, T/F, J/P)입니다. 빈 칸은 무응답입니다.
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .data import FILE_PATH, MBTI_TYPES
+from .ranking import load_rank_index
+
+# -------------------------------
+# 초간단 MBTI 문항 (8문항: 각 축 2문항씩)
+# 각 선택지는 해당 축의 한쪽에 +1
+# -------------------------------
+QUESTIONS = [
+    # E vs I
+    {
+        "q": "주말엔 무엇이 더 에너지 충전이 돼요?",
+        "opts": [("사람들과 어울리며 신나게! 🎉", "E"), ("혼자 조용히 쉬며 힐링 ☕️", "I")]
+    },
+    {
+        "q": "새로운 모임에서 나는…",
+        "opts": [("먼저 말 걸고 분위기를 띄워요 🗣️", "E"), ("관찰하며 천천히 적응해요 👀", "I")]
+    },
+    # S vs N
+    {
+        "q": "정보를 이해할 때 나는…",
+        "opts": [("사실·경험 위주로! 구체적인 게 좋아요 📋", "S"), ("아이디어·가능성 상상! 큰 그림이 좋아요 🌈", "N")]
+    },
+    {
+        "q": "설명서를 볼 때 내 스타일은?",
+        "opts": [("순서대로 차근차근 따라하기 ✅", "S"), ("대략 파악하고 감으로 시도 🪄", "N")]
+    },
+    # T vs F
+    {
+        "q": "갈등 상황에서 나는…",
+        "opts": [("원인·해결책을 논리적으로 정리 🧠", "T"), ("상대 감정을 먼저 헤아리기 💗", "F")]
+    },
+    {
+        "q": "칭찬과 피드백 중 더 중요한 건?",
+        "opts": [("정확한 피드백! 개선이 먼저 🔧", "T"), ("응원과 공감! 분위기가 먼저 🌟", "F")]
+    },
+    # J vs P
+    {
+        "q": "여행 계획은 어떻게?",
+        "opts": [("일정표를 촘촘히! 계획이 편해요 🗓️", "J"), ("현지에서 즉흥적으로! 유연함이 좋아요 🎒", "P")]
+    },
+    {
+        "q": "〆마감이 다가오면?",
+        "opts": [("미리 끝내고 여유롭게 ✅", "J"), ("데드라인의 힘! 막판 집중 🚀", "P")]
+    },
+]
+
+
+def to_mbti(sc):
+    # 각 축 비교해 MBTI 문자열 만들기
+    ei = "E" if sc["E"] >= sc["I"] else "I"
+    sn = "S" if sc["S"] >= sc["N"] else "N"
+    tf = "T" if sc["T"] >= sc["F"] else "F"
+    jp = "J" if sc["J"] >= sc["P"] else "P"
+    return ei + sn + tf + jp
+
+
+# -------------------------------
+# 대량 채점
+# -------------------------------
+# 문항별 (첫째 선택지 글자, 둘째 선택지 글자)
+OPTION_LETTERS = [(item["opts"][0][1], item["opts"][1][1]) for item in QUESTIONS]
+N_QUESTIONS = len(QUESTIONS)
+QUESTION_COLS = [f"q{i + 1}" for i in range(N_QUESTIONS)]
+NO_ANSWER = -1
+
+
+def _build_lookup() -> np.ndarray:
+    """(답 비트 << 8 | 응답 비트) → MBTI_TYPES 번호 조견표 (무응답이면 -1)"""
+    type_index = {t: i for i, t in enumerate(MBTI_TYPES)}
+    lut = np.full(1 << (2 * N_QUESTIONS), NO_ANSWER, dtype=np.int8)
+    for mask in range(1, 1 << N_QUESTIONS):
+        for bits in range(1 << N_QUESTIONS):
+            if bits & ~mask:
+                continue
+            scores = {letter: 0 for pair in OPTION_LETTERS for letter in pair}
+            for i, (first, second) in enumerate(OPTION_LETTERS):
+                if mask >> i & 1:
+                    scores[second if bits >> i & 1 else first] += 1
+            lut[bits << N_QUESTIONS | mask] = type_index[to_mbti(scores)]
+    return lut
+
+
+_LOOKUP = None
+
+
+def encode_answers(answers: np.ndarray) -> np.ndarray:
+    """응답 행렬(N × 8, 값 0/1, 무응답 -1) → 조견표 키 (uint16)"""
+    answers = np.asarray(answers)
+    weights = (1 << np.arange(N_QUESTIONS)).astype(np.uint16)
+    answered = answers >= 0
+    bits = ((answers == 1) @ weights).astype(np.uint16)
+    mask = (answered @ weights).astype(np.uint16)
+    return bits << N_QUESTIONS | mask
+
+
+def score_batch(answers: np.ndarray) -> np.ndarray:
+    """응답 행렬(N × 8) → MBTI_TYPES 번호 (N,), 전부 무응답이면 -1"""
+    global _LOOKUP
+    if _LOOKUP is None:
+        _LOOKUP = _build_lookup()
+    return _LOOKUP[encode_answers(answers)]
+
+
+def top_table(k: int = 5, path=FILE_PATH) -> np.ndarray:
+    """MBTI_TYPES 순서의 유형별 TOP-k 국가 행 번호 (16 × k)"""
+    ranks = load_rank_index(path)
+    return np.stack([ranks.top(t, k) for t in MBTI_TYPES])
+
+
+def parse_answers(chunk: pd.DataFrame) -> np.ndarray:
+    """q1 … q8 컬럼(0/1 또는 선택지 글자) → 응답 행렬 (N × 8, 무응답 -1)"""
+    out = np.full((len(chunk), N_QUESTIONS), NO_ANSWER, dtype=np.int8)
+    for i, col in enumerate(QUESTION_COLS):
+        values = chunk[col].astype(str).str.strip().str.upper().to_numpy()
+        first, second = OPTION_LETTERS[i]
+        out[(values == "0") | (values == first), i] = 0
+        out[(values == "1") | (values == second), i] = 1
+    return out
+
+
+def recommend_chunks(chunks, k: int = 5, path=FILE_PATH):
+    """응답 DataFrame 청크들을 받아 (mbti, country_1 … country_k) 청크를 차례로 돌려줌"""
+    ranks = load_rank_index(path)
+    table = top_table(k, path)
+    types = np.array(MBTI_TYPES + ("",), dtype=object)
+    # -1(무응답)은 마지막 빈 행을 가리키도록
+    countries = np.append(ranks.countries, "")
+    table = np.vstack([table, np.full((1, table.shape[1]), len(countries) - 1)])
+
+    for chunk in chunks:
+        idx = score_batch(parse_answers(chunk))
+        picks = countries[table[idx]]
+        out = pd.DataFrame(picks, columns=[f"country_{j + 1}" for j in range(picks.shape[1])])
+        out.insert(0, "mbti", types[idx])
+        if "id" in chunk.columns:
+            out.insert(0, "id", chunk["id"].to_numpy())
+        yield out
+
+
+def synthetic_answers(n: int, seed: int = 0, missing: float = 0.05) -> np.ndarray:
+    """벤치마크용 가짜 응답 (N × 8)"""
+    rng = np.random.default_rng(seed)
+    answers = rng.integers(0, 2, size=(n, N_QUESTIONS), dtype=np.int8)
+    answers[rng.random((n, N_QUESTIONS)) < missing] = NO_ANSWER
+    return answers
+
+
+# -------------------------------
+# CLI
+# -------------------------------
+def _score(args):
+    chunks = pd.read_csv(args.input, dtype=str, keep_default_na=False, chunksize=args.chunksize)
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        for i, frame in enumerate(recommend_chunks(chunks, args.top, args.data)):
+            frame.to_csv(out, header=(i == 0), index=False)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def _bench(args):
+    answers = synthetic_answers(args.n)
+    table = top_table(args.top, args.data)
+    score_batch(answers[:1])  # 조견표 만들기는 측정에서 제외
+
+    t0 = time.perf_counter()
+    idx = score_batch(answers)
+    t1 = time.perf_counter()
+    picks = table[idx]
+    t2 = time.perf_counter()
+
+    n = len(answers)
+    print(f"응답 수: {n:,}")
+    print(f"채점(비트 인코딩 + 조견표): {(t1 - t0) * 1000:.1f} ms  ({n / (t1 - t0):,.0f} 건/초)")
+    print(f"TOP-{args.top} gather:           {(t2 - t1) * 1000:.1f} ms  ({n / (t2 - t1):,.0f} 건/초)")
+    print(f"결과 배열 크기: {picks.nbytes / 1e6:.1f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="초간단 MBTI 테스트 대량 채점·나라 추천")
+    # 공통 옵션은 하위 명령 뒤에 써도 되도록 각 하위 명령에 붙임
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--data", default=str(FILE_PATH), help="국가 MBTI CSV")
+    common.add_argument("--top", type=int, default=5, help="추천 나라 수")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("score", parents=[common], help="응답 CSV 채점 후 추천 결과 CSV 출력")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", help="출력 파일 (기본: 표준 출력)")
+    p.add_argument("--chunksize", type=int, default=100_000)
+    p.set_defaults(func=_score)
+
+    p = sub.add_parser("bench", parents=[common], help="가짜 응답으로 처리량 측정")
+    p.add_argument("--n", type=int, default=1_000_000)
+    p.set_defaults(func=_bench)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
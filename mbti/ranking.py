@@ -0,0 +1,108 @@
+"""유형·기질 그룹별 국가 랭킹 인덱스.
+
+데이터를 읽을 때 16개 유형과 기질 그룹(NF/NT/SJ/SP/ST) 각각의 내림차순
+정렬 순서(argsort 전체 순열)를 한 번만 만들어 두고, TOP-k 질의는
+그 순열의 앞부분을 자르기만 합니다(O(k)). 데이터가 바뀌면 바뀐 나라만
+기존 순서에서 빼서 제자리에 다시 끼워 넣습니다(`RankIndex.updated`).
+"""
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .data import FILE_PATH, load_store, on_reload
+from .groups import GROUPS, group_totals, membership_matrix
+
+# 바뀐 행이 전체의 이 비율을 넘으면 점진 갱신 대신 전체 정렬
+FULL_REBUILD_RATIO = 0.125
+
+
+class RankIndex:
+    """열(유형/그룹)별 내림차순 국가 순서"""
+
+    def __init__(self, store, groups=GROUPS):
+        self.store = store
+        self.groups = groups
+        self.keys = tuple(store.types) + tuple(groups)
+        self.col_of = {key: j for j, key in enumerate(self.keys)}
+        self.countries = np.asarray(store.countries, dtype=object)
+
+        values = np.hstack([store.matrix, group_totals(store, groups)])
+        # 동점이면 CSV 순서를 유지 (stable), 열 단위 슬라이스가 연속이 되도록 F-order
+        with metrics.timer("sort"):
+            order = np.argsort(-values, axis=0, kind="stable")
+        self.values = np.asfortranarray(values)
+        self.order = np.asfortranarray(order)
+        self.values.setflags(write=False)
+        self.order.setflags(write=False)
+
+    def updated(self, store, rows) -> "RankIndex":
+        """값이 바뀐 rows 만 다시 끼워 넣은 새 인덱스 (나라 목록이 같은 새 저장소용)"""
+        rows = np.asarray(rows, dtype=np.intp)
+        if len(rows) > FULL_REBUILD_RATIO * len(store):
+            return RankIndex(store, self.groups)
+
+        new = RankIndex.__new__(RankIndex)
+        new.store = store
+        new.groups = self.groups
+        new.keys = self.keys
+        new.col_of = self.col_of
+        new.countries = self.countries
+
+        values = np.array(self.values, order="F")
+        n_types = len(store.types)
+        values[rows, :n_types] = store.matrix[rows]
+        values[rows, n_types:] = store.matrix[rows] @ membership_matrix(store.types, self.groups).astype(
+            store.matrix.dtype
+        )
+        order = np.empty_like(self.order, order="F")
+        changed = np.zeros(len(store), dtype=bool)
+        changed[rows] = True
+        with metrics.timer("sort_incremental"):
+            for j in range(len(self.keys)):
+                order[:, j] = _reinsert(self.order[:, j], changed, rows, -values[:, j])
+        new.values, new.order = values, order
+        new.values.setflags(write=False)
+        new.order.setflags(write=False)
+        return new
+
+    def __contains__(self, key):
+        return key in self.col_of
+
+    def top(self, key: str, k: int) -> np.ndarray:
+        """key 비율이 높은 순서대로 상위 k개 국가의 행 번호"""
+        return self.order[:k, self.col_of[key]]
+
+    def top_frame(self, key: str, k: int, value_name=None) -> pd.DataFrame:
+        """상위 k개 국가를 `Country` / key(또는 value_name) 컬럼의 DataFrame으로"""
+        j = self.col_of[key]
+        rows = self.order[:k, j]
+        return pd.DataFrame({
+            "Country": self.countries[rows],
+            value_name or key: self.values[rows, j],
+        })
+
+
+def _reinsert(order, changed, rows, keys) -> np.ndarray:
+    """keys 오름차순(동점은 행 번호 순) 순열 order 에서 rows 를 빼고 새 keys 로 다시 끼워 넣음"""
+    kept = order[~changed[order]]
+    kept_keys = keys[kept]
+    ins = rows[np.lexsort((rows, keys[rows]))]
+    ins_keys = keys[ins]
+    left = np.searchsorted(kept_keys, ins_keys, side="left")
+    right = np.searchsorted(kept_keys, ins_keys, side="right")
+    # 같은 값끼리는 행 번호 순서 (전체 stable 정렬과 같은 결과)
+    pos = [lo + np.searchsorted(kept[lo:hi], r) for lo, hi, r in zip(left, right, ins)]
+    return np.insert(kept, pos, ins)
+
+
+def load_rank_index(path=FILE_PATH, year=None) -> RankIndex:
+    """공용 저장소에 대한 랭킹 인덱스 (데이터 버전마다 한 번만 만듦)"""
+    store = load_store(path, year)
+    return store.derived("rank_index", lambda: RankIndex(store))
+
+
+@on_reload
+def _carry_over(old, new, rows):
+    index = dict(old.derived_items()).get("rank_index")
+    if index is not None and rows is not None:
+        new.set_derived("rank_index", index.updated(new, rows))
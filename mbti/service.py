@@ -0,0 +1,298 @@
+"""페이지와 같은 답을 주는 JSON 질의 서비스 (asyncio HTTP/1.1).
+
+다른 서비스가 Streamlit 화면을 긁지 않고도 같은 결과를 받을 수 있게,
+페이지가 쓰는 공용 저장소·랭킹 인덱스·나라 인덱스를 그대로 씁니다.
+답은 데이터 버전마다 만들어 둔 표에서 잘라 오고, 직렬화한 응답 바이트도
+버전별로 캐시합니다. ETag 는 데이터 버전이라 버전이 같으면 304 입니다.
+
+    GET  /v1/version
+    GET  /v1/top?type=INFJ&k=10            유형(또는 그룹 NF/NT/…)별 상위 나라
+    GET  /v1/countries/South%20Korea       나라 분포 (별칭 가능) + 그룹 합계
+    GET  /v1/groups                        그룹 정의
+    GET  /v1/groups/NF?k=10                그룹 합계 상위 나라
+    GET  /v1/quiz?answers=EESNTFJP&k=5     테스트 답 8개 → 유형 → 나라
+    POST /v1/batch  {"requests": ["/v1/top?type=INFJ", ...]}   여러 질의 한 번에
+
+    python -m mbti.service --port 8765
+"""
+import argparse
+import asyncio
+import json
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import numpy as np
+
+from .countries import load_country_index
+from .data import FILE_PATH, MBTI_TYPES, load_store
+from .groups import GROUPS
+from .quiz import N_QUESTIONS, NO_ANSWER, OPTION_LETTERS, score_batch
+from .ranking import load_rank_index
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+DEFAULT_K = 10
+MAX_K = 50
+MAX_BATCH = 256
+# 버전당 캐시할 응답 수 (넘으면 비우고 다시 채움)
+MAX_CACHED = 20000
+MAX_BODY = 1 << 20
+
+
+class QueryError(Exception):
+    def __init__(self, status: int, message: str, **extra):
+        super().__init__(message)
+        self.status = status
+        self.body = {"error": message, **extra}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 질의 (데이터 버전마다 하나)
+# ─────────────────────────────────────────────────────────────────
+class Answers:
+    """한 데이터 버전에 대한 질의 처리기 + 응답 캐시"""
+
+    def __init__(self, path=FILE_PATH):
+        self.store = load_store(path)
+        self.ranks = load_rank_index(path)
+        self.index = load_country_index(path)
+        self.version = self.store.version
+        self.etag = f'"{self.version[:20]}"'
+        self.types = tuple(self.store.types)
+        self._cache = {}
+
+    def _k(self, params) -> int:
+        try:
+            k = int(params.get("k", DEFAULT_K))
+        except ValueError:
+            raise QueryError(400, "k 는 정수여야 합니다.")
+        return max(1, min(k, MAX_K))
+
+    def _top(self, key, k) -> list:
+        rows = self.ranks.top(key, k)
+        values = self.ranks.values[rows, self.ranks.col_of[key]]
+        return [{"country": c, "ratio": round(float(v), 6)} for c, v in zip(self.ranks.countries[rows], values)]
+
+    def top(self, params) -> dict:
+        key = params.get("type", "").upper()
+        if key not in self.ranks.col_of:
+            raise QueryError(400, f"알 수 없는 유형·그룹입니다: {key!r}", choices=list(self.ranks.keys))
+        k = self._k(params)
+        return {"type": key, "k": k, "countries": self._top(key, k)}
+
+    def country(self, name) -> dict:
+        row = self.index.resolve(name)
+        if row is None:
+            raise QueryError(404, f"나라를 찾을 수 없습니다: {name!r}", suggestions=self.index.search(name, 5))
+        profile = self.store.matrix[row]
+        n_types = len(self.types)
+        groups = self.ranks.values[row, n_types:]
+        return {
+            "country": self.store.countries[row],
+            "profile": {t: round(float(v), 6) for t, v in zip(self.types, profile)},
+            "top3": [self.types[j] for j in np.argsort(-profile, kind="stable")[:3]],
+            "groups": {g: round(float(v), 6) for g, v in zip(self.ranks.keys[n_types:], groups)},
+        }
+
+    def groups(self) -> dict:
+        return {"groups": {g: list(members) for g, members in GROUPS.items()}}
+
+    def group(self, name, params) -> dict:
+        name = name.upper()
+        if name not in GROUPS:
+            raise QueryError(404, f"알 수 없는 그룹입니다: {name!r}", choices=list(GROUPS))
+        k = self._k(params)
+        return {"group": name, "members": list(GROUPS[name]), "k": k, "countries": self._top(name, k)}
+
+    def quiz(self, params) -> dict:
+        mbti = params.get("type", "").upper() or self._score(params.get("answers", ""))
+        if mbti not in self.types:
+            raise QueryError(400, f"알 수 없는 MBTI 유형입니다: {mbti!r}")
+        k = self._k({"k": params.get("k", 5)})
+        return {"mbti": mbti, "k": k, "countries": self._top(mbti, k)}
+
+    @staticmethod
+    def _score(answers: str) -> str:
+        """답 8개(선택지 글자 또는 0/1, 무응답은 '-') → 유형 (페이지 04 와 같은 채점)"""
+        answers = answers.strip().upper()
+        if len(answers) != N_QUESTIONS:
+            raise QueryError(400, f"answers 는 {N_QUESTIONS}글자여야 합니다. (예: EISNTFJP, 01011010)")
+        row = np.full((1, N_QUESTIONS), NO_ANSWER, dtype=np.int8)
+        for i, (ch, (first, second)) in enumerate(zip(answers, OPTION_LETTERS)):
+            if ch in ("0", first):
+                row[0, i] = 0
+            elif ch in ("1", second):
+                row[0, i] = 1
+            elif ch != "-":
+                raise QueryError(400, f"{i + 1}번 답은 {first}/{second}/0/1/- 중 하나여야 합니다.")
+        if (row < 0).all():
+            raise QueryError(400, "문항에 답해주세요. (answers 가 전부 무응답 '-' 입니다)")
+        return MBTI_TYPES[int(score_batch(row)[0])]
+
+    # ── 라우팅 ───────────────────────────────────────────────────
+    def route(self, target: str):
+        """GET 대상 → (상태 코드, 본문 dict)"""
+        parts = urlsplit(target)
+        path = parts.path.rstrip("/")
+        params = dict(parse_qsl(parts.query))
+        if path == "/v1/version":
+            return 200, {"version": self.version, "countries": len(self.store), "types": list(self.types)}
+        if path == "/v1/top":
+            return 200, self.top(params)
+        if path.startswith("/v1/countries/"):
+            return 200, self.country(unquote(path[len("/v1/countries/"):]))
+        if path == "/v1/groups":
+            return 200, self.groups()
+        if path.startswith("/v1/groups/"):
+            return 200, self.group(unquote(path[len("/v1/groups/"):]), params)
+        if path == "/v1/quiz":
+            return 200, self.quiz(params)
+        raise QueryError(404, f"없는 경로입니다: {path}")
+
+    def get(self, target: str):
+        """(상태 코드, 직렬화된 본문) — 같은 대상이면 캐시된 바이트"""
+        hit = self._cache.get(target)
+        if hit is not None:
+            return hit
+        try:
+            status, body = self.route(target)
+        except QueryError as e:
+            status, body = e.status, e.body
+        out = (status, json.dumps(body, ensure_ascii=False).encode("utf-8"))
+        if len(self._cache) >= MAX_CACHED:
+            self._cache.clear()
+        self._cache[target] = out
+        return out
+
+    def batch(self, body: bytes):
+        try:
+            targets = json.loads(body or b"{}").get("requests")
+        except (ValueError, AttributeError):
+            targets = None
+        if not isinstance(targets, list) or not all(isinstance(t, str) for t in targets):
+            return 400, json.dumps({"error": "본문은 {\"requests\": [\"/v1/...\", ...]} 형식이어야 합니다."},
+                                   ensure_ascii=False).encode("utf-8")
+        if len(targets) > MAX_BATCH:
+            return 413, json.dumps({"error": f"한 번에 최대 {MAX_BATCH}개까지 질의할 수 있습니다."},
+                                   ensure_ascii=False).encode("utf-8")
+        # 캐시된 바이트를 그대로 이어 붙여 다시 직렬화하지 않음
+        items = []
+        for t in targets:
+            status, payload = self.get(t)
+            items.append(b'{"status":%d,"body":%s}' % (status, payload))
+        return 200, b'{"version":"' + self.version.encode() + b'","responses":[' + b",".join(items) + b"]}"
+
+
+def load_answers(path=FILE_PATH) -> Answers:
+    """현재 데이터 버전의 질의 처리기 (버전마다 한 번만 만듦)"""
+    store = load_store(path)
+    return store.derived("service", lambda: Answers(path))
+
+
+# ─────────────────────────────────────────────────────────────────
+# HTTP/1.1 (keep-alive, 파이프라이닝은 순서대로 처리)
+# ─────────────────────────────────────────────────────────────────
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+def _response(status: int, body: bytes, etag, keep_alive: bool) -> bytes:
+    """응답 바이트 (ETag 는 성공 응답에만 — 오류 본문은 버전과 무관하게 다시 확인해야 함)"""
+    head = [
+        f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+    ]
+    if etag and status in (200, 304):
+        head.append(f"ETag: {etag}")
+    head += [
+        "Cache-Control: no-cache",
+        "Connection: keep-alive" if keep_alive else "Connection: close",
+    ]
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, path=FILE_PATH):
+    try:
+        while True:
+            try:
+                raw = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            lines = raw.decode("latin-1").split("\r\n")
+            try:
+                method, target, version = lines[0].split(" ", 2)
+            except ValueError:
+                break
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                if name:
+                    headers[name.strip().lower()] = value.strip()
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # 본문 경계를 알 수 없으니 400 을 보내고 연결을 닫음
+                payload = json.dumps({"error": "Content-Length 는 0 이상의 정수여야 합니다."}, ensure_ascii=False)
+                writer.write(_response(400, payload.encode("utf-8"), None, False))
+                break
+            if length > MAX_BODY:
+                payload = json.dumps({"error": f"본문은 최대 {MAX_BODY} 바이트입니다."}, ensure_ascii=False)
+                writer.write(_response(413, payload.encode("utf-8"), None, False))
+                break
+            body = await reader.readexactly(length) if length else b""
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+            answers = load_answers(path)
+            if method == "GET":
+                status, payload = answers.get(target)
+                # 304 는 성공 응답일 때만 (오류·404 는 항상 본문과 함께)
+                if status == 200 and headers.get("if-none-match") == answers.etag:
+                    status, payload = 304, b""
+                writer.write(_response(status, payload, answers.etag, keep_alive))
+            elif method == "POST" and urlsplit(target).path.rstrip("/") == "/v1/batch":
+                status, payload = answers.batch(body)
+                writer.write(_response(status, payload, answers.etag, keep_alive))
+            else:
+                payload = json.dumps({"error": f"{method} {target} 는 지원하지 않습니다."}, ensure_ascii=False)
+                writer.write(_response(405, payload.encode("utf-8"), answers.etag, keep_alive))
+            # 쓰기 버퍼가 찼을 때만 기다림 (작은 응답은 바로 다음 요청으로)
+            if writer.transport.get_write_buffer_size() > 1 << 16:
+                await writer.drain()
+            if not keep_alive:
+                break
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8765, path=FILE_PATH):
+    load_answers(path)  # 첫 요청 전에 표를 만들어 둠
+    server = await asyncio.start_server(lambda r, w: handle(r, w, path), host, port, backlog=1024)
+    print(f"MBTI 질의 서비스: http://{host}:{port}/v1/version")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MBTI JSON 질의 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--data", default=str(FILE_PATH))
+    args = parser.parse_args(argv)
+    if uvloop is not None:
+        uvloop.install()
+    try:
+        asyncio.run(serve(args.host, args.port, args.data))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""국가 간 MBTI 분포 유사도 (최근접 이웃) 엔진.
+
+각 나라의 16유형 비율 전체를 하나의 벡터로 보고 코사인 / 유클리드 /
+Jensen–Shannon 거리로 가까운 나라를 찾습니다.
+
+- 행 수가 `DENSE_MAX_ROWS` 이하면 전체 쌍 거리 행렬을 한 번만 블록 단위
+  행렬곱으로 계산해 캐시하고, 질의는 그 행에서 argpartition 만 합니다.
+- 그보다 크면(지역 단위 10만+ 행 등) 거리 행렬을 만들지 않고, 질의마다
+  필요한 행만 블록 단위로 계산하는 검색으로 자동 전환합니다.
+- 데이터가 바뀌면 바뀐 나라의 행·열만 다시 계산합니다(`updated`).
+"""
+import numpy as np
+import pandas as pd
+
+from . import metrics
+from .data import FILE_PATH, load_store, on_reload
+
+METRICS = ("cosine", "euclidean", "jensenshannon")
+METRIC_LABELS = {"cosine": "코사인", "euclidean": "유클리드", "jensenshannon": "Jensen–Shannon"}
+
+# float32 기준 5000 × 5000 ≈ 100MB 까지만 전체 행렬로 보관
+DENSE_MAX_ROWS = 5000
+# 블록 하나가 쓰는 임시 메모리 상한
+BLOCK_BYTES = 64 << 20
+
+
+def _entropy(p: np.ndarray) -> np.ndarray:
+    """마지막 축 기준 섀넌 엔트로피 (0·log0 = 0, 단위: bit)"""
+    return -(p * np.log2(np.where(p > 0, p, 1.0))).sum(axis=-1)
+
+
+class SimilarityEngine:
+    """한 가지 거리 척도에 대한 국가 간 최근접 이웃 검색"""
+
+    def __init__(self, store, metric="cosine", dense_max_rows=DENSE_MAX_ROWS):
+        if metric not in METRICS:
+            raise ValueError(f"알 수 없는 거리 척도입니다: {metric}")
+        self.metric = metric
+        self._prepare(store)
+
+        n = len(store)
+        self.dense = n <= dense_max_rows
+        self.matrix = None
+        if self.dense:
+            D = np.empty((n, n), dtype=np.float32)
+            for start, stop in self._blocks(n):
+                D[start:stop] = self._block(np.arange(start, stop))
+            D.setflags(write=False)
+            self.matrix = D
+
+    def _prepare(self, store):
+        self.store = store
+        self.countries = np.asarray(store.countries, dtype=object)
+        X = np.asarray(store.matrix, dtype=np.float64)
+        if self.metric == "cosine":
+            norms = np.linalg.norm(X, axis=1, keepdims=True)
+            self._X = X / np.where(norms > 0, norms, 1.0)
+        elif self.metric == "euclidean":
+            self._X = X
+            self._sq = (X * X).sum(axis=1)
+        else:
+            sums = X.sum(axis=1, keepdims=True)
+            self._X = X / np.where(sums > 0, sums, 1.0)
+            self._H = _entropy(self._X)
+
+    def updated(self, store, rows) -> "SimilarityEngine":
+        """바뀐 rows 의 행·열만 다시 계산한 새 엔진 (나라 목록이 같은 새 저장소용)"""
+        new = SimilarityEngine.__new__(SimilarityEngine)
+        new.metric, new.dense = self.metric, self.dense
+        new._prepare(store)
+        new.matrix = None
+        if self.dense:
+            rows = np.asarray(rows, dtype=np.intp)
+            D = self.matrix.copy()
+            for start, stop in new._blocks(len(rows)):
+                block = rows[start:stop]
+                D[block] = new._block(block)
+            D[:, rows] = D[rows].T
+            D.setflags(write=False)
+            new.matrix = D
+        return new
+
+    def _block_rows(self) -> int:
+        n, d = self._X.shape
+        per_row = n * 8 * (d if self.metric == "jensenshannon" else 1)
+        return max(1, BLOCK_BYTES // max(per_row, 1))
+
+    def _blocks(self, total: int):
+        step = self._block_rows()
+        for start in range(0, total, step):
+            yield start, min(start + step, total)
+
+    def _block(self, rows: np.ndarray) -> np.ndarray:
+        """rows 행들과 전체 행 사이의 거리 (len(rows) × n)"""
+        A = self._X[rows]
+        if self.metric == "cosine":
+            return 1.0 - A @ self._X.T
+        if self.metric == "euclidean":
+            sq = self._sq[rows][:, None] + self._sq[None, :] - 2.0 * (A @ self._X.T)
+            return np.sqrt(np.maximum(sq, 0.0))
+        M = 0.5 * (A[:, None, :] + self._X[None, :, :])
+        jsd = _entropy(M) - 0.5 * (self._H[rows][:, None] + self._H[None, :])
+        return np.sqrt(np.maximum(jsd, 0.0))
+
+    def distances(self, rows) -> np.ndarray:
+        """rows 행들에서 전체 국가까지의 거리"""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.intp))
+        if self.dense:
+            return self.matrix[rows]
+        out = np.empty((len(rows), len(self.countries)), dtype=np.float32)
+        for start, stop in self._blocks(len(rows)):
+            out[start:stop] = self._block(rows[start:stop])
+        return out
+
+    def nearest(self, rows, k: int = 5):
+        """각 행의 가까운 나라 k개 (자기 자신 제외) → (행 번호, 거리), 둘 다 len(rows) × k"""
+        rows = np.atleast_1d(np.asarray(rows, dtype=np.intp))
+        n = len(self.countries)
+        k = min(k, n - 1)
+        idx = np.empty((len(rows), k), dtype=np.intp)
+        dist = np.empty((len(rows), k), dtype=np.float32)
+        if k <= 0:
+            return idx, dist
+
+        for start, stop in self._blocks(len(rows)):
+            block_rows = rows[start:stop]
+            d = np.array(self.distances(block_rows), dtype=np.float32)
+            d[np.arange(len(block_rows)), block_rows] = np.inf
+            part = np.argpartition(d, k - 1, axis=1)[:, :k]
+            part_d = np.take_along_axis(d, part, axis=1)
+            order = np.argsort(part_d, axis=1, kind="stable")
+            idx[start:stop] = np.take_along_axis(part, order, axis=1)
+            dist[start:stop] = np.take_along_axis(part_d, order, axis=1)
+        return idx, dist
+
+    def neighbors(self, country: str, k: int = 5) -> pd.DataFrame:
+        """한 나라와 MBTI 분포가 가장 비슷한 나라 k개 (`Country`, `distance`)"""
+        idx, dist = self.nearest(self.store.row_of[country], k)
+        return pd.DataFrame({"Country": self.countries[idx[0]], "distance": dist[0]})
+
+
+def _build(store, metric: str) -> SimilarityEngine:
+    with metrics.timer("similarity_build"):
+        return SimilarityEngine(store, metric)
+
+
+def load_similarity(metric="cosine", path=FILE_PATH, year=None) -> SimilarityEngine:
+    """공용 저장소에 대한 유사도 엔진 (데이터 버전·척도마다 한 번만 계산해 공유)"""
+    store = load_store(path, year)
+    return store.derived(("similarity", metric), lambda: _build(store, metric))
+
+
+@on_reload
+def _carry_over(old, new, rows):
+    if rows is None:
+        return
+    for key, engine in old.derived_items():
+        if isinstance(key, tuple) and key[0] == "similarity":
+            new.set_derived(key, engine.updated(new, rows))
@@ -0,0 +1,133 @@
+"""국가 데이터 바이너리 스냅샷 (컴파일 + 메모리 매핑 로드).
+
+CSV를 매번 텍스트로 파싱하지 않도록 다음 파일들로 미리 변환해 둡니다.
+
+    <csv 이름>.snapshot/
+        matrix.npy     국가 × 16유형 float32 행렬
+        codes.npy      행별 국가 코드(int32) — names.json 의 인덱스
+        names.json     국가 이름 사전 (코드 → 이름)
+        meta.json      유형 순서, 행 수, 원본 CSV의 sha256
+
+페이지는 `matrix.npy` 를 `mmap_mode="r"` 로 열기 때문에 여러 Streamlit
+워커 프로세스가 같은 페이지 캐시를 복사 없이 공유합니다. 스냅샷이 없거나
+CSV 해시가 다르면(오래된 스냅샷) `None` 을 돌려주고 CSV 경로로 돌아갑니다.
+
+    python -m mbti.snapshot            # 기본 CSV를 스냅샷으로 컴파일
+    python -m mbti.snapshot --bench    # CSV vs 스냅샷 시작 시간·RSS 비교
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from .data import FILE_PATH, _read_csv, content_hash
+
+VERSION = 1
+
+
+def snapshot_dir(csv_path) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.with_name(csv_path.name + ".snapshot")
+
+
+def compile_snapshot(csv_path, out_dir=None) -> Path:
+    """CSV를 읽고 검증해서 스냅샷 디렉터리로 저장"""
+    out = Path(out_dir) if out_dir else snapshot_dir(csv_path)
+    out.mkdir(parents=True, exist_ok=True)
+    store = _read_csv(csv_path)
+
+    names, codes = np.unique(np.asarray(store.countries, dtype=object), return_inverse=True)
+    np.save(out / "matrix.npy", np.ascontiguousarray(store.matrix, dtype=np.float32))
+    np.save(out / "codes.npy", codes.astype(np.int32))
+    (out / "names.json").write_text(json.dumps(names.tolist(), ensure_ascii=False), encoding="utf-8")
+    # meta.json 을 마지막에 써서, 중간에 실패한 스냅샷은 열리지 않게 함
+    meta = {
+        "version": VERSION,
+        "types": list(store.types),
+        "rows": len(store),
+        "sha256": store.version,
+        "validation": store.report,
+    }
+    (out / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    return out
+
+
+def open_snapshot(csv_path):
+    """최신 스냅샷이면 (countries, types, 메모리 매핑 행렬, 버전, 검증 보고서), 아니면 None"""
+    snap = snapshot_dir(csv_path)
+    try:
+        meta = json.loads((snap / "meta.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    version = content_hash(csv_path)
+    if meta.get("version") != VERSION or meta.get("sha256") != version:
+        return None
+
+    matrix = np.load(snap / "matrix.npy", mmap_mode="r")
+    codes = np.load(snap / "codes.npy")
+    names = json.loads((snap / "names.json").read_text(encoding="utf-8"))
+    if matrix.shape != (meta["rows"], len(meta["types"])) or len(codes) != meta["rows"]:
+        return None
+    countries = [names[c] for c in codes]
+    return countries, meta["types"], matrix, version, meta.get("validation")
+
+
+# -------------------------------
+# 벤치마크: 새 프로세스에서 각 경로로 한 번 로드
+# -------------------------------
+_BENCH_CODE = """
+import resource, sys, time
+t0 = time.perf_counter()
+import pandas as pd, numpy as np
+t1 = time.perf_counter()
+if sys.argv[1] == "csv":
+    df = pd.read_csv(sys.argv[2], encoding="utf-8-sig")
+    cols = [c for c in df.columns if c != "Country"]
+    df[cols] = df[cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
+    n = len(df)
+else:
+    from mbti.snapshot import open_snapshot
+    countries, types, m, version, report = open_snapshot(sys.argv[2])
+    n = len(countries)
+t2 = time.perf_counter()
+print(n, (t2 - t1) * 1000, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def bench(csv_path, repeat=5):
+    if open_snapshot(csv_path) is None:
+        compile_snapshot(csv_path)
+    root = str(Path(__file__).resolve().parent.parent)
+    print(f"{'경로':<10}{'행 수':>8}{'로드(ms)':>12}{'최대 RSS(KB)':>16}")
+    for mode in ("csv", "snapshot"):
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run(
+                [sys.executable, "-c", _BENCH_CODE, mode, str(csv_path)],
+                cwd=root, check=True, capture_output=True, text=True,
+            ).stdout.split()
+            runs.append((int(out[0]), float(out[1]), int(out[2])))
+        n = runs[0][0]
+        ms = sorted(r[1] for r in runs)[len(runs) // 2]
+        rss = sorted(r[2] for r in runs)[len(runs) // 2]
+        print(f"{mode:<10}{n:>8}{ms:>12.2f}{rss:>16}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="국가 MBTI CSV → 바이너리 스냅샷")
+    parser.add_argument("csv", nargs="?", default=str(FILE_PATH))
+    parser.add_argument("--out", help="스냅샷 디렉터리 (기본: <csv>.snapshot)")
+    parser.add_argument("--bench", action="store_true", help="CSV와 스냅샷 로드 비교")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        bench(args.csv)
+    else:
+        print(f"스냅샷 생성: {compile_snapshot(args.csv, args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""연도별 국가 MBTI 분포 저장소 (연도 × 국가 × 유형, 메모리 매핑).
+
+매년 받는 CSV를 하나의 3차원 배열로 쌓아 둡니다.
+
+    <csv 이름>.years/
+        cube*.f32    float32 원시 배열, 모양 (연도, 국가, 16유형), C 순서
+        meta.json    연도·국가·유형 목록과 지금 쓰는 배열 파일 이름 ("cube")
+
+새 연도는 파일 끝에 한 판(국가 × 유형)을 덧붙이기만 하므로, 전체 연도를
+메모리에 올리지 않고도 저장소가 커질 수 있습니다. 그 해 데이터에 없는
+나라는 NaN 입니다. 새 나라가 생기면 국가 축을 늘린 새 파일에 한 해씩
+다시 쓰고, meta.json 을 바꿔 그 파일로 넘어갑니다.
+
+    python -m mbti.timeseries add 2026 countriesMBTI_16types.csv
+    python -m mbti.timeseries movers INFJ 2023 2026
+    python -m mbti.timeseries trend "Korea, Republic of"
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .countries import CountryIndex
+from .data import FILE_PATH, MBTI_TYPES, MBTIStore, _read_csv
+
+
+def years_dir(csv_path=FILE_PATH) -> Path:
+    csv_path = Path(csv_path)
+    return csv_path.with_name(csv_path.name + ".years")
+
+
+class YearStore:
+    """연도 × 국가 × 유형 배열 (읽기 전용 메모리 매핑)"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        meta = json.loads((self.root / "meta.json").read_text(encoding="utf-8"))
+        self.years = tuple(meta["years"])
+        self.countries = tuple(meta["countries"])
+        self.types = tuple(meta["types"])
+        self.version = meta["version"]
+        self.year_of = {y: i for i, y in enumerate(self.years)}
+        self.row_of = {c: i for i, c in enumerate(self.countries)}
+        self.col_of = {t: j for j, t in enumerate(self.types)}
+        shape = (len(self.years), len(self.countries), len(self.types))
+        self.cube = np.memmap(self.root / meta.get("cube", "cube.f32"), dtype=np.float32, mode="r", shape=shape)
+        self._index = None
+
+    # ── 이름·연도·유형 확인 (없으면 ValueError) ──────────────────
+    def row(self, country: str) -> int:
+        """나라 이름·별칭 → 국가 축 번호 ("Korea, Republic of" → South Korea 행)"""
+        if self._index is None:
+            self._index = CountryIndex(self.countries)
+        row = self._index.resolve(country)
+        if row is None:
+            hint = ", ".join(self._index.search(country, 5))
+            raise ValueError(f"나라를 찾을 수 없습니다: {country!r}" + (f" (혹시: {hint})" if hint else ""))
+        return row
+
+    def _year(self, year: int) -> int:
+        if year not in self.year_of:
+            raise ValueError(f"{year}년 데이터가 없습니다. (있는 연도: {', '.join(map(str, self.years))})")
+        return self.year_of[year]
+
+    def _col(self, mbti: str) -> int:
+        if mbti not in self.col_of:
+            raise ValueError(f"알 수 없는 MBTI 유형입니다: {mbti!r}")
+        return self.col_of[mbti]
+
+    def year_slab(self, year: int) -> np.ndarray:
+        """한 해의 국가 × 유형 (메모리 매핑 뷰)"""
+        return self.cube[self._year(year)]
+
+    def store(self, year: int) -> MBTIStore:
+        """한 해 데이터를 기존 페이지가 쓰는 MBTIStore 로 (그해 데이터가 없는 나라는 제외)"""
+        slab = self.year_slab(year)
+        missing = np.isnan(slab)
+        present = ~missing.all(axis=1)
+        matrix = slab if not missing.any() else np.nan_to_num(slab[present])
+        countries = np.asarray(self.countries, dtype=object)[present]
+        # 버전은 내용 해시 (저장소를 다른 데이터로 다시 만들어도 옛 캐시와 섞이지 않게)
+        h = hashlib.sha256()
+        h.update(json.dumps([list(countries), list(self.types)], ensure_ascii=False).encode("utf-8"))
+        h.update(np.ascontiguousarray(matrix, dtype=np.float32).tobytes())
+        return MBTIStore(countries, self.types, matrix, version=h.hexdigest())
+
+    def top(self, mbti: str, year: int, k: int = 10) -> pd.DataFrame:
+        """그해 mbti 비율 상위 k개 나라"""
+        values = self.year_slab(year)[:, self._col(mbti)]
+        values = np.where(np.isnan(values), -np.inf, values)
+        k = max(1, min(k, len(values)))
+        part = np.argpartition(-values, k - 1)[:k]
+        rows = part[np.argsort(-values[part], kind="stable")]
+        return pd.DataFrame({"Country": np.asarray(self.countries, dtype=object)[rows], mbti: values[rows]})
+
+    def movers(self, mbti: str, start: int, end: int, k: int = 10) -> pd.DataFrame:
+        """start → end 사이 mbti 비율이 가장 많이 변한 나라 k개 (절댓값 기준)"""
+        j = self._col(mbti)
+        a = self.cube[self._year(start), :, j]
+        b = self.cube[self._year(end), :, j]
+        delta = b - a
+        score = np.where(np.isnan(delta), -np.inf, np.abs(delta))
+        k = max(1, min(k, len(score)))
+        part = np.argpartition(-score, k - 1)[:k]
+        rows = part[np.argsort(-score[part], kind="stable")]
+        rows = rows[np.isfinite(score[rows])]
+        return pd.DataFrame({
+            "Country": np.asarray(self.countries, dtype=object)[rows],
+            str(start): a[rows],
+            str(end): b[rows],
+            "delta": delta[rows],
+        })
+
+    def trend(self, country: str) -> pd.DataFrame:
+        """한 나라(이름·별칭)의 연도별 16유형 비율 (행: 연도)"""
+        return pd.DataFrame(
+            np.asarray(self.cube[:, self.row(country), :]),
+            index=pd.Index(self.years, name="year"),
+            columns=list(self.types),
+        )
+
+    def deltas(self, start: int, end: int) -> np.ndarray:
+        """모든 나라·유형의 변화량 (국가 × 유형)"""
+        return self.cube[self._year(end)] - self.cube[self._year(start)]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 연도 추가 (쓰기)
+# ─────────────────────────────────────────────────────────────────
+def _write_meta(root: Path, meta: dict):
+    tmp = root / "meta.json.tmp"
+    tmp.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, root / "meta.json")
+
+
+def add_year(year: int, csv_path, root=None) -> Path:
+    """CSV 한 해치를 저장소에 추가 (이미 있는 연도면 덮어씀)
+
+    검증은 파일을 건드리기 전에 모두 끝내고, meta.json 교체를 마지막 한
+    단계로 둡니다. 국가 축을 늘릴 때는 새 이름의 배열 파일에 써 두고
+    meta.json 이 그 파일을 가리키게 바꾸므로, 중간에 실패해도 meta.json 과
+    배열 모양이 어긋나지 않습니다.
+    """
+    root = Path(root) if root else years_dir()
+    src = _read_csv(csv_path)
+
+    if (root / "meta.json").exists():
+        meta = json.loads((root / "meta.json").read_text(encoding="utf-8"))
+    else:
+        meta = {"years": [], "countries": [], "types": list(MBTI_TYPES), "version": 0}
+
+    # 연도는 정렬 상태로 유지해야 하므로, 끝에 붙일 수 없는 과거 연도는 거부
+    if year not in meta["years"] and meta["years"] and year < meta["years"][-1]:
+        raise ValueError(f"{year}년은 마지막 연도({meta['years'][-1]})보다 앞섭니다. 연도 순서대로 추가하세요.")
+
+    root.mkdir(parents=True, exist_ok=True)
+    types = meta["types"]
+    n_types = len(types)
+    n_years = len(meta["years"])
+    old_cube = root / meta.get("cube", "cube.f32")
+    cube_path = old_cube
+    known = set(meta["countries"])
+    new_countries = [c for c in src.countries if c not in known]
+    if new_countries:
+        # 국가 축 늘리기: 새 파일에 한 해씩 옮겨 써서 메모리 사용을 한 판 크기로 제한
+        old_n = len(meta["countries"])
+        countries = meta["countries"] + new_countries
+        cube_path = root / f"cube.{len(countries)}.f32"
+        tmp_path = cube_path.with_name(cube_path.name + ".tmp")
+        with open(tmp_path, "wb") as out:
+            if n_years:
+                old = np.memmap(old_cube, dtype=np.float32, mode="r", shape=(n_years, old_n, n_types))
+                for y in range(n_years):
+                    slab = np.full((len(countries), n_types), np.nan, dtype=np.float32)
+                    slab[:old_n] = old[y]
+                    out.write(slab.tobytes())
+                del old
+        os.replace(tmp_path, cube_path)
+        meta["countries"] = countries
+
+    row_of = {c: i for i, c in enumerate(meta["countries"])}
+    slab = np.full((len(meta["countries"]), n_types), np.nan, dtype=np.float32)
+    cols = [src.col_of[t] for t in types]
+    slab[[row_of[c] for c in src.countries]] = np.asarray(src.matrix, dtype=np.float32)[:, cols]
+
+    if year in meta["years"]:
+        i = meta["years"].index(year)
+        cube = np.memmap(cube_path, dtype=np.float32, mode="r+", shape=(n_years, len(row_of), n_types))
+        cube[i] = slab
+        cube.flush()
+        del cube
+    else:
+        with open(cube_path, "ab") as f:
+            # 지난번 추가가 meta.json 을 쓰기 전에 멈췄다면 남은 꼬리를 잘라내고 붙임
+            f.truncate(n_years * slab.nbytes)
+            f.write(slab.tobytes())
+        meta["years"].append(year)
+
+    meta["cube"] = cube_path.name
+    meta["version"] += 1
+    _write_meta(root, meta)
+    if cube_path != old_cube and old_cube.exists():
+        old_cube.unlink()
+    return root
+
+
+# ─────────────────────────────────────────────────────────────────
+# 공유 로드 (meta.json 이 바뀌면 다시 엶)
+# ─────────────────────────────────────────────────────────────────
+_lock = threading.Lock()
+_cache = {}
+
+
+def load_years(csv_path=FILE_PATH):
+    """연도 저장소 (없으면 None)"""
+    root = years_dir(csv_path)
+    try:
+        mtime = (root / "meta.json").stat().st_mtime_ns
+    except OSError:
+        return None
+    key = str(root)
+    with _lock:
+        cached = _cache.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = _cache[key] = (mtime, YearStore(root), {})
+    return cached[1]
+
+
+def available_years(csv_path=FILE_PATH) -> list:
+    ys = load_years(csv_path)
+    return list(ys.years) if ys else []
+
+
+def load_year_store(year: int, csv_path=FILE_PATH) -> MBTIStore:
+    """한 해치 MBTIStore (연도 저장소 버전마다 한 번만 만들어 공유)"""
+    ys = load_years(csv_path)
+    if ys is None or year not in ys.year_of:
+        raise ValueError(f"{year}년 데이터가 없습니다.")
+    stores = _cache[str(years_dir(csv_path))][2]
+    with _lock:
+        if year not in stores:
+            stores[year] = ys.store(year)
+        return stores[year]
+
+
+# ─────────────────────────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="연도별 국가 MBTI 저장소")
+    parser.add_argument("--data", default=str(FILE_PATH), help="기준 CSV (저장소 위치 결정)")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("add", help="연도 추가")
+    p.add_argument("year", type=int)
+    p.add_argument("csv")
+    p = sub.add_parser("movers", help="두 해 사이 가장 많이 변한 나라")
+    p.add_argument("mbti")
+    p.add_argument("start", type=int)
+    p.add_argument("end", type=int)
+    p.add_argument("-k", type=int, default=10)
+    p = sub.add_parser("trend", help="한 나라의 연도별 분포")
+    p.add_argument("country")
+    p = sub.add_parser("top", help="그해 상위 나라")
+    p.add_argument("mbti")
+    p.add_argument("year", type=int)
+    p.add_argument("-k", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if args.cmd == "add":
+        try:
+            print(f"저장: {add_year(args.year, args.csv, years_dir(args.data))}")
+        except ValueError as e:
+            raise SystemExit(str(e))
+        return
+    ys = load_years(args.data)
+    if ys is None:
+        raise SystemExit("연도 저장소가 없습니다. 먼저 `add` 로 연도를 추가하세요.")
+    try:
+        if args.cmd == "movers":
+            print(ys.movers(args.mbti.upper(), args.start, args.end, args.k).to_string(index=False))
+        elif args.cmd == "trend":
+            print(ys.trend(args.country).to_string())
+        else:
+            print(ys.top(args.mbti.upper(), args.year, args.k).to_string(index=False))
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""국가 CSV 검증·정규화 (적재할 때 한 번만).
+
+페이지가 재실행마다 하던 숫자 변환과 `%`·`,` 정리를 여기서 한 번에
+처리하고, 무엇을 고쳤는지 보고서로 남깁니다.
+
+- 16개 유형 열을 하나의 배열로 펼쳐 한 번에 숫자로 변환
+  ("12.5%" → 0.125, "0,125" → 0.125, 숫자가 아니면 0)
+- 값이 퍼센트 단위(행 합계 ≈ 100)면 1/100 로 환산
+- 나라별 16유형 합계가 1 ± `ROW_SUM_TOL` 인지 확인, 원하면 합계 1로 재정규화
+- 빈 나라 이름은 빼고, 중복된 나라는 처음 나온 행만 남김
+
+    python -m mbti.validate                       # 기본 CSV 검사 보고서
+    python -m mbti.validate raw.csv --renormalize --out clean.csv
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .data import FILE_PATH, MBTI_TYPES
+
+# 행 합계 허용 오차 (반올림된 원자료 기준)
+ROW_SUM_TOL = 0.02
+
+# 기본 재정규화 여부 (환경 변수로 켬)
+RENORMALIZE = os.environ.get("MBTI_RENORMALIZE", "").lower() in ("1", "true", "yes")
+
+
+def read_csv(path) -> pd.DataFrame:
+    """국가 CSV 읽기 (빈 칸만 결측으로, "NA"(나미비아) 같은 이름은 그대로)"""
+    return pd.read_csv(path, encoding="utf-8-sig", dtype={"Country": str}, keep_default_na=False, na_values=[""])
+
+
+def check_columns(df: pd.DataFrame) -> list:
+    """`Country` + 16유형 열 구조 검사 → 유형 열 이름 목록 (파일 순서)"""
+    if "Country" not in df.columns:
+        raise ValueError("CSV에 'Country' 컬럼이 없습니다.")
+    mbti_cols = [c for c in df.columns if c != "Country"]
+    missing = [t for t in MBTI_TYPES if t not in mbti_cols]
+    if missing:
+        raise ValueError(f"CSV에 MBTI 유형 컬럼이 없습니다: {missing}")
+    extra = [c for c in mbti_cols if c not in MBTI_TYPES]
+    if extra:
+        raise ValueError(f"알 수 없는 컬럼이 있습니다: {extra}")
+    return mbti_cols
+
+
+def coerce(values: np.ndarray):
+    """2차원 값 배열 → (float64 배열, 숫자가 아니던 칸 수, "%" 가 붙었던 칸 수)"""
+    if values.dtype.kind in "biuf":
+        out = values.astype(np.float64)
+        bad = np.isnan(out)
+        out[bad] = 0.0
+        return out, int(bad.sum()), 0
+
+    flat = pd.Series(values.ravel(), dtype=object)
+    text = flat.astype(str).str.strip()
+    percent = text.str.endswith("%").to_numpy()
+    text = text.str.replace("%", "", regex=False).str.replace(",", ".", regex=False)
+    # pandas 3 의 to_numpy() 는 읽기 전용일 수 있어 항상 복사본으로
+    out = pd.to_numeric(text, errors="coerce").to_numpy(dtype=np.float64, copy=True)
+    # 원래 비어 있던 칸(NaN)은 조용히 0, 글자가 있었는데 숫자가 아니면 보고
+    bad = np.isnan(out) & flat.notna().to_numpy()
+    out[percent] /= 100.0
+    out = np.nan_to_num(out, nan=0.0).reshape(values.shape)
+    return out, int(bad.sum()), int(percent.sum())
+
+
+def clean_frame(df: pd.DataFrame, tol: float = ROW_SUM_TOL, renormalize: bool = RENORMALIZE):
+    """읽은 CSV → (국가 목록, 유형 목록, 국가 × 유형 행렬, 보고서 dict)"""
+    df.columns = df.columns.str.strip()
+    mbti_cols = check_columns(df)
+    report = {"rows_in": len(df)}
+
+    countries = df["Country"].astype(str).str.strip()
+    blank = df["Country"].isna().to_numpy() | countries.eq("").to_numpy()
+    dup = countries.duplicated(keep="first").to_numpy() & ~blank
+    report["blank_countries"] = int(blank.sum())
+    report["duplicate_countries"] = sorted(set(countries[dup]))
+    keep = ~(blank | dup)
+
+    matrix, report["non_numeric_cells"], report["percent_cells"] = coerce(df[mbti_cols].to_numpy()[keep])
+    countries = countries[keep].tolist()
+
+    sums = matrix.sum(axis=1)
+    # 퍼센트 표기("12.5")로 저장된 표는 전체를 한 번에 환산
+    report["scaled_from_percent"] = bool(len(sums) and np.median(sums) > 50)
+    if report["scaled_from_percent"]:
+        matrix /= 100.0
+        sums /= 100.0
+
+    report["negative_cells"] = int((matrix < 0).sum())
+    off = np.abs(sums - 1.0) > tol
+    report["row_sum_min"] = float(sums.min()) if len(sums) else None
+    report["row_sum_max"] = float(sums.max()) if len(sums) else None
+    report["row_sum_tol"] = tol
+    report["off_tolerance"] = [countries[i] for i in np.flatnonzero(off)]
+    report["renormalized"] = bool(renormalize)
+    if renormalize:
+        matrix = matrix / np.where(sums > 0, sums, 1.0)[:, None]
+    report["rows_out"] = len(countries)
+    return countries, mbti_cols, matrix, report
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"행: {report['rows_in']} → {report['rows_out']}",
+        f"빈 나라 이름: {report['blank_countries']}",
+        f"중복 나라: {', '.join(report['duplicate_countries']) or '없음'}",
+        f"숫자가 아닌 칸: {report['non_numeric_cells']}",
+        f"'%' 표기 칸: {report['percent_cells']} (퍼센트 단위 표 환산: {'예' if report['scaled_from_percent'] else '아니오'})",
+        f"음수 칸: {report['negative_cells']}",
+        f"행 합계 범위: {report['row_sum_min']} ~ {report['row_sum_max']} (허용 오차 ±{report['row_sum_tol']})",
+        f"허용 오차 밖: {', '.join(report['off_tolerance']) or '없음'}",
+        f"재정규화: {'예' if report['renormalized'] else '아니오'}",
+    ]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="국가 MBTI CSV 검증·정규화")
+    parser.add_argument("csv", nargs="?", default=str(FILE_PATH))
+    parser.add_argument("--tol", type=float, default=ROW_SUM_TOL, help="행 합계 허용 오차")
+    parser.add_argument("--renormalize", action="store_true", help="행 합계를 1로 맞춤")
+    parser.add_argument("--out", help="정리된 CSV 저장 경로")
+    parser.add_argument("--report", help="보고서 JSON 저장 경로")
+    parser.add_argument("--strict", action="store_true", help="문제가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    df = read_csv(args.csv)
+    countries, cols, matrix, report = clean_frame(df, args.tol, args.renormalize)
+    print(format_report(report))
+
+    if args.out:
+        out = pd.DataFrame(matrix, columns=cols)
+        out.insert(0, "Country", countries)
+        out.to_csv(args.out, index=False, encoding="utf-8-sig")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    problems = (
+        report["blank_countries"] or report["duplicate_countries"] or report["non_numeric_cells"]
+        or report["negative_cells"] or (report["off_tolerance"] and not args.renormalize)
+    )
+    if args.strict and problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
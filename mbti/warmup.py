@@ -0,0 +1,79 @@
+"""서버 시작 시 공용 캐시 미리 데우기 (백그라운드 스레드 풀).
+
+배포·재시작 뒤 첫 방문자가 데이터 로드와 랭킹·그룹 합계·테스트 추천표
+계산을 떠안지 않도록, 첫 스크립트 실행 때 `start_warmup()` 이 이 작업들을
+백그라운드로 돌립니다. 요청 처리는 막지 않으며, 끝났는지는 `is_ready()`,
+작업별 소요 시간과 오류는 `status()` 로 확인합니다.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import metrics
+from .bootstrap import load_rank_intervals
+from .clusters import load_clusters
+from .countries import load_country_index
+from .data import FILE_PATH, load_store
+from .groups import GROUPS, load_group_table
+from .quiz import top_table
+from .ranking import load_rank_index
+from .similarity import load_similarity
+
+_lock = threading.Lock()
+_started = False
+_ready = threading.Event()
+_status = {}
+
+
+def _run(name, fn):
+    t0 = time.perf_counter()
+    try:
+        fn()
+        _status[name] = {"ok": True, "ms": (time.perf_counter() - t0) * 1000}
+    except Exception as e:
+        _status[name] = {"ok": False, "ms": (time.perf_counter() - t0) * 1000, "error": str(e)}
+    metrics.observe(f"warmup:{name}", _status[name]["ms"])
+
+
+def _warm(path, workers):
+    t0 = time.perf_counter()
+    _run("load_store", lambda: load_store(path))
+    tasks = {
+        # 16유형 + 기질 그룹 정렬 순서
+        "rankings": lambda: load_rank_index(path),
+        "group_sums": lambda: load_group_table(GROUPS, path),
+        "quiz_top5": lambda: top_table(5, path),
+        "similarity": lambda: load_similarity("cosine", path),
+        "country_index": lambda: load_country_index(path),
+        "clusters": lambda: load_clusters(path),
+        "bootstrap": lambda: load_rank_intervals(path),
+    }
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mbti-warmup") as pool:
+        for name, fn in tasks.items():
+            pool.submit(_run, name, fn)
+    _status["total"] = {"ok": all(s["ok"] for s in _status.values()), "ms": (time.perf_counter() - t0) * 1000}
+    _ready.set()
+
+
+def start_warmup(path=FILE_PATH, workers: int = 4) -> bool:
+    """프로세스당 한 번만 백그라운드 워밍업 시작 (이미 시작했으면 False)"""
+    global _started
+    with _lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=_warm, args=(path, workers), name="mbti-warmup", daemon=True).start()
+    return True
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def wait_ready(timeout=None) -> bool:
+    return _ready.wait(timeout)
+
+
+def status() -> dict:
+    """작업별 {"ok", "ms", "error"} (진행 중인 작업은 아직 없음)"""
+    return {"ready": is_ready(), "tasks": dict(_status)}
@@ -1,7 +1,15 @@
 import streamlit as st
-import pandas as pd
 import altair as alt
 
+from mbti.countries import load_country_index
+from mbti.data import load_data
+from mbti.figures import cached_figure
+from mbti.page import rank_intervals, setup
+from mbti.paging import (
+    PAGE_SIZES, format_bytes, highlight, n_pages, overview_chart, page_chart, page_frame, page_of, page_rows, payload,
+)
+from mbti.ranking import load_rank_index
+
 # 제목
 st.markdown(
     "<h1 style='text-align: center;'>🌍 MBTI 유형별<br>상위 10개 국가 시각화</h1>",
@@ -9,38 +17,96 @@ st.markdown(
 )
 
 
-# 파일 읽기
-file_path = "countriesMBTI_16types.csv"
-df = pd.read_csv(file_path)
+# 공통 준비 (캐시 워밍업 + 연도 선택)
+year = setup()
 
-# MBTI 유형 리스트 (Country 제외)
-mbti_types = [col for col in df.columns if col != "Country"]
+# 파일 읽기 (공용 저장소)
+df, mbti_types = load_data(year=year)
+ranks = load_rank_index(year=year)
+intervals = rank_intervals(year)
 
-# 사용자 선택
-selected_type = st.selectbox("🔍 MBTI 유형을 선택하세요:", mbti_types)
 
-# 선택한 유형 기준으로 정렬 후 상위 10개 추출
-top10 = df[["Country", selected_type]].sort_values(by=selected_type, ascending=False).head(10)
-
-# Altair 그래프 생성
-chart = (
-    alt.Chart(top10)
-    .mark_bar(color="#4C9AFF")
-    .encode(
-        x=alt.X(selected_type, title=f"{selected_type} 비율"),
-        y=alt.Y("Country", sort='-x', title="국가"),
-        tooltip=["Country", selected_type]
+def full_ranking(key: str):
+    """전체 순위: 보고 있는 페이지만 서버에서 잘라 보내고, 전체는 개요 그래프로"""
+    c1, c2, c3 = st.columns([1, 1, 2])
+    size = c1.selectbox("페이지당 나라 수", PAGE_SIZES, index=1)
+    find = c3.text_input("🔎 나라 위치 찾기", placeholder="예: Korea, 일본, brazil")
+    row = load_country_index(year=year).resolve(find) if find else None
+    if find and row is None:
+        c3.caption("그런 나라를 찾지 못했어요. 🙂")
+    start_page = page_of(ranks, key, row, size) if row is not None else 1
+    page = c2.number_input(
+        f"페이지 (전체 {n_pages(ranks, size)})", min_value=1, max_value=n_pages(ranks, size),
+        value=start_page, key=f"page00-{key}-{size}-{row}",
     )
-    .properties(
-        title=f"🌟 {selected_type} 유형 비율이 높은 상위 10개 국가",
-        width=600,
-        height=400
+
+    frame = page_frame(ranks, key, page, size)
+    if intervals is not None:
+        rows, _ = page_rows(ranks, key, page, size)
+        frame = frame.assign(**intervals.columns(key, rows, 10))
+    first, last = int(frame["순위"].iloc[0]), int(frame["순위"].iloc[-1])
+
+    # 개요는 유형마다 한 번 만든 스펙에 지금 페이지 음영만 덧씌움
+    version = ranks.store.version
+    overview = highlight(cached_figure(("00", "overview", key, version), lambda: overview_chart(ranks, key)), first, last)
+    chart = cached_figure(("00", "page", key, page, size, version), lambda: page_chart(frame, key, key))
+    st.plotly_chart(overview, use_container_width=True)
+    st.plotly_chart(chart, use_container_width=True)
+    st.dataframe(frame, use_container_width=True, hide_index=True)
+
+    sent = payload(frame, overview, chart)
+    st.caption(
+        f"📦 이번 화면 전송량: 표 {format_bytes(sent['table'])} + 그래프 {format_bytes(sent['chart'])}"
+        f" = {format_bytes(sent['total'])} (전체 {len(ranks.countries)}개 나라 중 {len(frame)}행만 전송)"
     )
-)
 
-# 그래프 출력
-st.altair_chart(chart, use_container_width=True)
 
-# 데이터 표시
-st.subheader(f"📋 {selected_type} 상위 10개 국가 데이터")
-st.dataframe(top10.reset_index(drop=True))
+@st.fragment
+def type_view():
+    """유형 선택 → 그래프·표 (선택을 바꾸면 이 부분만 다시 실행)"""
+    # 사용자 선택
+    selected_type = st.selectbox("🔍 MBTI 유형을 선택하세요:", mbti_types)
+    if st.radio("보기", ["TOP 10", "전체 순위"], horizontal=True, label_visibility="collapsed") == "전체 순위":
+        full_ranking(selected_type)
+        return
+
+    # 선택한 유형 기준 상위 10개 (미리 만든 랭킹 인덱스에서 잘라오기)
+    top10 = ranks.top_frame(selected_type, 10)
+
+    # Altair 그래프 생성
+    def build_chart():
+        chart = (
+            alt.Chart(top10)
+            .mark_bar(color="#4C9AFF")
+            .encode(
+                x=alt.X(selected_type, title=f"{selected_type} 비율"),
+                y=alt.Y("Country", sort='-x', title="국가"),
+                tooltip=["Country", selected_type]
+            )
+            .properties(
+                title=f"🌟 {selected_type} 유형 비율이 높은 상위 10개 국가",
+                width=600,
+                height=400
+            )
+        )
+        return chart
+
+    # 그래프 출력 (같은 유형·데이터 버전이면 캐시된 스펙 재사용)
+    spec = cached_figure(("00", "bar", selected_type, ranks.store.version), build_chart)
+    st.vega_lite_chart(spec, use_container_width=True)
+
+    # 데이터 표시
+    st.subheader(f"📋 {selected_type} 상위 10개 국가 데이터")
+    if intervals is None:
+        table = top10.reset_index(drop=True)
+        st.dataframe(table)
+        st.caption("⏳ 순위 범위·TOP10 확률은 계산 중이에요. 잠시 후 다시 선택하면 함께 보여드려요.")
+    else:
+        rows = ranks.top(selected_type, 10)
+        table = top10.assign(**intervals.columns(selected_type, rows, 10)).reset_index(drop=True)
+        st.dataframe(table)
+        st.caption(f"🎲 {intervals.describe()}")
+    st.caption(f"📦 이번 화면 전송량: {format_bytes(payload(table, spec)['total'])}")
+
+
+type_view()
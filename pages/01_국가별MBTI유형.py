@@ -2,50 +2,27 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+from mbti.countries import load_country_index
+from mbti.data import load_store
+from mbti.figures import cached_figure
+from mbti.page import setup
+
 st.set_page_config(page_title="MBTI by Country", page_icon="🌍", layout="wide")
 st.title("MBTI 비율: 국가별 보기 🌍")
 st.caption("국가를 선택하면 16개 MBTI 유형 비율을 보여줍니다. 🧭")
 
-FILE_PATH = "countriesMBTI_16types.csv"
-df = pd.read_csv(FILE_PATH, encoding="utf-8-sig")
-df.columns = df.columns.str.strip()
-
-if "Country" not in df.columns:
-    st.error("'Country' 컬럼이 없습니다. CSV 헤더를 확인하세요.")
-    st.stop()
-
-mbti_cols = [c for c in df.columns if c != "Country"]
-df[mbti_cols] = df[mbti_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
-
-countries = df["Country"].astype(str).sort_values().tolist()
-default_country = "Korea, Republic of" if "Korea, Republic of" in countries else countries[0]
-country = st.selectbox("나라 선택", countries, index=countries.index(default_country))
+# 공통 준비 (캐시 워밍업 + 연도 선택)
+year = setup()
 
-row = df.loc[df["Country"] == country]
-if row.empty:
-    st.error(f"{country} 가 데이터에 없습니다.")
+try:
+    store = load_store(year=year)
+    # 이름·별칭 → 행 번호 해시 인덱스 + 검색 구조 (데이터 버전마다 한 번)
+    index = load_country_index(year=year)
+except Exception as e:
+    st.error(f"데이터를 불러오지 못했습니다: {e}")
     st.stop()
 
-series = row.iloc[0].drop(labels=["Country"])
-data = series.reset_index()
-data.columns = ["MBTI", "ratio"]
-
-# ← 문제 해결 포인트
-if data["ratio"].dtype == "object":
-    data["ratio"] = (
-        data["ratio"].astype(str)
-        .str.replace("%", "", regex=False)
-        .str.replace(",", ".", regex=False)
-        .str.strip()
-    )
-data["ratio"] = pd.to_numeric(data["ratio"], errors="coerce")
-
-if data["ratio"].isna().all():
-    st.error("비율 값이 모두 숫자가 아닙니다. CSV의 값(%, 공백, 콤마 등)을 확인해주세요.")
-    st.stop()
-
-data = data.sort_values("ratio", ascending=False)
-data["percent"] = (data["ratio"] * 100).round(2)
+mbti_cols = list(store.types)
 
 palette = (
     px.colors.qualitative.Set3
@@ -53,29 +30,55 @@ palette = (
     + px.colors.qualitative.Pastel2
     + px.colors.qualitative.Safe
 )
-colors = palette[: len(data)]
-
-fig = px.bar(
-    data,
-    x="percent",
-    y="MBTI",
-    orientation="h",
-    color="MBTI",
-    color_discrete_sequence=colors,
-    hover_data={"ratio": False, "MBTI": True, "percent": True},
-    labels={"percent": "비율(%)", "MBTI": "유형"},
-    title=f"{country} — MBTI 비율"
-)
-fig.update_traces(text=[f"{p}%" for p in data["percent"]], textposition="outside")
-fig.update_layout(showlegend=False, yaxis=dict(categoryorder="total ascending"))
-st.plotly_chart(fig, use_container_width=True)
-
-st.subheader("상위 3개 유형 🏅")
-top3 = data.head(3).reset_index(drop=True)
-c1, c2, c3 = st.columns(3)
-c1.metric(top3.loc[0, "MBTI"], f"{top3.loc[0, 'percent']}%")
-c2.metric(top3.loc[1, "MBTI"], f"{top3.loc[1, 'percent']}%")
-c3.metric(top3.loc[2, "MBTI"], f"{top3.loc[2, 'percent']}%")
-
-with st.expander("원본 값 보기"):
-    st.dataframe(data[["MBTI", "percent"]].rename(columns={"percent": "비율(%)"}), use_container_width=True)
+
+
+@st.fragment
+def country_view():
+    """나라 선택 → 그래프·상위 3개 유형 (선택을 바꾸면 이 부분만 다시 실행)"""
+    query = st.text_input("🔎 나라 검색 (영문·한글·별칭)", placeholder="예: korea, 미국, turkiye")
+    options = index.choices(query)
+    if not options:
+        st.info(f"'{query}' 에 맞는 나라가 없어요. 철자를 확인해주세요.")
+        return
+    default = index.default()
+    country = st.selectbox("나라 선택", options, index=options.index(default) if default in options else 0)
+
+    # 값은 적재할 때 이미 숫자로 검증·정리됨 (mbti.validate)
+    data = pd.DataFrame({"MBTI": mbti_cols, "ratio": store.matrix[index.resolve(country)]})
+
+    data = data.sort_values("ratio", ascending=False)
+    data["percent"] = (data["ratio"] * 100).round(2)
+
+    colors = palette[: len(data)]
+
+    def build_chart():
+        fig = px.bar(
+            data,
+            x="percent",
+            y="MBTI",
+            orientation="h",
+            color="MBTI",
+            color_discrete_sequence=colors,
+            hover_data={"ratio": False, "MBTI": True, "percent": True},
+            labels={"percent": "비율(%)", "MBTI": "유형"},
+            title=f"{country} — MBTI 비율"
+        )
+        fig.update_traces(text=[f"{p}%" for p in data["percent"]], textposition="outside")
+        fig.update_layout(showlegend=False, yaxis=dict(categoryorder="total ascending"))
+        return fig
+
+    spec = cached_figure(("01", "bar", country, store.version), build_chart)
+    st.plotly_chart(spec, use_container_width=True)
+
+    st.subheader("상위 3개 유형 🏅")
+    top3 = data.head(3).reset_index(drop=True)
+    c1, c2, c3 = st.columns(3)
+    c1.metric(top3.loc[0, "MBTI"], f"{top3.loc[0, 'percent']}%")
+    c2.metric(top3.loc[1, "MBTI"], f"{top3.loc[1, 'percent']}%")
+    c3.metric(top3.loc[2, "MBTI"], f"{top3.loc[2, 'percent']}%")
+
+    with st.expander("원본 값 보기"):
+        st.dataframe(data[["MBTI", "percent"]].rename(columns={"percent": "비율(%)"}), use_container_width=True)
+
+
+country_view()
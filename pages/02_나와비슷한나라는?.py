@@ -1,8 +1,15 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import hashlib
 
+from mbti.countries import load_country_index
+from mbti.data import load_store
+from mbti.figures import cached_figure
+from mbti.page import rank_intervals, setup
+from mbti.query import rank_countries
+from mbti.ranking import load_rank_index
+from mbti.similarity import METRICS, METRIC_LABELS, load_similarity
+
 # -------------------------------
 # 페이지 기본 설정
 # -------------------------------
@@ -11,50 +18,20 @@ st.set_page_config(page_title="당신과 비슷한 사람들이 많은 나라는
 st.title("🌍 당신과 비슷한 사람들이 많은 나라는?")
 st.caption("MBTI를 선택하면, 그 유형의 비율이 높은 국가 TOP 7을 여행 추천처럼 보여드려요! ✈️🍜🏙️🏝️")
 
-FILE_PATH = "countriesMBTI_16types.csv"
-
 # -------------------------------
-# 데이터 로드 & 전처리
+# 데이터 로드 (공용 저장소, 프로세스당 한 번)
 # -------------------------------
-@st.cache_data
-def load_data(path: str) -> pd.DataFrame:
-    df_ = pd.read_csv(path, encoding="utf-8-sig")
-    df_.columns = df_.columns.str.strip()
-    if "Country" not in df_.columns:
-        raise ValueError("CSV에 'Country' 컬럼이 없습니다.")
-    # MBTI 열만 숫자로 강제 변환
-    mbti_cols_ = [c for c in df_.columns if c != "Country"]
-    df_[mbti_cols_] = df_[mbti_cols_].apply(pd.to_numeric, errors="coerce").fillna(0.0)
-    return df_, mbti_cols_
+# 공통 준비 (캐시 워밍업 + 연도 선택)
+year = setup()
 
 try:
-    df, mbti_cols = load_data(FILE_PATH)
+    mbti_cols = list(load_store(year=year).types)
+    ranks = load_rank_index(year=year)
+    intervals = rank_intervals(year)
 except Exception as e:
     st.error(f"데이터를 불러오지 못했습니다: {e}")
     st.stop()
 
-# -------------------------------
-# UI: MBTI 선택
-# -------------------------------
-# 보기 좋게 고정 순서(알파벳)로 정렬
-mbti_types = sorted(mbti_cols)
-default_mbti = "ENFP" if "ENFP" in mbti_types else mbti_types[0]
-
-st.markdown("### 🧠 나의 MBTI를 골라주세요")
-selected_mbti = st.selectbox("MBTI 선택", mbti_types, index=mbti_types.index(default_mbti))
-
-# -------------------------------
-# 계산: 선택 MBTI가 높은 국가 TOP 7
-# -------------------------------
-top7 = (
-    df[["Country", selected_mbti]]
-    .sort_values(by=selected_mbti, ascending=False)
-    .head(7)
-    .rename(columns={selected_mbti: "ratio"})
-    .reset_index(drop=True)
-)
-top7["percent"] = (top7["ratio"] * 100).round(2)
-
 # -------------------------------
 # 시각 요소: 파스텔 팔레트 + 이모지
 # -------------------------------
@@ -64,7 +41,6 @@ palette = (
     + px.colors.qualitative.Pastel2
     + px.colors.qualitative.Safe
 )
-colors = palette[: len(top7)]
 
 # 나라별로 귀여운 추천 이모지 뽑기(해시로 안정적 배정)
 emoji_pool = ["🏖️", "🏙️", "🏔️", "🌋", "🏜️", "⛩️", "🏰", "🎎", "🌉", "🕌", "🛕", "🗼", "🗽", "🌊", "🌴", "☕️", "🍜", "🍣", "🥐", "🌮"]
@@ -76,49 +52,116 @@ def pick_emojis(name: str, k: int = 2):
     return [e1, e2] if e1 != e2 else [e1, "✨"]
 
 # -------------------------------
-# 레이아웃: 좌(추천 리스트) / 우(막대그래프)
+# 추천 화면 (fragment: 선택을 바꾸면 이 부분만 다시 실행)
 # -------------------------------
-left, right = st.columns([0.58, 0.42])
+@st.fragment
+def recommend_view():
+    # UI: MBTI 선택 — 보기 좋게 고정 순서(알파벳)로 정렬
+    mbti_types = sorted(mbti_cols)
+    default_mbti = "ENFP" if "ENFP" in mbti_types else mbti_types[0]
 
-with left:
-    st.markdown(f"### ✈️ 여행처럼 추천할게요 — **{selected_mbti}** 와(과) 비슷한 사람들이 많은 나라 TOP 7")
-    for i, row in top7.iterrows():
-        rank_medal = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣"][i]
-        e1, e2 = pick_emojis(row["Country"])
-        st.markdown(
-            f"{rank_medal} **{row['Country']}** — {row['percent']}%  {e1}{e2}",
-            help="막대그래프에서 자세히 볼 수 있어요!"
-        )
-
-    with st.expander("🔎 표로 보기"):
-        st.dataframe(
-            top7[["Country", "percent"]].rename(columns={"Country": "국가", "percent": "비율(%)"}),
-            use_container_width=True,
-            hide_index=True
-        )
-
-with right:
-    st.markdown("### 📊 TOP 7 막대그래프")
-    chart = px.bar(
-        top7.sort_values("percent", ascending=True),
-        x="percent",
-        y="Country",
-        orientation="h",
-        text="percent",
-        color="Country",
-        color_discrete_sequence=colors,
-        labels={"percent": "비율(%)", "Country": "국가"},
-        title=f"'{selected_mbti}' 비율이 높은 나라"
-    )
-    chart.update_traces(texttemplate="%{text}%", textposition="outside")
-    chart.update_layout(
-        showlegend=False,
-        xaxis=dict(title="비율(%)"),
-        yaxis=dict(title="국가"),
-        margin=dict(l=80, r=40, t=80, b=40),
-        height=520
+    st.markdown("### 🧠 나의 MBTI를 골라주세요")
+    selected_mbti = st.selectbox("MBTI 선택", mbti_types, index=mbti_types.index(default_mbti))
+
+    # 두 번째 유형을 섞고 싶을 때 (예: ENFP 70% + INFP 30%)
+    with st.expander("🎛️ 다른 유형과 섞어보기"):
+        blend_mbti = st.selectbox("섞을 유형", ["없음"] + [t for t in mbti_types if t != selected_mbti])
+        blend_share = st.slider("섞을 유형의 비중(%)", 0, 100, 30, step=10)
+
+    # 계산: 선택 MBTI가 높은 국가 TOP 7
+    if blend_mbti == "없음" or blend_share == 0:
+        mbti_label = selected_mbti
+        top7 = ranks.top_frame(selected_mbti, 7, value_name="ratio")
+        if intervals is not None:
+            top7 = top7.assign(**intervals.columns(selected_mbti, ranks.top(selected_mbti, 7), 7))
+    else:
+        share = blend_share / 100
+        mbti_label = f"{selected_mbti} {100 - blend_share}% + {blend_mbti} {blend_share}%"
+        top7 = rank_countries({selected_mbti: 1 - share, blend_mbti: share}, 7, value_name="ratio", year=year)
+    top7["percent"] = (top7["ratio"] * 100).round(2)
+
+    colors = palette[: len(top7)]
+
+    # 레이아웃: 좌(추천 리스트) / 우(막대그래프)
+    left, right = st.columns([0.58, 0.42])
+
+    with left:
+        st.markdown(f"### ✈️ 여행처럼 추천할게요 — **{mbti_label}** 와(과) 비슷한 사람들이 많은 나라 TOP 7")
+        for i, row in top7.iterrows():
+            rank_medal = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣"][i]
+            e1, e2 = pick_emojis(row["Country"])
+            spread = f"  ·  순위 {row['순위 범위']} (TOP7 확률 {row['TOP7 확률(%)']}%)" if "순위 범위" in top7 else ""
+            st.markdown(
+                f"{rank_medal} **{row['Country']}** — {row['percent']}%  {e1}{e2}{spread}",
+                help="막대그래프에서 자세히 볼 수 있어요!"
+            )
+        if "순위 범위" in top7:
+            st.caption(f"🎲 {intervals.describe()}")
+
+        with st.expander("🔎 표로 보기"):
+            st.dataframe(
+                top7[["Country", "percent"] + [c for c in ("순위 범위", "TOP7 확률(%)") if c in top7]]
+                .rename(columns={"Country": "국가", "percent": "비율(%)"}),
+                use_container_width=True,
+                hide_index=True
+            )
+
+    with right:
+        st.markdown("### 📊 TOP 7 막대그래프")
+        def build_chart():
+            chart = px.bar(
+                top7.sort_values("percent", ascending=True),
+                x="percent",
+                y="Country",
+                orientation="h",
+                text="percent",
+                color="Country",
+                color_discrete_sequence=colors,
+                labels={"percent": "비율(%)", "Country": "국가"},
+                title=f"'{mbti_label}' 비율이 높은 나라"
+            )
+            chart.update_traces(texttemplate="%{text}%", textposition="outside")
+            chart.update_layout(
+                showlegend=False,
+                xaxis=dict(title="비율(%)"),
+                yaxis=dict(title="국가"),
+                margin=dict(l=80, r=40, t=80, b=40),
+                height=520
+            )
+            return chart
+
+        spec = cached_figure(("02", "bar", mbti_label, ranks.store.version), build_chart)
+        st.plotly_chart(spec, use_container_width=True)
+
+
+recommend_view()
+
+# -------------------------------
+# 나라끼리 비교: 16유형 분포 전체가 닮은 나라 (fragment)
+# -------------------------------
+@st.fragment
+def similar_view():
+    st.markdown("---")
+    st.markdown("### 🧭 MBTI 분포가 우리나라와 닮은 나라는?")
+    index = load_country_index(year=year)
+    query = st.text_input("🔎 기준 나라 검색", placeholder="예: korea, japan, 미국")
+    countries = index.choices(query)
+    if not countries:
+        st.info(f"'{query}' 에 맞는 나라가 없어요.")
+        return
+    default_country = index.default()
+    base_country = st.selectbox(
+        "기준 나라", countries, index=countries.index(default_country) if default_country in countries else 0
     )
-    st.plotly_chart(chart, use_container_width=True)
+    metric = st.radio("거리 척도", METRICS, format_func=METRIC_LABELS.get, horizontal=True)
+
+    similar = load_similarity(metric, year=year).neighbors(base_country, k=7)
+    for i, row in similar.iterrows():
+        e1, e2 = pick_emojis(row["Country"])
+        st.markdown(f"{i + 1}. **{row['Country']}** — 거리 {row['distance']:.4f}  {e1}{e2}")
+
+
+similar_view()
 
 # -------------------------------
 # 보너스: 설명 & 팁
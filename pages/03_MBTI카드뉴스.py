@@ -1,6 +1,16 @@
 import streamlit as st
-import pandas as pd
-import hashlib
+
+from mbti.cards import group_cards
+from mbti.countries import load_country_index
+from mbti.data import MBTI_TYPES
+from mbti import metrics
+from mbti.figures import cached_figure
+from mbti.groups import GROUPS, derive_groups, load_group_table
+from mbti.page import rank_intervals, setup
+from mbti.paging import (
+    PAGE_SIZES, format_bytes, highlight, n_pages, overview_chart, page_chart, page_frame, page_of, page_rows, payload,
+)
+from mbti.ranking import load_rank_index
 
 # ─────────────────────────────────────────────────────────────────
 # 기본 설정
@@ -9,146 +19,134 @@ st.set_page_config(page_title="MBTI 기질별 TOP10 카드뉴스", page_icon="
 st.title("🗺️ MBTI 기질별 TOP 10 — 카드 뉴스 스타일")
 st.caption("NF / NT / SJ / SP / ST 별로 비율이 높은 나라 TOP10을 카드로 예쁘게 보여줘요. ✈️🍜🏰")
 
-FILE_PATH = "countriesMBTI_16types.csv"
-
 # ─────────────────────────────────────────────────────────────────
-# 데이터 로드 & 전처리
+# 데이터 로드 (공용 저장소, 프로세스당 한 번)
 # ─────────────────────────────────────────────────────────────────
-@st.cache_data
-def load_data(path: str):
-    df = pd.read_csv(path, encoding="utf-8-sig")
-    df.columns = df.columns.str.strip()
-    if "Country" not in df.columns:
-        raise ValueError("CSV에 'Country' 컬럼이 없습니다.")
-
-    mbti_cols = [c for c in df.columns if c != "Country"]
-    # 숫자형으로 강제 변환
-    df[mbti_cols] = df[mbti_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
-    return df, mbti_cols
+# 공통 준비 (캐시 워밍업 + 연도 선택)
+year = setup()
 
 try:
-    df, mbti_cols = load_data(FILE_PATH)
+    # 16유형 + 기질 그룹 합계의 정렬 순서를 미리 만들어 둔 인덱스
+    ranks = load_rank_index(year=year)
+    intervals = rank_intervals(year)
 except Exception as e:
     st.error(f"데이터 로드 에러: {e}")
     st.stop()
 
 # ─────────────────────────────────────────────────────────────────
-# 기질 그룹 정의
-# SJ(ISTJ, ISFJ, ESTJ, ESFJ), SP(ISTP, ISFP, ESTP, ESFP),
-# NF(INFJ, INFP, ENFJ, ENFP), NT(INTJ, INTP, ENTJ, ENTP),
-# ST(ISTJ, ESTJ, ISTP, ESTP)  ← SJ와 SP에 걸쳐있는 ST 네 가지 합
-# ─────────────────────────────────────────────────────────────────
-GROUPS = {
-    "NF": ["INFJ", "INFP", "ENFJ", "ENFP"],
-    "NT": ["INTJ", "INTP", "ENTJ", "ENTP"],
-    "SJ": ["ISTJ", "ISFJ", "ESTJ", "ESFJ"],
-    "SP": ["ISTP", "ISFP", "ESTP", "ESFP"],
-    "ST": ["ISTJ", "ESTJ", "ISTP", "ESTP"],
-}
-
-# 각 그룹 합계를 컬럼으로 추가 (비율 합)
-for g, cols in GROUPS.items():
-    missing = [c for c in cols if c not in df.columns]
-    if missing:
-        st.error(f"{g} 그룹에 필요한 컬럼이 없습니다: {missing}")
-        st.stop()
-    df[g] = df[cols].sum(axis=1)
-
-# ─────────────────────────────────────────────────────────────────
-# 유틸: 이모지/색상 선택
-# ─────────────────────────────────────────────────────────────────
-emoji_pool = [
-    "🏖️","🏙️","🏔️","🌋","🏜️","⛩️","🏰","🎎","🌉","🕌","🛕","🗼","🗽",
-    "🌊","🌴","☕️","🍜","🍣","🥐","🌮","🍫","🍷","🍺","🍵","🍧","🍱","🥟"
-]
-def pick_emojis(key: str, k: int = 2):
-    h = int(hashlib.md5(key.encode("utf-8")).hexdigest(), 16)
-    e1 = emoji_pool[h % len(emoji_pool)]
-    e2 = emoji_pool[(h // 7) % len(emoji_pool)]
-    return [e1, e2] if e1 != e2 else [e1, "✨"]
-
-# 라이트한 파스텔 백그라운드들
-card_bg_colors = [
-    "#FDF2F8", "#ECFEFF", "#F0F9FF", "#F0FDF4", "#FFF7ED",
-    "#F5F5F5", "#FDF4FF", "#FEF2F2", "#FAFAF9", "#EFF6FF"
-]
-
+# 카드 렌더러 (카드 HTML·이모지·메달은 데이터 버전마다 한 번만 만들어 공유)
 # ─────────────────────────────────────────────────────────────────
-# 카드 렌더러
-# ─────────────────────────────────────────────────────────────────
-def render_top10_cards(group_key: str):
-    """선택한 기질 그룹의 TOP10 나라를 카드 스타일로 뿌려줌"""
-    if group_key not in GROUPS:
+def render_top10_cards(group_key: str, table=None):
+    """선택한 기질 그룹의 TOP10 나라를 카드 스타일로 뿌려줌 (table: 사용자 그룹 합계 표)"""
+    if table is None and group_key not in GROUPS:
         st.warning("알 수 없는 그룹입니다.")
         return
 
-    # 정렬 및 상위 10개
-    top10 = (
-        df[["Country", group_key]]
-        .sort_values(group_key, ascending=False)
-        .head(10)
-        .reset_index(drop=True)
-        .rename(columns={"Country": "국가", group_key: "ratio"})
-    )
-    top10["percent"] = (top10["ratio"] * 100).round(2)
+    # 기본 그룹은 랭킹 인덱스, 사용자 그룹은 합계 표에서
+    source = ranks if table is None else table
+    members = GROUPS[group_key] if table is None else table.groups[group_key]
+    cards, top10 = group_cards(source, group_key, 10)
 
     st.markdown(f"#### 🧭 {group_key}형이 많은 나라 TOP 10")
-    st.caption("※ 비율은 해당 국가 인구 대비 해당 기질 그룹 합계(16유형 중 해당 그룹 4유형의 합)입니다.")
+    st.caption(f"※ 비율은 해당 국가 인구 대비 해당 기질 그룹 합계(16유형 중 해당 그룹 {len(members)}유형의 합)입니다.")
 
     # 2열 x 5행 카드 배치
-    rows = [top10.iloc[i:i+2] for i in range(0, len(top10), 2)]
-    for r_i, r_df in enumerate(rows):
-        cols = st.columns(2, gap="large")
-        for c_idx, (_, row) in enumerate(r_df.iterrows()):
-            # 카드 스타일
-            bg = card_bg_colors[(r_i*2 + c_idx) % len(card_bg_colors)]
-            medal = ["🥇","🥈","🥉","4️⃣","5️⃣","6️⃣","7️⃣","8️⃣","9️⃣","🔟"][r_i*2 + c_idx]
-            e1, e2 = pick_emojis(row["국가"])
-
-            with cols[c_idx]:
-                st.markdown(
-                    f"""
-                    <div style="
-                        background:{bg};
-                        border-radius:24px;
-                        padding:18px 20px;
-                        box-shadow: 0 6px 18px rgba(0,0,0,0.05);
-                        border:1px solid rgba(0,0,0,0.05);
-                    ">
-                        <div style="font-size:28px; line-height:1.2; margin-bottom:6px;">
-                            {medal} <b>{row['국가']}</b> {e1}{e2}
-                        </div>
-                        <div style="font-size:16px; color:#555; margin-bottom:6px;">
-                            {group_key}형 비율
-                        </div>
-                        <div style="font-size:22px;"><b>{row['percent']}%</b></div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+    with metrics.timer("cards_render"):
+        for i in range(0, len(cards), 2):
+            cols = st.columns(2, gap="large")
+            for c_idx, html in enumerate(cards[i:i+2]):
+                with cols[c_idx]:
+                    st.markdown(html, unsafe_allow_html=True)
 
     with st.expander("🔎 표로 보기"):
-        st.dataframe(
-            top10[["국가", "percent"]].rename(columns={"percent": "비율(%)"}),
-            use_container_width=True,
-            hide_index=True
-        )
+        # 기본 그룹은 부트스트랩 순위 범위·TOP10 확률도 함께 (사용자 그룹은 비율만)
+        if table is None and intervals is not None:
+            top10 = top10.assign(**intervals.columns(group_key, ranks.top(group_key, 10), 10))
+        st.dataframe(top10, use_container_width=True, hide_index=True)
+        if table is None and intervals is not None:
+            st.caption(f"🎲 {intervals.describe()}")
+
+
+def render_custom_group():
+    # 글자 조합(E, NF, INT …) 그룹을 고르거나 유형을 직접 골라 합계를 냄
+    derived = derive_groups()
+    preset = st.selectbox("글자 조합으로 고르기", ["직접 고르기"] + list(derived))
+    members = st.multiselect("포함할 유형", MBTI_TYPES, default=derived.get(preset, GROUPS["NF"]))
+    if not members:
+        st.info("유형을 하나 이상 골라주세요! 🙂")
+    else:
+        name = preset if sorted(derived.get(preset, [])) == sorted(members) else "나만의"
+        render_top10_cards(name, load_group_table({name: members}, year=year))
+
+
+def render_full_ranking(group_key: str):
+    """기본 그룹의 전체 순위: 보고 있는 페이지만 서버에서 잘라 보내고, 전체는 개요 그래프로"""
+    c1, c2, c3 = st.columns([1, 1, 2])
+    size = c1.selectbox("페이지당 나라 수", PAGE_SIZES, index=1, key=f"size03-{group_key}")
+    find = c3.text_input("🔎 나라 위치 찾기", placeholder="예: Korea, 일본, brazil", key=f"find03-{group_key}")
+    row = load_country_index(year=year).resolve(find) if find else None
+    if find and row is None:
+        c3.caption("그런 나라를 찾지 못했어요. 🙂")
+    start_page = page_of(ranks, group_key, row, size) if row is not None else 1
+    page = c2.number_input(
+        f"페이지 (전체 {n_pages(ranks, size)})", min_value=1, max_value=n_pages(ranks, size),
+        value=start_page, key=f"page03-{group_key}-{size}-{row}",
+    )
+
+    frame = page_frame(ranks, group_key, page, size, value_name="ratio")
+    if intervals is not None:
+        rows, _ = page_rows(ranks, group_key, page, size)
+        frame = frame.assign(**intervals.columns(group_key, rows, 10))
+    first, last = int(frame["순위"].iloc[0]), int(frame["순위"].iloc[-1])
+
+    # 개요는 그룹마다 한 번 만든 스펙에 지금 페이지 음영만 덧씌움
+    version = ranks.store.version
+    overview = highlight(
+        cached_figure(("03", "overview", group_key, version), lambda: overview_chart(ranks, group_key)), first, last
+    )
+    chart = cached_figure(("03", "page", group_key, page, size, version), lambda: page_chart(frame, group_key, "ratio"))
+    st.plotly_chart(overview, use_container_width=True)
+    st.plotly_chart(chart, use_container_width=True)
+
+    table = frame.assign(ratio=(frame["ratio"] * 100).round(2)).rename(columns={"Country": "국가", "ratio": "비율(%)"})
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    sent = payload(table, overview, chart)
+    st.caption(
+        f"📦 이번 화면 전송량: 표 {format_bytes(sent['table'])} + 그래프 {format_bytes(sent['chart'])}"
+        f" = {format_bytes(sent['total'])} (전체 {len(ranks.countries)}개 나라 중 {len(frame)}행만 전송)"
+    )
 
 # ─────────────────────────────────────────────────────────────────
-# UI: 탭으로 그룹별 카드 보기
+# UI: 그룹별 카드 보기
+# 탭(st.tabs)은 다섯 그룹을 모두 그려야 해서, 기본은 고른 그룹만 그리는 선택 버튼.
 # ─────────────────────────────────────────────────────────────────
-tabs = st.tabs(["🌸 NF", "🧠 NT", "🧾 SJ", "🎒 SP", "🧭 ST"])
-
-with tabs[0]:
-    render_top10_cards("NF")
-with tabs[1]:
-    render_top10_cards("NT")
-with tabs[2]:
-    render_top10_cards("SJ")
-with tabs[3]:
-    render_top10_cards("SP")
-with tabs[4]:
-    render_top10_cards("ST")
+TAB_LABELS = {"NF": "🌸 NF", "NT": "🧠 NT", "SJ": "🧾 SJ", "SP": "🎒 SP", "ST": "🧭 ST", "custom": "✏️ 나만의 그룹"}
+
+
+@st.fragment
+def group_view():
+    group_key = st.radio(
+        "기질 그룹", list(TAB_LABELS), format_func=TAB_LABELS.get, horizontal=True, label_visibility="collapsed"
+    )
+    if group_key == "custom":
+        render_custom_group()
+    elif st.radio("보기", ["TOP 10 카드", "전체 순위"], horizontal=True, label_visibility="collapsed") == "전체 순위":
+        render_full_ranking(group_key)
+    else:
+        render_top10_cards(group_key)
+
+
+if st.toggle("모든 그룹을 탭으로 한 번에 보기", value=False):
+    tabs = st.tabs(list(TAB_LABELS.values()))
+    for tab, group_key in zip(tabs, TAB_LABELS):
+        with tab:
+            if group_key == "custom":
+                render_custom_group()
+            else:
+                render_top10_cards(group_key)
+else:
+    group_view()
 
 st.markdown("---")
 st.caption(
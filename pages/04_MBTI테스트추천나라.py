@@ -1,8 +1,14 @@
 import streamlit as st
-import pandas as pd
 import plotly.express as px
 import hashlib
 
+from mbti.data import load_store
+from mbti.figures import cached_figure
+from mbti.page import rank_intervals, setup
+from mbti.query import quiz_weights, rank_countries
+from mbti.quiz import QUESTIONS, to_mbti
+from mbti.ranking import load_rank_index
+
 # -------------------------------
 # 페이지 설정
 # -------------------------------
@@ -10,72 +16,20 @@ st.set_page_config(page_title="초간단 MBTI ✈️ 나라 추천", page_icon="
 st.title("🌍 초간단 MBTI 테스트 → 당신과 비슷한 사람들이 많은 나라 추천")
 st.caption("아주 간단한 8문항 테스트로 MBTI를 추정하고, 그 유형의 비율이 높은 상위 5개국을 여행지처럼 소개해드려요! 🎈")
 
-FILE_PATH = "countriesMBTI_16types.csv"
-
 # -------------------------------
-# 데이터 로드 & 전처리
+# 데이터 로드 (공용 저장소, 프로세스당 한 번)
 # -------------------------------
-@st.cache_data
-def load_mbti_data(path: str):
-    df = pd.read_csv(path, encoding="utf-8-sig")
-    df.columns = df.columns.str.strip()
-    if "Country" not in df.columns:
-        raise ValueError("CSV에 'Country' 컬럼이 없습니다.")
-
-    mbti_cols = [c for c in df.columns if c != "Country"]
-    # 숫자형 강제 변환 (문자·%·콤마 등 대응)
-    df[mbti_cols] = df[mbti_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
-    return df, mbti_cols
+# 공통 준비 (캐시 워밍업 + 연도 선택)
+year = setup()
 
 try:
-    df, mbti_cols = load_mbti_data(FILE_PATH)
+    mbti_cols = list(load_store(year=year).types)
+    ranks = load_rank_index(year=year)
+    intervals = rank_intervals(year)
 except Exception as e:
     st.error(f"데이터 로드 오류: {e}")
     st.stop()
 
-# -------------------------------
-# 초간단 MBTI 문항 (8문항: 각 축 2문항씩)
-# 각 선택지는 해당 축의 한쪽에 +1
-# -------------------------------
-QUESTIONS = [
-    # E vs I
-    {
-        "q": "주말엔 무엇이 더 에너지 충전이 돼요?",
-        "opts": [("사람들과 어울리며 신나게! 🎉", "E"), ("혼자 조용히 쉬며 힐링 ☕️", "I")]
-    },
-    {
-        "q": "새로운 모임에서 나는…",
-        "opts": [("먼저 말 걸고 분위기를 띄워요 🗣️", "E"), ("관찰하며 천천히 적응해요 👀", "I")]
-    },
-    # S vs N
-    {
-        "q": "정보를 이해할 때 나는…",
-        "opts": [("사실·경험 위주로! 구체적인 게 좋아요 📋", "S"), ("아이디어·가능성 상상! 큰 그림이 좋아요 🌈", "N")]
-    },
-    {
-        "q": "설명서를 볼 때 내 스타일은?",
-        "opts": [("순서대로 차근차근 따라하기 ✅", "S"), ("대략 파악하고 감으로 시도 🪄", "N")]
-    },
-    # T vs F
-    {
-        "q": "갈등 상황에서 나는…",
-        "opts": [("원인·해결책을 논리적으로 정리 🧠", "T"), ("상대 감정을 먼저 헤아리기 💗", "F")]
-    },
-    {
-        "q": "칭찬과 피드백 중 더 중요한 건?",
-        "opts": [("정확한 피드백! 개선이 먼저 🔧", "T"), ("응원과 공감! 분위기가 먼저 🌟", "F")]
-    },
-    # J vs P
-    {
-        "q": "여행 계획은 어떻게?",
-        "opts": [("일정표를 촘촘히! 계획이 편해요 🗓️", "J"), ("현지에서 즉흥적으로! 유연함이 좋아요 🎒", "P")]
-    },
-    {
-        "q": "〆마감이 다가오면?",
-        "opts": [("미리 끝내고 여유롭게 ✅", "J"), ("데드라인의 힘! 막판 집중 🚀", "P")]
-    },
-]
-
 # -------------------------------
 # 응답 수집
 # -------------------------------
@@ -90,14 +44,6 @@ with st.form("mini_mbti"):
 
     submitted = st.form_submit_button("결과 보기 🔎")
 
-def to_mbti(sc):
-    # 각 축 비교해 MBTI 문자열 만들기
-    ei = "E" if sc["E"] >= sc["I"] else "I"
-    sn = "S" if sc["S"] >= sc["N"] else "N"
-    tf = "T" if sc["T"] >= sc["F"] else "F"
-    jp = "J" if sc["J"] >= sc["P"] else "P"
-    return ei + sn + tf + jp
-
 # 결과 계산
 if submitted:
     if sum(scores.values()) == 0:
@@ -112,14 +58,13 @@ if submitted:
         st.error(f"데이터에 {mbti} 컬럼이 없습니다. CSV 헤더를 확인하세요.")
         st.stop()
 
-    top5 = (
-        df[["Country", mbti]]
-        .sort_values(by=mbti, ascending=False)
-        .head(5)
-        .rename(columns={"Country":"국가", mbti:"ratio"})
-        .reset_index(drop=True)
-    )
+    top5 = ranks.top_frame(mbti, 5, value_name="ratio").rename(columns={"Country":"국가"})
     top5["percent"] = (top5["ratio"] * 100).round(2)
+    spread_cols = []
+    if intervals is not None:
+        extra = intervals.columns(mbti, ranks.top(mbti, 5), 5)
+        top5 = top5.assign(**extra)
+        spread_cols = list(extra)
 
     st.markdown("---")
     st.markdown(f"### ✈️ {mbti} 와(과) 비슷한 사람들이 많은 나라 TOP 5")
@@ -139,6 +84,12 @@ if submitted:
 
     for i, (_, row) in enumerate(top5.iterrows()):
         e1, e2 = pick_emojis(row["국가"])
+        spread = ""
+        if spread_cols:
+            spread = (
+                f'<div style="color:#888; font-size:12px; margin-top:4px;">'
+                f'순위 {row["순위 범위"]} · TOP5 확률 {row["TOP5 확률(%)"]}%</div>'
+            )
         with cols[i]:
             st.markdown(
                 f"""
@@ -153,6 +104,7 @@ if submitted:
                     <div style="font-size:24px; margin-bottom:6px;">{medals[i]} <b>{row['국가']}</b> {e1}{e2}</div>
                     <div style="color:#666; font-size:14px; margin-bottom:4px;">{mbti} 비율</div>
                     <div style="font-size:20px;"><b>{row['percent']}%</b></div>
+                    {spread}
                 </div>
                 """,
                 unsafe_allow_html=True
@@ -160,25 +112,42 @@ if submitted:
 
     # 막대 그래프
     st.markdown("### 📊 상위 5개국 막대그래프")
-    bar = px.bar(
-        top5.sort_values("percent"),
-        x="percent",
-        y="국가",
-        text="percent",
-        orientation="h",
-        color="국가",
-        color_discrete_sequence=px.colors.qualitative.Set3 + px.colors.qualitative.Pastel1,
-        labels={"percent":"비율(%)","국가":"국가"},
-        title=f"{mbti} 비율이 높은 나라 TOP 5"
-    )
-    bar.update_traces(texttemplate="%{text}%", textposition="outside")
-    bar.update_layout(showlegend=False, margin=dict(l=80,r=40,t=70,b=40), height=420)
-    st.plotly_chart(bar, use_container_width=True)
+    def build_chart():
+        bar = px.bar(
+            top5.sort_values("percent"),
+            x="percent",
+            y="국가",
+            text="percent",
+            orientation="h",
+            color="국가",
+            color_discrete_sequence=px.colors.qualitative.Set3 + px.colors.qualitative.Pastel1,
+            labels={"percent":"비율(%)","국가":"국가"},
+            title=f"{mbti} 비율이 높은 나라 TOP 5"
+        )
+        bar.update_traces(texttemplate="%{text}%", textposition="outside")
+        bar.update_layout(showlegend=False, margin=dict(l=80,r=40,t=70,b=40), height=420)
+        return bar
+
+    spec = cached_figure(("04", "bar", mbti, ranks.store.version), build_chart)
+    st.plotly_chart(spec, use_container_width=True)
 
     # 원본 표 보기
     with st.expander("🔎 원본 데이터 보기"):
         st.dataframe(
-            top5[["국가","percent"]].rename(columns={"percent":"비율(%)"}),
+            top5[["국가","percent"] + spread_cols].rename(columns={"percent":"비율(%)"}),
+            use_container_width=True,
+            hide_index=True
+        )
+        if spread_cols:
+            st.caption(f"🎲 {intervals.describe()}")
+
+    # 응답 강도 반영: 축마다 답이 갈린 정도만큼 16유형을 섞은 가중치로 순위
+    with st.expander("🎛️ 응답 강도까지 반영한 추천 보기"):
+        soft = rank_countries(quiz_weights(scores, mbti_cols), 5, value_name="score", year=year)
+        soft["percent"] = (soft["score"] * 100).round(2)
+        st.caption("한 축의 두 문항 답이 갈리면 양쪽 유형을 반반씩 섞어서 계산해요.")
+        st.dataframe(
+            soft[["Country","percent"]].rename(columns={"Country":"국가","percent":"가중 비율(%)"}),
             use_container_width=True,
             hide_index=True
         )
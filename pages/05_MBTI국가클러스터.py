@@ -0,0 +1,87 @@
+import streamlit as st
+import plotly.express as px
+
+from mbti.clusters import K_RANGE, METHOD_LABELS, METHODS, load_clusters
+from mbti.data import data_version
+from mbti.figures import cached_figure
+from mbti.page import setup
+
+# -------------------------------
+# 페이지 설정
+# -------------------------------
+st.set_page_config(page_title="MBTI 분포로 본 나라 클러스터", page_icon="🧩", layout="wide")
+st.title("🧩 MBTI 분포가 닮은 나라끼리 묶어보기")
+st.caption("16유형 비율 전체를 기준으로 나라들을 k개 묶음으로 나눠요. 묶음마다 대표 분포와 대표 나라를 보여드려요. 🗺️")
+
+# 공통 준비 (캐시 워밍업 + 연도 선택)
+year = setup()
+
+# -------------------------------
+# 군집 결과 (데이터 버전마다 백그라운드에서 한 번 계산)
+# -------------------------------
+try:
+    clusters = load_clusters(year=year, timeout=5)
+except Exception as e:
+    st.error(f"데이터 로드 오류: {e}")
+    st.stop()
+
+if clusters is None:
+    st.info("클러스터를 계산하는 중이에요… 잠시 후 새로고침 해주세요. ⏳")
+    if st.button("🔄 새로고침"):
+        st.rerun()
+    st.stop()
+
+version = data_version(year=year)
+
+
+@st.fragment
+def cluster_view():
+    c1, c2 = st.columns([1, 2])
+    method = c1.radio("방법", METHODS, format_func=METHOD_LABELS.get)
+    best = clusters.best_k(method)
+    k = c2.select_slider(
+        "묶음 개수 k", options=list(clusters.ks), value=best, help=f"실루엣 점수 기준 추천 k = {best}"
+    )
+
+    scores = clusters.score_frame()
+    with st.expander("📈 k 별 점수 (실루엣: 높을수록 잘 나뉨)"):
+        st.line_chart(scores.pivot(index="k", columns="method", values="silhouette"))
+        st.dataframe(scores.round(4), use_container_width=True, hide_index=True)
+
+    # 군집 중심 16유형 분포 히트맵
+    centroids = clusters.centroid_frame(method, k)
+
+    def build_chart():
+        fig = px.imshow(
+            (centroids * 100).round(2),
+            labels={"x": "유형", "y": "묶음", "color": "비율(%)"},
+            color_continuous_scale="Purples",
+            aspect="auto",
+            title=f"묶음별 대표 MBTI 분포 ({METHOD_LABELS[method]}, k={k})",
+        )
+        fig.update_yaxes(tickmode="array", tickvals=list(range(k)), ticktext=[f"#{c + 1}" for c in range(k)])
+        return fig
+
+    spec = cached_figure(("05", "heatmap", method, k, version), build_chart)
+    st.plotly_chart(spec, use_container_width=True)
+
+    members = clusters.members(method, k)
+    nearest = clusters.nearest(method, k, m=5)
+    for c in range(k):
+        top_types = centroids.iloc[c].sort_values(ascending=False).head(3)
+        badge = " · ".join(f"{t} {v * 100:.1f}%" for t, v in top_types.items())
+        with st.expander(f"#{c + 1} — {len(members[c])}개 나라  |  {badge}", expanded=c == 0):
+            left, right = st.columns([1, 2])
+            left.markdown("**중심에 가까운 나라**")
+            left.dataframe(
+                nearest[c].rename(columns={"Country": "국가", "distance": "거리"}).round(4),
+                use_container_width=True, hide_index=True,
+            )
+            right.markdown("**포함된 나라**")
+            right.write(", ".join(sorted(members[c])))
+
+
+cluster_view()
+
+st.markdown("---")
+st.caption(f"k 범위: {K_RANGE[0]}–{K_RANGE[-1]} · 클러스터는 데이터가 바뀌면 백그라운드에서 다시 계산돼요.")
@@ -0,0 +1,86 @@
+import os
+
+import streamlit as st
+import pandas as pd
+
+from mbti import metrics
+from mbti.data import load_store
+from mbti.page import setup
+from mbti.validate import format_report
+from mbti.warmup import status
+
+# 공통 준비 (캐시 워밍업, 연도 선택 없음)
+setup(year_select=False)
+
+# -------------------------------
+# 관리자: 실시간 성능 지표
+# -------------------------------
+st.set_page_config(page_title="관리자 — 성능 지표", page_icon="🛠️", layout="wide")
+
+
+def admin_enabled() -> bool:
+    """`MBTI_ADMIN=1` 환경 변수나 secrets 의 `mbti_admin = true` 가 있을 때만 관리자 화면을 엶"""
+    if os.environ.get("MBTI_ADMIN", "") not in ("", "0"):
+        return True
+    try:
+        return bool(st.secrets.get("mbti_admin", False))
+    except Exception:  # secrets.toml 이 없으면 잠금
+        return False
+
+
+# 계측 켜기·끄기와 지표 초기화는 프로세스 전체에 영향을 주므로 아무나 보지 못하게
+if not admin_enabled():
+    st.error("관리자 페이지가 잠겨 있어요. 서버를 `MBTI_ADMIN=1` 로 띄우거나 secrets 에 `mbti_admin = true` 를 넣어주세요.")
+    st.stop()
+
+st.title("🛠️ 관리자 — 성능 지표")
+st.caption("단계별 소요 시간, 캐시 적중률, 데이터 메모리를 보여줍니다. (이 서버 프로세스 기준)")
+
+if not metrics.enabled():
+    st.info("계측이 꺼져 있어요. `MBTI_METRICS=1` 로 서버를 띄우거나 아래 스위치로 켜세요.")
+if st.toggle("계측 켜기", value=metrics.enabled()) != metrics.enabled():
+    metrics.set_enabled(not metrics.enabled())
+    st.rerun()
+
+snap = metrics.snapshot()
+
+st.markdown("### ⏱️ 단계별 시간 (ms)")
+if snap["phases"]:
+    phases = pd.DataFrame(snap["phases"]).T.drop(columns=["buckets"])
+    st.dataframe(phases.sort_values("sum_ms", ascending=False), use_container_width=True)
+    phase = st.selectbox("히스토그램 보기", list(snap["phases"]))
+    buckets = pd.Series(snap["phases"][phase]["buckets"], name="count")
+    st.bar_chart(buckets)
+else:
+    st.write("아직 기록된 단계가 없어요.")
+
+st.markdown("### 🗃️ 캐시")
+caches = pd.DataFrame(snap["caches"]).T
+if not caches.empty:
+    total = caches["hits"] + caches["misses"]
+    caches["hit_rate(%)"] = (caches["hits"] / total.where(total > 0) * 100).round(1)
+st.dataframe(caches, use_container_width=True)
+
+st.markdown("### 💾 데이터 메모리 (bytes)")
+st.dataframe(pd.Series(snap["gauges"], name="value"), use_container_width=True)
+
+st.markdown("### ✅ 데이터 검증 (적재 시 한 번)")
+report = load_store().report
+if report:
+    st.code(format_report(report), language=None)
+else:
+    st.write("검증 보고서가 없어요. (이전 형식의 스냅샷이면 `python -m mbti.snapshot` 으로 다시 만드세요)")
+
+st.markdown("### 🔥 워밍업")
+warm = status()
+st.write("준비 완료 ✅" if warm["ready"] else "진행 중… ⏳")
+if warm["tasks"]:
+    st.dataframe(pd.DataFrame(warm["tasks"]).T, use_container_width=True)
+
+c1, c2, c3 = st.columns(3)
+if c1.button("🔄 새로고침"):
+    st.rerun()
+if c2.button("🧹 시간 기록 초기화"):
+    metrics.reset()
+    st.rerun()
+c3.download_button("⬇️ Prometheus 텍스트", metrics.to_prometheus(snap), file_name="mbti_metrics.prom")